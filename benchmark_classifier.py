@@ -0,0 +1,105 @@
+"""
+CLASSIFIER BENCHMARK
+Per-frame prediction latency for each model type
+Compares the old predict + predict_proba path with the single-pass predict
+"""
+
+import os
+import time
+import argparse
+import tempfile
+import numpy as np
+from modules.gesture_classifier import GestureClassifier
+from modules.compact_model import CompactGestureModel
+
+
+def make_synthetic_dataset(n_per_class=200, n_features=9, random_state=42):
+    """
+    Build a separable synthetic dataset with one cluster per gesture
+
+    Returns:
+        X: Feature matrix (n_samples, n_features)
+        y: Label vector (n_samples,)
+    """
+    rng = np.random.default_rng(random_state)
+    X = []
+    y = []
+    for gesture_id in GestureClassifier.GESTURES:
+        center = rng.normal(0, 3, n_features)
+        X.append(center + rng.normal(0, 1, (n_per_class, n_features)))
+        y.extend([gesture_id] * n_per_class)
+    return np.vstack(X).astype(np.float32), np.array(y)
+
+
+def predict_two_pass(classifier, features):
+    """Previous prediction path: predict followed by predict_proba"""
+    features_scaled = classifier.scaler.transform(features.reshape(1, -1))
+    prediction = classifier.model.predict(features_scaled)[0]
+    probabilities = classifier.model.predict_proba(features_scaled)[0]
+    return prediction, probabilities[prediction]
+
+
+def time_per_call(func, samples, repeats):
+    """Mean latency (microseconds) of func over samples"""
+    for features in samples[:10]:
+        func(features)
+    start = time.perf_counter()
+    for _ in range(repeats):
+        for features in samples:
+            func(features)
+    elapsed = time.perf_counter() - start
+    return elapsed / (repeats * len(samples)) * 1e6
+
+
+def run_benchmark(n_samples=200, repeats=3):
+    """
+    Benchmark every model type
+
+    Returns:
+        Dict of {model_type: {'two_pass_us': ..., 'single_pass_us': ..., 'compact_us': ...}}
+        (compact_us is None for model types without a compact export)
+    """
+    X, y = make_synthetic_dataset()
+    samples = X[np.random.default_rng(0).choice(len(X), n_samples)]
+    results = {}
+    export_dir = tempfile.mkdtemp()
+
+    for model_type in ['svm', 'random_forest', 'neural_network']:
+        classifier = GestureClassifier(model_type=model_type)
+        classifier.train(X, y)
+
+        two_pass = time_per_call(lambda f: predict_two_pass(classifier, f), samples, repeats)
+        single_pass = time_per_call(classifier.predict, samples, repeats)
+
+        compact = None
+        if model_type != 'svm':
+            model_path = os.path.join(export_dir, f"gesture_model_{model_type}")
+            classifier.save_model(model_path, export_compact=True)
+            compact_model = CompactGestureModel(f"{model_path}_compact.npz")
+            compact = time_per_call(compact_model.predict, samples, repeats)
+
+        results[model_type] = {
+            'two_pass_us': two_pass,
+            'single_pass_us': single_pass,
+            'compact_us': compact,
+        }
+
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Benchmark gesture classifier latency')
+    parser.add_argument('--samples', type=int, default=200, help='Frames per measurement')
+    parser.add_argument('--repeats', type=int, default=3, help='Repetitions per measurement')
+    args = parser.parse_args()
+
+    results = run_benchmark(n_samples=args.samples, repeats=args.repeats)
+
+    print(f"\n{'='*60}")
+    print("⏱️  PER-FRAME PREDICTION LATENCY")
+    print(f"{'='*60}")
+    print(f"{'Model':<16}{'Before (µs)':>14}{'After (µs)':>14}{'Compact (µs)':>14}")
+    for model_type, r in results.items():
+        compact = f"{r['compact_us']:>14.1f}" if r['compact_us'] is not None else f"{'-':>14}"
+        print(f"{model_type:<16}{r['two_pass_us']:>14.1f}{r['single_pass_us']:>14.1f}{compact}")
+    print(f"{'='*60}\n")
@@ -0,0 +1,342 @@
+"""
+PIPELINE BENCHMARK
+Per-stage latency of the gesture pipeline without camera, display or audio
+Writes JSON results that can be compared across commits
+"""
+
+import os
+import sys
+import json
+import time
+import platform
+import argparse
+import subprocess
+import tempfile
+import cv2
+import numpy as np
+from modules.feature_extraction import FeatureExtractor
+from modules.hand_detection import HandRoiTracker
+from modules.gesture_classifier import GestureClassifier
+from modules.compact_model import CompactGestureModel
+from modules.gesture_smoother import GestureSmoother
+from modules.action_dispatcher import ActionDispatcher
+from modules.overlay import OverlayRenderer
+from modules.frame_capture import open_capture
+from benchmark_classifier import make_synthetic_dataset
+
+
+def summarize(samples_ns):
+    """
+    Latency statistics for a list of per-call durations
+
+    Args:
+        samples_ns: Durations in nanoseconds
+
+    Returns:
+        Dict with n, mean_us, p50_us, p95_us, p99_us, max_us
+    """
+    samples = np.asarray(samples_ns, dtype=np.float64) / 1000.0
+    p50, p95, p99 = np.percentile(samples, [50, 95, 99])
+    return {
+        'n': int(len(samples)),
+        'mean_us': float(samples.mean()),
+        'p50_us': float(p50),
+        'p95_us': float(p95),
+        'p99_us': float(p99),
+        'max_us': float(samples.max()),
+    }
+
+
+def measure(func, inputs, repeats=1, warmup=5):
+    """
+    Time func on every input, repeats times
+
+    Args:
+        func: Callable taking one input
+        inputs: Sequence of inputs
+        repeats: Passes over inputs
+        warmup: Untimed calls before measuring
+
+    Returns:
+        summarize() dict
+    """
+    for item in inputs[:warmup]:
+        func(item)
+
+    samples = []
+    clock = time.perf_counter_ns
+    for _ in range(repeats):
+        for item in inputs:
+            start = clock()
+            func(item)
+            samples.append(clock() - start)
+    return summarize(samples)
+
+
+def synthetic_frames(n=30, size=(640, 480), random_state=0):
+    """Random BGR frames (no hand; MediaPipe runs palm detection only)"""
+    rng = np.random.default_rng(random_state)
+    width, height = size
+    return [rng.integers(0, 256, (height, width, 3), dtype=np.uint8) for _ in range(n)]
+
+
+def load_frames(source, limit=300):
+    """Read up to limit frames from a video file or image directory"""
+    cap = open_capture(source)
+    frames = []
+    while len(frames) < limit:
+        ret, frame = cap.read()
+        if not ret:
+            break
+        frames.append(frame)
+    cap.release()
+    if not frames:
+        raise FileNotFoundError(f"No frames read from {source}")
+    return frames
+
+
+def synthetic_landmarks(n=500, random_state=0):
+    """Random hand-shaped landmark arrays (n, 21, 3)"""
+    rng = np.random.default_rng(random_state)
+    base = rng.uniform(0.3, 0.7, (21, 3)).astype(np.float32)
+    return base + rng.normal(0, 0.05, (n, 21, 3)).astype(np.float32)
+
+
+def load_landmarks(session_path):
+    """Landmarks of frames with a hand from a recorded session (.npz)"""
+    from modules.replay import load_landmark_session
+    _, landmarks, num_hands = load_landmark_session(session_path)
+    landmarks = landmarks[num_hands > 0, 0]
+    if len(landmarks) == 0:
+        raise ValueError(f"No hands in session {session_path}")
+    return landmarks
+
+
+def bench_vision(frames, repeats):
+    """Colour conversion and MediaPipe inference"""
+    results = {
+        'color_conversion': measure(lambda f: cv2.cvtColor(f, cv2.COLOR_BGR2RGB), frames, repeats),
+    }
+
+    try:
+        import mediapipe as mp
+    except ImportError:
+        results['mediapipe_inference'] = {'skipped': 'mediapipe not installed'}
+        return results
+
+    hands = mp.solutions.hands.Hands(
+        static_image_mode=False,
+        max_num_hands=1,
+        min_detection_confidence=0.5,
+        min_tracking_confidence=0.5
+    )
+    rgb_frames = [cv2.cvtColor(f, cv2.COLOR_BGR2RGB) for f in frames]
+    results['mediapipe_inference'] = measure(hands.process, rgb_frames, repeats)
+    hands.close()
+
+    # Conversion + inference on a crop around the last hand; compare with
+    # color_conversion + mediapipe_inference (only a source with hands engages the crop)
+    hands = mp.solutions.hands.Hands(
+        static_image_mode=False,
+        max_num_hands=1,
+        min_detection_confidence=0.5,
+        min_tracking_confidence=0.5
+    )
+    roi_tracker = HandRoiTracker()
+    results['mediapipe_roi_inference'] = measure(
+        lambda f: roi_tracker.process(hands, f, cv2.COLOR_BGR2RGB), frames, repeats
+    )
+    results['mediapipe_roi_inference'].update(roi_tracker.get_stats())
+    hands.close()
+    return results
+
+
+def bench_features(landmarks, repeats):
+    """Per-frame feature extraction"""
+    extractor = FeatureExtractor()
+    return {
+        'feature_extraction': measure(extractor.extract_features, list(landmarks), repeats),
+    }
+
+
+def bench_classifiers(features, repeats):
+    """GestureClassifier.predict per model type, plus the compact export"""
+    X, y = make_synthetic_dataset()
+    export_dir = tempfile.mkdtemp()
+    samples = list(features)
+    results = {}
+
+    for model_type in ['svm', 'random_forest', 'neural_network']:
+        classifier = GestureClassifier(model_type=model_type)
+        classifier.train(X, y)
+        results[f'predict_{model_type}'] = measure(classifier.predict, samples, repeats)
+
+        if model_type != 'svm':
+            model_path = os.path.join(export_dir, f"gesture_model_{model_type}")
+            classifier.save_model(model_path, export_compact=True)
+            compact_model = CompactGestureModel(f"{model_path}_compact.npz")
+            results[f'predict_{model_type}_compact'] = measure(compact_model.predict, samples, repeats)
+
+    return results
+
+
+def bench_smoothing(n_frames, repeats):
+    """GestureSmoother.update on a noisy gesture stream"""
+    rng = np.random.default_rng(0)
+    stream = list(zip(rng.integers(0, 5, n_frames).tolist(), rng.uniform(0.5, 1.0, n_frames).tolist()))
+    smoother = GestureSmoother(history_size=5)
+    return {
+        'smoothing': measure(lambda item: smoother.update(*item), stream, repeats),
+    }
+
+
+def bench_rendering(frames, repeats):
+    """Info panel overlay: full-frame copy and blend vs the in-place panel sprite"""
+    lines = [
+        ("Gesture: thumbs_up", (10, 35), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2),
+        ("Next track", (10, 115), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (255, 165, 0), 2),
+    ]
+
+    def legacy(frame):
+        overlay = frame.copy()
+        cv2.rectangle(overlay, (0, 0), (400, 150), (0, 0, 0), -1)
+        cv2.addWeighted(overlay, 0.3, frame, 0.7, 0, frame)
+        for line in lines:
+            cv2.putText(frame, *line)
+
+    renderer = OverlayRenderer()
+    frames = [f.copy() for f in frames]
+    return {
+        'overlay_copy_blend': measure(legacy, frames, repeats),
+        'overlay_panel_sprite': measure(lambda f: renderer.panel(f, 'info', (0, 0), (400, 150), 0.3, lines=lines),
+                                        frames, repeats),
+    }
+
+
+def bench_dispatch(n_actions=200):
+    """ActionDispatcher: caller-side dispatch cost and enqueue-to-execute latency"""
+    executed = []
+
+    class TimestampBackend:
+        def execute_action(self, action, steps=1):
+            executed.append(time.perf_counter_ns())
+
+    dispatcher = ActionDispatcher(TimestampBackend(), coalesce=False).start()
+    actions = ["play_pause", "next_track", "previous_track"]
+    call_ns = []
+    queue_ns = []
+
+    for i in range(n_actions):
+        start = time.perf_counter_ns()
+        dispatcher.dispatch(actions[i % len(actions)])
+        call_ns.append(time.perf_counter_ns() - start)
+        dispatcher.wait_idle()
+        queue_ns.append(executed[-1] - start)
+
+    dispatcher.stop()
+    return {
+        'dispatch_call': summarize(call_ns),
+        'dispatch_to_execute': summarize(queue_ns),
+    }
+
+
+def git_commit():
+    """Short commit hash of the working tree, or None outside a git checkout"""
+    try:
+        return subprocess.check_output(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            stderr=subprocess.DEVNULL,
+        ).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmark(source=None, session=None, repeats=3, n_frames=30):
+    """
+    Run every stage benchmark
+
+    Args:
+        source: Optional video file or image directory for the vision stages
+        session: Optional recorded landmark session (.npz) for the landmark stages
+        repeats: Passes over the inputs per stage
+        n_frames: Number of synthetic frames when no source is given
+
+    Returns:
+        Dict with 'meta' and per-stage 'stages' statistics (microseconds)
+    """
+    frames = load_frames(source) if source else synthetic_frames(n_frames)
+    landmarks = load_landmarks(session) if session else synthetic_landmarks()
+    features = FeatureExtractor().extract_features_batch(landmarks)
+
+    stages = {}
+    stages.update(bench_vision(frames, repeats))
+    stages.update(bench_rendering(frames, repeats))
+    stages.update(bench_features(landmarks, repeats))
+    stages.update(bench_classifiers(features[:200], repeats))
+    stages.update(bench_smoothing(len(landmarks), repeats))
+    stages.update(bench_dispatch())
+
+    return {
+        'meta': {
+            'commit': git_commit(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': sys.version.split()[0],
+            'numpy': np.__version__,
+            'opencv': cv2.__version__,
+            'platform': platform.platform(),
+            'frame_source': source or f'synthetic {frames[0].shape[1]}x{frames[0].shape[0]}',
+            'landmark_source': session or 'synthetic',
+            'repeats': repeats,
+        },
+        'stages': stages,
+    }
+
+
+def print_results(results, baseline=None):
+    """Print a stage table, with p50 change against a baseline run if given"""
+    stages = results['stages']
+    base_stages = baseline['stages'] if baseline else {}
+
+    print(f"\n{'='*78}")
+    print(f"⏱️  PIPELINE STAGE LATENCY (commit {results['meta']['commit']})")
+    print(f"{'='*78}")
+    header = f"{'Stage':<32}{'p50 (µs)':>11}{'p95 (µs)':>11}{'p99 (µs)':>11}"
+    if baseline:
+        header += f"{'vs base':>11}"
+    print(header)
+
+    for name, stats in stages.items():
+        if 'skipped' in stats:
+            print(f"{name:<32}  skipped: {stats['skipped']}")
+            continue
+        line = f"{name:<32}{stats['p50_us']:>11.1f}{stats['p95_us']:>11.1f}{stats['p99_us']:>11.1f}"
+        base = base_stages.get(name)
+        if baseline and base and 'p50_us' in base and base['p50_us'] > 0:
+            change = (stats['p50_us'] - base['p50_us']) / base['p50_us']
+            line += f"{change:>+11.1%}"
+        print(line)
+    print(f"{'='*78}\n")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Benchmark per-stage pipeline latency')
+    parser.add_argument('--source', default=None, help='Video file or image directory (default: synthetic frames)')
+    parser.add_argument('--session', default=None, help='Recorded landmark session .npz (default: synthetic landmarks)')
+    parser.add_argument('--repeats', type=int, default=3, help='Passes over the inputs per stage')
+    parser.add_argument('--output', default=None, help='Write results to this JSON file')
+    parser.add_argument('--compare', default=None, help='Baseline JSON file to compare against')
+    args = parser.parse_args()
+
+    results = run_benchmark(source=args.source, session=args.session, repeats=args.repeats)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+    print_results(results, baseline)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"✓ Results saved to {args.output}")
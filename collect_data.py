@@ -8,6 +8,7 @@ import os
 import numpy as np
 from modules.hand_detection import HandDetector
 from modules.feature_extraction import FeatureExtractor
+from modules.dataset_store import GestureDatasetStore
 import json
 import time
 import argparse
@@ -28,11 +29,20 @@ class DataCollector:
         self.hand_detector = HandDetector(max_hands=1)
         self.feature_extractor = FeatureExtractor()
         
-        # Create data directories
-        os.makedirs(data_dir, exist_ok=True)
-        for gesture_id, gesture_name in self.GESTURES.items():
-            gesture_dir = os.path.join(data_dir, f"{gesture_id}_{gesture_name}")
-            os.makedirs(gesture_dir, exist_ok=True)
+        # Create data directories and the sample store
+        self.store = GestureDatasetStore(data_dir, self.GESTURES)
+        self.session_id = self.store.new_session()
+    
+    def _save_sample(self, gesture_id, landmarks):
+        """
+        Extract features and append the sample to the dataset store
+        
+        Args:
+            gesture_id: ID of gesture being collected
+            landmarks: 21 (x, y, z) landmark points
+        """
+        features = self.feature_extractor.extract_features(landmarks)
+        self.store.append(gesture_id, features, landmarks, session_id=self.session_id)
     
     def collect_gesture_data(self, gesture_id, samples_per_gesture=50, auto=False, interval=0.5):
         """
@@ -43,7 +53,6 @@ class DataCollector:
             samples_per_gesture: Number of samples to collect
         """
         gesture_name = self.GESTURES[gesture_id]
-        gesture_dir = os.path.join(self.data_dir, f"{gesture_id}_{gesture_name}")
         
         cap = cv2.VideoCapture(0)
         collected = 0
@@ -91,17 +100,8 @@ class DataCollector:
                 break
             # Manual capture (SPACE) when hand detected
             if not auto and key == ord(' ') and len(landmarks_list) > 0:
-                # Extract features from hand
-                landmarks = landmarks_list[0]
-                features = self.feature_extractor.extract_features(landmarks)
-                
-                # Save features and landmarks
-                sample_id = len(os.listdir(gesture_dir))
-                feature_file = os.path.join(gesture_dir, f"features_{sample_id}.npy")
-                landmarks_file = os.path.join(gesture_dir, f"landmarks_{sample_id}.npy")
-                
-                np.save(feature_file, features)
-                np.save(landmarks_file, landmarks)
+                # Extract features and save sample
+                self._save_sample(gesture_id, landmarks_list[0])
                 
                 collected += 1
                 print(f"✓ Captured sample {collected}/{samples_per_gesture}")
@@ -109,15 +109,7 @@ class DataCollector:
             if auto and len(landmarks_list) > 0:
                 now = time.time()
                 if now - last_capture >= interval:
-                    landmarks = landmarks_list[0]
-                    features = self.feature_extractor.extract_features(landmarks)
-
-                    sample_id = len(os.listdir(gesture_dir))
-                    feature_file = os.path.join(gesture_dir, f"features_{sample_id}.npy")
-                    landmarks_file = os.path.join(gesture_dir, f"landmarks_{sample_id}.npy")
-
-                    np.save(feature_file, features)
-                    np.save(landmarks_file, landmarks)
+                    self._save_sample(gesture_id, landmarks_list[0])
 
                     collected += 1
                     last_capture = now
@@ -149,32 +141,29 @@ class DataCollector:
         print(f"✓ Data collection complete!")
         print(f"{'='*60}\n")
     
-    def create_training_dataset(self):
+    def create_training_dataset(self, refeaturize=False):
         """
         Load all collected data and create training dataset
         
+        Args:
+            refeaturize: Recompute features from the stored landmarks in one
+                         vectorized pass instead of using stored features
+        
         Returns:
             X: Feature matrix (n_samples, n_features)
             y: Label vector (n_samples,)
         """
-        X = []
-        y = []
+        X, y = self.store.load_dataset(use_landmarks=refeaturize)
         
-        for gesture_id in sorted(self.GESTURES.keys()):
-            gesture_name = self.GESTURES[gesture_id]
-            gesture_dir = os.path.join(self.data_dir, f"{gesture_id}_{gesture_name}")
-            
-            feature_files = [f for f in os.listdir(gesture_dir) if f.startswith("features_")]
-            
-            for feature_file in feature_files:
-                feature_path = os.path.join(gesture_dir, feature_file)
-                features = np.load(feature_path)
-                
-                X.append(features)
-                y.append(gesture_id)
+        # Per-sample .npy files from older collections that were never imported
+        if self.store.has_legacy_files():
+            print("⚠️  Found per-sample .npy files; convert them with: python -m modules.dataset_store")
+            legacy_X, legacy_y = self.store.load_legacy(use_landmarks=refeaturize)
+            X = np.concatenate([X, legacy_X])
+            y = np.concatenate([y, legacy_y.astype(y.dtype)])
         
-        X = np.array(X)
-        y = np.array(y)
+        if refeaturize:
+            X = self.feature_extractor.extract_features_batch(X)
         
         print(f"✓ Loaded dataset: {X.shape[0]} samples, {X.shape[1]} features")
         print(f"✓ Classes: {len(np.unique(y))}")
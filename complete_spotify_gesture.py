@@ -11,6 +11,9 @@ import time
 import subprocess
 import psutil
 import os
+from modules.hand_detection import HandRoiTracker
+from modules.frame_scheduler import IdlePowerSaver
+from config import HAND_DETECTION_CONFIG, POWER_SAVER_CONFIG
 
 print("🎵 Starting Spotify Gesture Control with Hand Skeleton...")
 
@@ -19,7 +22,7 @@ print("🎵 Starting Spotify Gesture Control with Hand Skeleton...")
 # ================================
 
 class HandSkeletonDetector:
-    def __init__(self):
+    def __init__(self, roi_tracking=False):
         self.mp_hands = mp.solutions.hands
         self.hands = self.mp_hands.Hands(
             static_image_mode=False,
@@ -28,13 +31,13 @@ class HandSkeletonDetector:
             min_tracking_confidence=0.5
         )
         self.mp_draw = mp.solutions.drawing_utils
+        self.roi_tracker = HandRoiTracker(enabled=roi_tracking)
         
         print("✅ Hand Skeleton Detector initialized")
     
     def detect_hands(self, frame):
         """Detect hands and return landmarks with skeleton"""
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        results = self.hands.process(rgb_frame)
+        results = self.roi_tracker.process(self.hands, frame, cv2.COLOR_BGR2RGB)
         
         landmarks_list = []
         
@@ -52,6 +55,17 @@ class HandSkeletonDetector:
         
         return frame, landmarks_list, results.multi_hand_landmarks
     
+    def has_hand(self, frame):
+        """
+        Presence check only (no drawing or gesture detection), used in power saving mode
+        
+        The frame is the power saver's downscaled copy, so the ROI crop (in
+        full-size pixels) is dropped and the whole frame is checked.
+        """
+        self.roi_tracker.reset()
+        results = self.hands.process(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+        return bool(results.multi_hand_landmarks)
+    
     def count_fingers(self, landmarks):
         """Count extended fingers using landmark positions"""
         if not landmarks:
@@ -174,7 +188,7 @@ class SpotifyGestureControl:
         print("🎵 Initializing Spotify Gesture Control with Hand Skeleton...")
         
         # Initialize components
-        self.hand_detector = HandSkeletonDetector()
+        self.hand_detector = HandSkeletonDetector(roi_tracking=HAND_DETECTION_CONFIG['roi_tracking'])
         self.spotify_controller = SpotifyController()
         
         # Gesture tracking
@@ -256,6 +270,9 @@ class SpotifyGestureControl:
             print("❌ Cannot open camera")
             return
         
+        # Low-power state when nobody is in front of the camera
+        power_saver = IdlePowerSaver(capture=cap, **POWER_SAVER_CONFIG)
+        
         print("\n" + "="*50)
         print("🎵 SPOTIFY HAND SKELETON CONTROL STARTED")
         print("="*50)
@@ -278,8 +295,18 @@ class SpotifyGestureControl:
                 # Mirror the frame
                 frame = cv2.flip(frame, 1)
                 
+                if power_saver.skip_frame(frame, self.hand_detector.has_hand):
+                    cv2.putText(frame, "Power saving - show a hand to wake", (10, 30),
+                               cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 165, 255), 2)
+                    cv2.imshow("🎵 Spotify Hand Skeleton", frame)
+                    if cv2.waitKey(1) & 0xFF == ord('q'):
+                        break
+                    continue
+                
                 # Process frame with skeleton detection
                 frame, gesture = self.process_frame(frame)
+                if power_saver.update(gesture != "no_hand"):
+                    print("💤 No hand detected, entering power saving mode")
                 
                 # Show frame
                 cv2.imshow("🎵 Spotify Hand Skeleton", frame)
@@ -14,9 +14,12 @@ CAMERA_CONFIG = {
 # ==================== HAND DETECTION SETTINGS ====================
 HAND_DETECTION_CONFIG = {
     'mode': False,               # Static image mode (False for video)
-    'max_hands': 1,              # Maximum hands to detect
+    'max_hands': 2,              # Maximum hands to detect in multi-hand mode
     'detection_confidence': 0.5, # Min confidence for detection
     'tracking_confidence': 0.5,  # Min confidence for tracking
+    'roi_tracking': False,       # Detect on a crop around the last hand position
+    'multi_hand': False,         # Track and classify every hand (one batched prediction per frame)
+    'chord_settle_frames': 3,    # Frames a single pose must hold while a second hand is in view
 }
 
 # ==================== GESTURE CLASSIFICATION SETTINGS ====================
@@ -26,6 +29,51 @@ GESTURE_CONFIG = {
     'gesture_history_size': 5,      # Smoothing history size
 }
 
+# ==================== FRAME SCHEDULING SETTINGS ====================
+SCHEDULER_CONFIG = {
+    'enabled': True,             # Skip inference on static frames
+    'max_interval': 6,           # Max frames between inferences when idle
+    'motion_threshold': 4.0,     # Mean pixel difference (0-255) that counts as motion
+    'stable_frames': 15,         # Unchanged inferences before slowing down
+    'max_latency': 0.25,         # Worst-case seconds between inferences
+}
+
+# ==================== MOTION GESTURE SETTINGS ====================
+MOTION_CONFIG = {
+    'enabled': False,            # Recognize swipes, circles and push/pull alongside static gestures
+    'window': 30,                # Frames of palm motion considered
+    'swipe_distance': 0.25,      # Palm travel for a swipe (fraction of the frame)
+    'swipe_speed': 0.8,          # Palm speed at the end of a swipe (frame widths per second)
+    'circle_path': 0.3,          # Palm path length for a circle
+    'push_scale': 0.3,           # Log hand-size change for push/pull
+    'cooldown': 0.5,             # Seconds ignored after a motion, so a long one fires once
+}
+
+# ==================== VOLUME KNOB SETTINGS ====================
+VOLUME_KNOB_CONFIG = {
+    'enabled': False,            # Hold the pose and move the hand up/down to set the volume
+    'gesture': 2,                # Pose that engages the knob (PINCH; replaces its play/pause action)
+    'control': 'wrist',          # 'wrist' (vertical movement) or 'pinch' (thumb-index distance)
+    'travel': 0.4,               # Wrist movement (fraction of frame height) for the full range
+    'ratio_span': 0.8,           # Pinch distance / palm length change for the full range ('pinch')
+    'min_cutoff': 1.0,           # One-Euro cutoff (Hz) for a still hand; lower = steadier
+    'beta': 1.0,                 # One-Euro speed coefficient; higher = less lag on fast moves
+    'dead_band': 0.02,           # Minimum volume change that is written to the backend
+    'warmup_frames': 3,          # Filtered frames before the knob starts following the hand
+    'release_frames': 15,        # Frames of another pose (or no hand) that release the knob
+}
+
+# ==================== POWER SAVING SETTINGS ====================
+POWER_SAVER_CONFIG = {
+    'enabled': True,             # Sleep when no hand is seen for a while
+    'idle_timeout': 30.0,        # Seconds without a hand before sleeping
+    'check_interval': 0.5,       # Max seconds between presence checks while asleep
+    'presence_width': 160,       # Frame width used for presence checks
+    'low_power_size': (320, 240),  # Camera resolution while asleep
+    'low_power_fps': 10,         # Camera frame rate while asleep
+    'motion_threshold': 4.0,     # Motion that triggers an immediate presence check
+}
+
 # ==================== MODEL SETTINGS ====================
 MODEL_CONFIG = {
     'random_forest': {
@@ -82,6 +130,7 @@ DISPLAY_CONFIG = {
     'show_confidence': True,     # Show confidence score
     'show_volume': True,         # Show volume indicator
     'show_gesture_name': True,   # Show detected gesture name
+    'show_metrics': False,       # Show per-stage latency (toggle with M)
 }
 
 # ==================== LOGGING SETTINGS ====================
@@ -89,6 +138,22 @@ LOG_CONFIG = {
     'enable_logging': True,
     'log_level': 'INFO',         # 'DEBUG', 'INFO', 'WARNING', 'ERROR'
     'log_file': 'gesture_control.log',
+    'metrics_interval': 60.0,    # Seconds between structured metrics log lines
+}
+
+# ==================== FRAME TIMING SETTINGS ====================
+FRAME_TIMING_CONFIG = {
+    'window': 120,               # Frames in the rolling FPS / jitter window
+    'stall_threshold': 0.1,      # Frame time (seconds) reported as a stall
+}
+
+# ==================== METRICS SETTINGS ====================
+METRICS_CONFIG = {
+    'enabled': True,             # Record per-stage latency spans
+    'window': 300,               # Recent spans per stage used for p50/p95/p99
+    'http_port': None,           # Prometheus endpoint port (None = off)
+    'http_host': '127.0.0.1',    # Bind address for the endpoint
+    'gauge_interval': 1.0,       # Seconds between gauge copies served by the endpoint
 }
 
 # ==================== DATA PATHS ====================
@@ -123,6 +188,10 @@ def get_config():
         'camera': CAMERA_CONFIG,
         'hand_detection': HAND_DETECTION_CONFIG,
         'gesture': GESTURE_CONFIG,
+        'scheduler': SCHEDULER_CONFIG,
+        'power_saver': POWER_SAVER_CONFIG,
+        'motion': MOTION_CONFIG,
+        'volume_knob': VOLUME_KNOB_CONFIG,
         'model': MODEL_CONFIG,
         'action': ACTION_CONFIG,
         'feature': FEATURE_CONFIG,
@@ -130,6 +199,8 @@ def get_config():
         'mapping': GESTURE_MAPPING,
         'display': DISPLAY_CONFIG,
         'logging': LOG_CONFIG,
+        'metrics': METRICS_CONFIG,
+        'frame_timing': FRAME_TIMING_CONFIG,
         'paths': DATA_PATHS,
     }
 
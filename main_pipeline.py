@@ -7,108 +7,476 @@ import cv2
 import numpy as np
 import time
 import os
-from modules.hand_detection import HandDetector
+from modules.hand_detection import HandTracker
 from modules.feature_extraction import FeatureExtractor
-from modules.gesture_classifier import GestureClassifier
+from modules.compact_model import CompactGestureModel, compact_model_path
 from modules.action_mapper import ActionMapper
-from modules.media_controller import MediaController
+from modules.frame_capture import ThreadedCapture
+from modules.action_dispatcher import ActionDispatcher
+from modules.gesture_smoother import GestureSmoother
+from modules.frame_scheduler import AdaptiveFrameScheduler, IdlePowerSaver
+from modules.replay import LandmarkRecorder
+from modules.metrics import PipelineMetrics, MetricsServer, setup_logging
+from modules.reaction_tracer import ReactionTracer
+from modules.frame_timing import FrameTimer
+from modules.overlay import OverlayRenderer
+from modules.motion_gestures import MotionGestureRecognizer
+from modules.volume_knob import VolumeKnob
+from config import (
+    DISPLAY_CONFIG, HAND_DETECTION_CONFIG, SCHEDULER_CONFIG, POWER_SAVER_CONFIG, MOTION_CONFIG, VOLUME_KNOB_CONFIG,
+    METRICS_CONFIG, LOG_CONFIG, CAMERA_CONFIG, FRAME_TIMING_CONFIG
+)
 
 class GestureControlPipeline:
     """
     Main pipeline for real-time gesture detection and media control
     """
     
-    def __init__(self, model_path="data/gesture_model_random_forest", confidence_threshold=0.6):
+    def __init__(self, model_path="data/gesture_model_random_forest", confidence_threshold=0.6, headless=False,
+                 media_controller=None, hand_detector=None, multi_hand=None, roi_tracking=None,
+                 metrics_port=None):
         """
         Initialize gesture control pipeline
         
         Args:
             model_path: Path to trained gesture model
             confidence_threshold: Minimum confidence for gesture detection
+            headless: Skip all drawing and the display window
+            media_controller: Action backend (default: MediaController; replay uses RecordingController)
+            hand_detector: Landmark source (default: HandDetector; replay can use LandmarkStreamDetector)
+            multi_hand: Track and classify every hand (default: HAND_DETECTION_CONFIG['multi_hand'])
+            roi_tracking: Detect on a crop around the last hand (default: HAND_DETECTION_CONFIG['roi_tracking'])
+            metrics_port: Prometheus endpoint port (default: METRICS_CONFIG['http_port'], None = off)
         """
         print("🚀 Initializing Gesture Control Pipeline...")
         
+        # Rendering is a separate stage, skipped entirely when headless
+        self.headless = headless
+        self.show_landmarks = DISPLAY_CONFIG['show_landmarks'] and not headless
+        
         # Initialize components
-        self.hand_detector = HandDetector(max_hands=1)
+        self.multi_hand = HAND_DETECTION_CONFIG['multi_hand'] if multi_hand is None else multi_hand
+        if hand_detector is None:
+            # Imported here so landmark replay works without MediaPipe
+            from modules.hand_detection import HandDetector
+            hand_detector = HandDetector(
+                max_hands=HAND_DETECTION_CONFIG['max_hands'] if self.multi_hand else 1,
+                draw=False,
+                roi_tracking=HAND_DETECTION_CONFIG['roi_tracking'] if roi_tracking is None else roi_tracking
+            )
+        self.hand_detector = hand_detector
         self.feature_extractor = FeatureExtractor()
-        self.gesture_classifier = GestureClassifier(model_type='random_forest')
         self.action_mapper = ActionMapper()
-        self.media_controller = MediaController()
-        
-        # Load pre-trained model
+        if media_controller is None:
+            # Imported here so replay on machines without pycaw/pyautogui works
+            from modules.media_controller import MediaController
+            media_controller = MediaController()
+        self.media_controller = media_controller
+        self.action_dispatcher = ActionDispatcher(self.media_controller)
+        
+        # Load pre-trained model (compact NumPy model avoids importing sklearn)
         self.confidence_threshold = confidence_threshold
-        if os.path.exists(f"{model_path}.pkl"):
+        compact_path = compact_model_path(model_path)
+        if compact_path is not None:
+            print(f"📦 Loading compact model from {compact_path}...")
+            self.gesture_classifier = CompactGestureModel(compact_path)
+        elif os.path.exists(f"{model_path}.pkl"):
+            from modules.gesture_classifier import GestureClassifier
+            if os.path.exists(f"{model_path}_compact.npz"):
+                print(f"⚠️  {model_path}_compact.npz is older than the trained model; ignoring it")
             print(f"📦 Loading trained model from {model_path}...")
+            self.gesture_classifier = GestureClassifier(model_type='random_forest')
             self.gesture_classifier.load_model(model_path)
         else:
             print(f"⚠️  Model not found at {model_path}")
             print("Please train a model first using train_model.py")
             raise FileNotFoundError(f"Model not found: {model_path}")
         
-        # Gesture history for smoothing
-        self.gesture_history = []
+        # Gesture smoothing over recent frames
         self.gesture_history_size = 5
+        self.gesture_smoother = GestureSmoother(history_size=self.gesture_history_size)
         self.last_gesture = None
         self.gesture_confidence = 0.0
         
+        # Multi-hand mode: stable track IDs and one smoother per hand
+        self.hand_tracker = HandTracker()
+        self.hand_smoothers = {}
+        self.hand_results = []
+        self.chord_settle_frames = HAND_DETECTION_CONFIG['chord_settle_frames']
+        self._chord_hands = {}       # track_id -> gesture it held when its last chord fired
+        self._single_pending = None  # (gesture, frames) of a single pose waiting next to a second hand
+        
+        # Swipes, circles and push/pull of the (primary) hand
+        self.motion_recognizer = MotionGestureRecognizer(**MOTION_CONFIG)
+        self.last_motion = None
+        
+        # Pinch-distance volume knob (absolute levels, written through the dispatcher)
+        self.volume_knob = VolumeKnob(**VOLUME_KNOB_CONFIG)
+        
+        # Lower the inference rate while the scene and gesture are static
+        self.frame_scheduler = AdaptiveFrameScheduler(**SCHEDULER_CONFIG)
+        self._last_result = (None, 0.0, None)
+        self.last_frame_inferred = False
+        
         # Performance monitoring
         self.frame_count = 0
         self.start_time = time.time()
+        self.frame_timer = FrameTimer(
+            window=FRAME_TIMING_CONFIG['window'],
+            stall_threshold=FRAME_TIMING_CONFIG['stall_threshold'],
+            expected_fps=CAMERA_CONFIG['fps'],
+            on_stall=self._on_stall
+        )
+        # Inference only runs every few frames on a static scene; only gaps beyond that are stalls
+        inference_gap = self.frame_scheduler.max_gap(CAMERA_CONFIG['fps'])
+        self.inference_timer = FrameTimer(
+            window=FRAME_TIMING_CONFIG['window'],
+            stall_threshold=inference_gap + FRAME_TIMING_CONFIG['stall_threshold'],
+            expected_fps=1.0 / inference_gap
+        )
+        self.metrics = PipelineMetrics(enabled=METRICS_CONFIG['enabled'], window=METRICS_CONFIG['window'])
+        self.show_metrics = DISPLAY_CONFIG['show_metrics'] and not headless
+        self.overlay = OverlayRenderer()
+        self.logger = setup_logging(LOG_CONFIG)
+        self.metrics.add_gauges('frame', self.frame_timer.get_stats)
+        self.metrics.add_gauges('inference', self.inference_timer.get_stats)
+        self.metrics_server = None
+        if metrics_port is None:
+            metrics_port = METRICS_CONFIG['http_port']
+        if metrics_port is not None:
+            self.start_metrics_server(metrics_port, METRICS_CONFIG['http_host'])
+        self.reaction_tracer = None
         
         print("✓ Pipeline initialized successfully!\n")
     
-    def process_frame(self, frame):
+    def process_frame(self, frame, timestamp=None):
         """
         Process a single frame
         
         Args:
             frame: Input frame from camera
+            timestamp: Frame time in seconds (default: now); replay passes recorded times
             
         Returns:
             frame: Processed frame with visualizations
             gesture: Detected gesture class
             confidence: Confidence score
         """
+        metrics = self.metrics
+        frame_start = metrics.now()
+        self.frame_count += 1
+        self.frame_timer.tick(timestamp)
+        
+        # Idle frames reuse the last result (and the last landmarks for drawing)
+        self.last_frame_inferred = self.frame_scheduler.should_process(frame, now=timestamp)
+        if self.last_frame_inferred:
+            gesture, confidence, action = self._infer(frame, timestamp)
+            self.inference_timer.tick(timestamp)
+            self.frame_scheduler.update(gesture)
+            self._last_result = (gesture, confidence, action)
+        else:
+            gesture, confidence, action = self._last_result
+        
+        # Draw visualizations
+        if not self.headless:
+            start = metrics.now()
+            if self.show_landmarks:
+                self.hand_detector.draw_landmarks(frame)
+            frame = self._draw_ui(frame, gesture, confidence, action)
+            metrics.record('rendering', start)
+        
+        metrics.record('frame', frame_start)
+        if self.metrics_server is not None:
+            metrics.refresh_gauges(METRICS_CONFIG['gauge_interval'])
+        metrics.log_if_due(
+            self.logger, LOG_CONFIG['metrics_interval'],
+            frames=self.frame_count,
+            fps=round(self.frame_timer.fps_window, 1),
+            inference_fps=round(self.inference_timer.fps_window, 1),
+            jitter_ms=round(self.frame_timer.jitter_ms, 2),
+            dropped=self.frame_timer.dropped,
+            stalls=self.frame_timer.stalls
+        )
+        
+        return frame, gesture, confidence
+    
+    def _infer(self, frame, capture_time=None):
+        """
+        Run detection, classification, smoothing and action dispatch
+        
+        Args:
+            frame: Input frame from camera
+            capture_time: Frame capture time (perf_counter), used for reaction tracing
+            
+        Returns:
+            gesture: Smoothed gesture class (None if no confident hand)
+            confidence: Confidence score
+            action: Mapped action
+        """
+        metrics = self.metrics
+        tracer = self.reaction_tracer
+        process_start = None
+        if tracer is not None:
+            process_start = time.perf_counter()
+            if capture_time is None:
+                capture_time = process_start
+        
         # Detect hands
+        start = metrics.now()
         frame, landmarks_list = self.hand_detector.detect_hands(frame)
+        metrics.record('detection', start)
         
         gesture = None
         confidence = 0.0
         action = None
         
-        if len(landmarks_list) > 0:
+        if self.multi_hand:
+            gesture, confidence, action = self._infer_hands(landmarks_list, capture_time, process_start)
+        elif len(landmarks_list) > 0:
             # Extract features from detected hand
+            start = metrics.now()
             landmarks = landmarks_list[0]
             features = self.feature_extractor.extract_features(landmarks)
+            metrics.record('features', start)
             
             # Predict gesture
+            start = metrics.now()
             gesture, confidence = self.gesture_classifier.predict(features)
+            metrics.record('classification', start)
             
-            # Only use prediction if confidence is high enough
-            if confidence >= self.confidence_threshold:
-                # Smooth gesture detection using history
-                self.gesture_history.append(gesture)
-                if len(self.gesture_history) > self.gesture_history_size:
-                    self.gesture_history.pop(0)
-                
-                # Use majority gesture from history
-                gesture = max(set(self.gesture_history), key=self.gesture_history.count)
-                
-                # Get action for gesture
+            gesture = self._smooth(gesture, confidence, self.gesture_smoother, capture_time)
+            if gesture is not None:
                 action = self.action_mapper.get_action(gesture)
-                
-                # Execute media control
-                if action and gesture != self.last_gesture:
-                    self.media_controller.execute_action(action)
-                    self.last_gesture = gesture
-            else:
-                gesture = None
-                action = None
+                self._dispatch(action, gesture, capture_time, process_start)
+        elif tracer is not None:
+            tracer.observe(capture_time, False, None)
+        
+        # The volume knob and motion gestures follow the same (primary) hand
+        if self.volume_knob.enabled or self.motion_recognizer.enabled:
+            hand = None
+            if self.hand_results:
+                primary = min(range(len(self.hand_results)), key=lambda i: self.hand_results[i]['track_id'])
+                hand = landmarks_list[primary]
+            elif not self.multi_hand and len(landmarks_list) > 0:
+                hand = landmarks_list[0]
+            
+            if self.volume_knob.enabled:
+                volume = self.media_controller.get_cached_volume()
+                level = self.volume_knob.update(hand, gesture, capture_time, volume)
+                if level is not None:
+                    self.action_dispatcher.set_volume(level)
+                if self.volume_knob.active:
+                    action = ActionMapper.SET_VOLUME
+                    hand = None  # No swipes while the knob is turned
+        
+        if self.motion_recognizer.enabled:
+            start = metrics.now()
+            motion = self.motion_recognizer.update(hand, capture_time)
+            metrics.record('motion', start)
+            
+            if motion is not None:
+                self.last_motion = motion
+                motion_action = self.action_mapper.get_motion_action(motion)
+                if motion_action:
+                    action = motion_action
+                    self._dispatch(action, motion, capture_time, process_start, hold=False)
+        
+        return gesture, confidence, action
+    
+    def _infer_hands(self, landmarks_list, capture_time, process_start):
+        """
+        Multi-hand inference: one feature matrix and one predict_batch call for all hands
+        
+        Every hand is smoothed by its own track's smoother and reported in
+        self.hand_results. With two hands, their gestures are looked up as a
+        chord (ActionMapper.get_chord_action); otherwise the primary hand (the
+        longest-tracked one) drives the media actions, exactly as the single
+        hand does in single-hand mode, with two guards against stray
+        single-hand actions around a chord:
+        
+        - after a chord fires, a hand that formed it does nothing until
+          its gesture changes (releasing the other hand is not a new pose)
+        - while a second hand is in view, the primary pose must hold for
+          `chord_settle_frames` inferences first, so a chord whose hands
+          become confident on different frames does not fire the first
+          hand's own action on the way
         
-        # Draw visualizations
-        frame = self._draw_ui(frame, gesture, confidence, action)
+        Args:
+            landmarks_list: Landmarks of the detected hands
+            capture_time: Frame capture time (reaction tracing)
+            process_start: Processing start time (reaction tracing)
+            
+        Returns:
+            Primary hand's gesture and confidence, and the mapped action
+            (the chord's action when the two hands form one)
+        """
+        metrics = self.metrics
+        detector = self.hand_detector
+        track_ids = self.hand_tracker.update(landmarks_list, detector.handedness[:len(landmarks_list)])
+        for track_id in self.hand_tracker.ended:
+            self.hand_smoothers.pop(track_id, None)
+            self._chord_hands.pop(track_id, None)
+        self.hand_results = []
+        
+        if len(landmarks_list) == 0:
+            if self.reaction_tracer is not None:
+                self.reaction_tracer.observe(capture_time, False, None)
+            return None, 0.0, None
+        
+        start = metrics.now()
+        landmarks = detector.get_landmarks()
+        features = self.feature_extractor.extract_features_batch(landmarks)
+        metrics.record('features', start)
+        
+        start = metrics.now()
+        gestures, confidences = self.gesture_classifier.predict_batch(features)
+        metrics.record('classification', start)
+        
+        gesture, confidence = None, 0.0
+        primary = int(np.argmin(track_ids))
+        for i, track_id in enumerate(track_ids):
+            smoother = self.hand_smoothers.get(track_id)
+            if smoother is None:
+                smoother = GestureSmoother(history_size=self.gesture_history_size)
+                self.hand_smoothers[track_id] = smoother
+            
+            # Only the primary hand is reaction-traced
+            hand_gesture = self._smooth(
+                gestures[i], confidences[i], smoother, capture_time if i == primary else None
+            )
+            if i == primary:
+                gesture, confidence = hand_gesture, confidences[i]
+            
+            self.hand_results.append({
+                'track_id': track_id,
+                'handedness': detector.handedness[i],
+                'gesture': hand_gesture,
+                'confidence': float(confidences[i]),
+                'wrist': (float(landmarks[i, 0, 0]), float(landmarks[i, 0, 1])),
+            })
+        
+        # A two-hand chord takes precedence over the primary hand's own action
+        action = None
+        key = self._chord_key() if len(self.hand_results) == 2 else None
+        if key is not None:
+            action = self.action_mapper.get_chord_action(key)
+        if action is not None:
+            self._chord_hands = {hand['track_id']: int(hand['gesture']) for hand in self.hand_results}
+            self._single_pending = None
+        elif gesture is not None and self._single_ready(track_ids[primary], int(gesture)):
+            key = gesture
+            action = self.action_mapper.get_action(gesture)
+        self._dispatch(action, key, capture_time, process_start)
+        
+        return gesture, confidence, action
+    
+    def _single_ready(self, track_id, gesture):
+        """
+        Whether the primary hand's own pose may act this frame
         
-        return frame, gesture, confidence
+        Args:
+            track_id: Primary hand's track ID
+            gesture: Its smoothed gesture class
+            
+        Returns:
+            False while the hand still holds the pose of its last chord, or
+            while a second hand is in view and the pose has not yet held for
+            chord_settle_frames inferences
+        """
+        if self._chord_hands.get(track_id) == gesture:
+            return False
+        self._chord_hands.pop(track_id, None)
+        
+        if len(self.hand_results) < 2:
+            self._single_pending = None
+            return True
+        if self._single_pending is not None and self._single_pending[0] == gesture:
+            self._single_pending = (gesture, self._single_pending[1] + 1)
+        else:
+            self._single_pending = (gesture, 1)
+        return self._single_pending[1] >= self.chord_settle_frames
+    
+    def _chord_key(self):
+        """
+        Chord lookup key for the two tracked hands
+        
+        Returns:
+            (left_gesture, right_gesture) as ints, or None unless both hands
+            have a smoothed gesture; hands without distinct handedness
+            labels are ordered by wrist x position
+        """
+        first, second = self.hand_results
+        if first['gesture'] is None or second['gesture'] is None:
+            return None
+        if first['handedness'] and second['handedness'] and first['handedness'] != second['handedness']:
+            swap = first['handedness'] == 'Right'
+        else:
+            swap = first['wrist'][0] > second['wrist'][0]
+        if swap:
+            first, second = second, first
+        return (int(first['gesture']), int(second['gesture']))
+    
+    def _smooth(self, gesture, confidence, smoother, capture_time=None):
+        """
+        Smooth one hand's raw prediction
+        
+        Args:
+            gesture: Raw predicted gesture class
+            confidence: Prediction confidence
+            smoother: The hand's GestureSmoother
+            capture_time: Frame capture time for reaction tracing (None: not traced)
+            
+        Returns:
+            Smoothed gesture, or None below the confidence threshold
+        """
+        if self.reaction_tracer is not None and capture_time is not None:
+            self.reaction_tracer.observe(
+                capture_time, True, gesture if confidence >= self.confidence_threshold else None
+            )
+        
+        # Only use prediction if confidence is high enough
+        if confidence < self.confidence_threshold:
+            return None
+        
+        # Use majority gesture from recent history
+        start = self.metrics.now()
+        gesture = smoother.update(gesture, confidence)
+        self.metrics.record('smoothing', start)
+        return gesture
+    
+    def _dispatch(self, action, key, capture_time, process_start, hold=True):
+        """
+        Queue an action when the gesture (or chord) that maps to it changes
+        
+        Args:
+            action: Action string (None: nothing to do)
+            key: Smoothed gesture class, chord tuple or motion name that produced the action
+            capture_time: Frame capture time (reaction tracing)
+            process_start: Processing start time (reaction tracing)
+            hold: Key is a held pose that fires once per change; False for
+                  one-shot motions, which always fire and leave the held pose as is
+        """
+        if not action:
+            return
+        # Plain ints so gestures and chord tuples compare cleanly
+        if isinstance(key, np.generic):
+            key = key.item()
+        if hold and key == self.last_gesture:
+            return
+        if hold and self.volume_knob.enabled and (self.volume_knob.active or key == self.volume_knob.gesture):
+            # The knob pose sets the volume instead, and poses passed through while it is held do nothing;
+            # last_gesture is left alone so a pose still held when the knob releases fires then
+            return
+        
+        # Execute media control (queued, runs off the frame loop)
+        start = self.metrics.now()
+        trace = None
+        if self.reaction_tracer is not None:
+            trace = self.reaction_tracer.begin(action, key, capture_time, process_start, time.perf_counter())
+        self.action_dispatcher.dispatch(action, trace=trace)
+        self.metrics.record('dispatch', start)
+        if hold:
+            self.last_gesture = key
     
     def _draw_ui(self, frame, gesture, confidence, action):
         """
@@ -125,11 +493,6 @@ class GestureControlPipeline:
         """
         h, w, _ = frame.shape
         
-        # Draw semi-transparent background for info panel
-        overlay = frame.copy()
-        cv2.rectangle(overlay, (0, 0), (400, 150), (0, 0, 0), -1)
-        cv2.addWeighted(overlay, 0.3, frame, 0.7, 0, frame)
-        
         # Gesture information
         gesture_text = "Gesture: "
         if gesture is not None:
@@ -140,14 +503,17 @@ class GestureControlPipeline:
             gesture_text += "No hand detected"
             color = (0, 165, 255)
         
-        cv2.putText(
-            frame, gesture_text,
-            (10, 35),
-            cv2.FONT_HERSHEY_SIMPLEX,
-            1, color, 2
-        )
+        lines = [(gesture_text, (10, 35), cv2.FONT_HERSHEY_SIMPLEX, 1, color, 2)]
+        
+        # Action
+        if action:
+            action_desc = ActionMapper.get_action_description(action)
+            lines.append((action_desc, (10, 115), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (255, 165, 0), 2))
         
-        # Confidence
+        # Semi-transparent info panel; its text is re-rendered only when it changes
+        self.overlay.panel(frame, 'info', (0, 0), (400, 150), 0.3, lines=lines)
+        
+        # Confidence (changes every inference, drawn directly)
         confidence_text = f"Confidence: {confidence:.2%}"
         confidence_color = (0, 255, 0) if confidence >= self.confidence_threshold else (0, 0, 255)
         cv2.putText(
@@ -157,19 +523,9 @@ class GestureControlPipeline:
             0.8, confidence_color, 2
         )
         
-        # Action
-        if action:
-            action_desc = ActionMapper.get_action_description(action)
-            cv2.putText(
-                frame, action_desc,
-                (10, 115),
-                cv2.FONT_HERSHEY_SIMPLEX,
-                0.8, (255, 165, 0), 2
-            )
-        
-        # Volume indicator
+        # Volume indicator (cached, not read from the system every frame)
         try:
-            volume = self.media_controller.get_volume()
+            volume = self.media_controller.get_cached_volume()
             volume_bar_width = int(volume * 100)
             cv2.rectangle(frame, (w-150, 10), (w-10, 40), (200, 200, 200), 2)
             cv2.rectangle(frame, (w-150, 10), (w-150+volume_bar_width, 40), (0, 255, 0), -1)
@@ -182,21 +538,32 @@ class GestureControlPipeline:
         except:
             pass
         
-        # FPS
-        self.frame_count += 1
-        elapsed_time = time.time() - self.start_time
-        fps = self.frame_count / elapsed_time if elapsed_time > 0 else 0
+        # Per-hand track labels (multi-hand mode)
+        for hand in self.hand_results:
+            name = self.gesture_classifier.get_gesture_name(hand['gesture']) if hand['gesture'] is not None else "-"
+            cv2.putText(
+                frame, f"#{hand['track_id']} {hand['handedness'] or ''} {name}",
+                (int(hand['wrist'][0] * w), int(hand['wrist'][1] * h) + 20),
+                cv2.FONT_HERSHEY_SIMPLEX,
+                0.5, (255, 255, 255), 1
+            )
         
+        # FPS (rolling) and inference rate
         cv2.putText(
-            frame, f"FPS: {fps:.1f}",
+            frame,
+            f"FPS: {self.frame_timer.fps_ema:.1f} (jitter {self.frame_timer.jitter_ms:.1f} ms) | "
+            f"Inference: {self.inference_timer.fps_ema:.1f} (1/{self.frame_scheduler.interval})",
             (10, h-10),
             cv2.FONT_HERSHEY_SIMPLEX,
             0.6, (255, 255, 0), 1
         )
         
+        if self.show_metrics:
+            self._draw_metrics(frame)
+        
         # Instructions
         cv2.putText(
-            frame, "Q: Quit | S: Settings",
+            frame, "Q: Quit | S: Settings | M: Metrics",
             (w-250, h-10),
             cv2.FONT_HERSHEY_SIMPLEX,
             0.5, (255, 255, 255), 1
@@ -204,14 +571,24 @@ class GestureControlPipeline:
         
         return frame
     
-    def run(self, camera_id=0):
+    def run(self, camera_id=0, source=None, record_path=None):
         """
         Run real-time gesture control
         
         Args:
             camera_id: Camera device ID (usually 0)
+            source: Optional video file or image directory used instead of the camera
+            record_path: Optional .npz path to save the landmark stream for replay
         """
-        cap = cv2.VideoCapture(camera_id)
+        cap = ThreadedCapture(source if source is not None else camera_id)
+        if not cap.isOpened():
+            print(f"Error: Cannot open source {source if source is not None else camera_id}")
+            return
+        cap.start()
+        
+        # Low-power state when nobody is in front of the camera
+        power_saver = IdlePowerSaver(capture=cap, **POWER_SAVER_CONFIG)
+        recorder = LandmarkRecorder(max_hands=self.hand_detector.max_hands) if record_path else None
         
         print("\n" + "="*60)
         print("🎥 REAL-TIME GESTURE CONTROL STARTED")
@@ -219,76 +596,206 @@ class GestureControlPipeline:
         print("Controls:")
         print("  Q - Quit")
         print("  S - Show/Hide Settings")
+        print("  M - Show/Hide Stage Metrics")
         print("="*60 + "\n")
         
         show_settings = False
         
-        while True:
-            ret, frame = cap.read()
-            if not ret:
-                print("Error: Cannot read from camera")
-                break
-            
-            # Flip frame horizontally for selfie view
-            frame = cv2.flip(frame, 1)
-            
-            # Process frame
-            frame, gesture, confidence = self.process_frame(frame)
-            
-            # Show settings if requested
-            if show_settings:
-                frame = self._draw_settings(frame)
-            
-            # Display frame
-            cv2.imshow("Gesture Control - Media Player", frame)
-            
-            # Handle keyboard input
-            key = cv2.waitKey(1) & 0xFF
-            if key == ord('q'):
-                print("\n✓ Exiting gesture control...")
-                break
-            elif key == ord('s'):
-                show_settings = not show_settings
+        try:
+            while True:
+                ret, frame = cap.read()
+                if not ret:
+                    if not cap.finished:
+                        # Slow camera start or a late frame; the source is still live
+                        continue
+                    if source is not None:
+                        print("✓ End of video source")
+                    else:
+                        print("Error: Cannot read from camera")
+                    break
+                
+                # Flip frame horizontally for selfie view
+                frame = cv2.flip(frame, 1)
+                
+                if power_saver.skip_frame(frame, self._has_hand):
+                    if recorder is not None:
+                        recorder.add(cap.last_frame_time, [])
+                    if self.headless:
+                        continue
+                    cv2.putText(
+                        frame, "Power saving - show a hand to wake",
+                        (10, 30),
+                        cv2.FONT_HERSHEY_SIMPLEX,
+                        0.6, (0, 165, 255), 2
+                    )
+                else:
+                    # Process frame
+                    frame, gesture, confidence = self.process_frame(frame, timestamp=cap.last_frame_time)
+                    # Skipped frames would repeat the last landmarks; only detections are recorded
+                    if recorder is not None and self.last_frame_inferred:
+                        recorder.add(cap.last_frame_time, self.hand_detector.get_landmarks())
+                    if power_saver.update(self.hand_detector.num_hands > 0):
+                        print("💤 No hand detected, entering power saving mode")
+                        self.frame_scheduler.reset()
+                        self.frame_timer.reset()
+                        self.inference_timer.reset()
+                    
+                    if self.headless:
+                        continue
+                
+                # Show settings if requested
+                if show_settings:
+                    frame = self._draw_settings(frame)
+                
+                # Display frame
+                cv2.imshow("Gesture Control - Media Player", frame)
+                
+                # Handle keyboard input
+                key = cv2.waitKey(1) & 0xFF
+                if key == ord('q'):
+                    print("\n✓ Exiting gesture control...")
+                    break
+                elif key == ord('s'):
+                    show_settings = not show_settings
+                elif key == ord('m'):
+                    self.show_metrics = not self.show_metrics
+        except KeyboardInterrupt:
+            print("\n✓ Exiting gesture control...")
         
         cap.release()
-        cv2.destroyAllWindows()
-        
+        if not self.headless:
+            cv2.destroyAllWindows()
+        self.action_dispatcher.stop()
+        if self.metrics_server is not None:
+            self.metrics_server.stop()
+        if self.reaction_tracer is not None:
+            self.reaction_tracer.print_summary()
+            self.reaction_tracer.close()
+        
+        if recorder is not None:
+            recorder.save(record_path)
+            print(f"✓ Recorded {len(recorder)} frames of landmarks to {record_path}")
+        
+        timing = self.frame_timer.get_stats()
+        print(f"✓ Frame time p95 {timing['frame_time_p95_ms']:.1f} ms, max {timing['max_frame_time_ms']:.1f} ms, "
+              f"{timing['stalls']} stalls, {timing['dropped']} dropped")
+        if self.volume_knob.enabled:
+            knob = self.volume_knob.get_stats()
+            print(f"✓ Volume knob: {knob['updates']} updates, {knob['writes']} volume writes")
+        
+        stats = cap.get_stats()
+        print(f"✓ Frames processed: {stats['frames_read']} (dropped stale: {stats['frames_dropped']})")
+        scheduler_stats = self.frame_scheduler.get_stats()
+        print(f"✓ Inference on {scheduler_stats['frames_processed']} frames "
+              f"({scheduler_stats['inference_fps']:.1f} FPS vs capture {scheduler_stats['capture_fps']:.1f} FPS)")
+        power_stats = power_saver.get_stats()
+        print(f"✓ Power saving: {power_stats['sleeps']} sleeps, "
+              f"{power_stats['time_in_low_power']:.1f}s asleep, {power_stats['frames_skipped']} frames skipped")
         print("✓ Gesture control stopped.\n")
     
+    def _on_stall(self, frame_time, frame_index):
+        """Report a frame that took longer than the stall threshold"""
+        message = f"Frame {frame_index} stalled: {frame_time * 1000:.0f} ms"
+        if self.logger is not None:
+            self.logger.warning(message)
+        else:
+            print(f"⚠️  {message}")
+    
+    def _draw_metrics(self, frame):
+        """Draw per-stage p50/p95/p99 latency above the FPS line"""
+        h = frame.shape[0]
+        snapshot = self.metrics.snapshot(max_age=0.5)
+        y = h - 40 - 18 * (len(snapshot) - 1)
+        for stage, stats in snapshot.items():
+            cv2.putText(
+                frame,
+                f"{stage:<15}{stats['p50_ms']:6.2f}{stats['p95_ms']:7.2f}{stats['p99_ms']:7.2f} ms",
+                (10, y),
+                cv2.FONT_HERSHEY_PLAIN,
+                1, (255, 255, 0), 1
+            )
+            y += 18
+    
+    def enable_reaction_trace(self, trace_path=None):
+        """
+        Trace gesture-to-action latency for every dispatched action
+        
+        Args:
+            trace_path: Optional JSON-lines file for per-action traces
+                        (a .summary.json report is written next to it on exit)
+        """
+        self.reaction_tracer = ReactionTracer(trace_path, backend=self.media_controller)
+        self.action_dispatcher.on_complete = self.reaction_tracer.complete
+        self.action_dispatcher.on_discard = self.reaction_tracer.discard
+        return self.reaction_tracer
+    
+    def start_metrics_server(self, port=9108, host='127.0.0.1'):
+        """
+        Serve stage metrics in Prometheus text format at http://host:port/metrics
+        
+        A server that is already running is stopped first, so there is
+        never more than one.
+        
+        Args:
+            port: TCP port (0 picks a free port)
+            host: Bind address
+        """
+        if self.metrics_server is not None:
+            self.metrics_server.stop()
+        self.metrics_server = MetricsServer(self.metrics, host=host, port=port).start()
+        print(f"📈 Metrics at http://{host}:{self.metrics_server.port}/metrics")
+        return self.metrics_server
+    
+    def _has_hand(self, frame):
+        """Presence check used while in power saving mode (see HandDetector.has_hand)"""
+        return self.hand_detector.has_hand(frame)
+    
     def _draw_settings(self, frame):
         """Draw settings panel on frame"""
         h, w, _ = frame.shape
         
-        # Draw semi-transparent background
-        overlay = frame.copy()
-        cv2.rectangle(overlay, (w-250, 50), (w-10, 200), (0, 0, 0), -1)
-        cv2.addWeighted(overlay, 0.4, frame, 0.6, 0, frame)
-        
         # Settings text
         settings = [
             f"Threshold: {self.confidence_threshold:.2f}",
             f"Gesture History: {self.gesture_history_size}",
             f"Detected Gestures: {len(self.gesture_classifier.GESTURES)}"
         ]
+        lines = [
+            (setting, (w-240, 80 + i*40), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 255), 1)
+            for i, setting in enumerate(settings)
+        ]
         
-        for i, setting in enumerate(settings):
-            cv2.putText(
-                frame, setting,
-                (w-240, 80 + i*40),
-                cv2.FONT_HERSHEY_SIMPLEX,
-                0.5, (0, 255, 255), 1
-            )
+        # Semi-transparent panel with the settings pre-rendered into it
+        self.overlay.panel(frame, 'settings', (w-250, 50), (w-10, 200), 0.4, lines=lines)
         
         return frame
 
 if __name__ == "__main__":
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Real-time gesture control')
+    parser.add_argument('--camera', type=int, default=0, help='Camera device ID')
+    parser.add_argument('--source', default=None, help='Video file or image directory instead of the camera')
+    parser.add_argument('--headless', action='store_true', help='No window or drawing (Ctrl+C to stop)')
+    parser.add_argument('--record', default=None, help='Save the landmark stream to this .npz for replay_session.py')
+    parser.add_argument('--metrics-port', type=int, default=None, help='Serve Prometheus metrics on this port (overrides METRICS_CONFIG)')
+    parser.add_argument('--trace', default=None, help='Write per-action reaction latency traces to this .jsonl file')
+    parser.add_argument('--roi-tracking', action='store_true', default=None,
+                        help='Detect hands on a crop around the last hand position')
+    args = parser.parse_args()
+    
     # Initialize and run pipeline
     try:
         pipeline = GestureControlPipeline(
             model_path="data/gesture_model_random_forest",
-            confidence_threshold=0.6
+            confidence_threshold=0.6,
+            headless=args.headless,
+            roi_tracking=args.roi_tracking,
+            metrics_port=args.metrics_port
         )
-        pipeline.run()
+        if args.trace:
+            pipeline.enable_reaction_trace(args.trace)
+        pipeline.run(camera_id=args.camera, source=args.source, record_path=args.record)
     except FileNotFoundError as e:
         print(f"Error: {e}")
         print("\nPlease train a model first:")
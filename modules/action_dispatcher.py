@@ -0,0 +1,262 @@
+"""
+MODULE 9: Asynchronous Action Dispatch
+Runs media/Spotify actions on a worker thread so the vision loop never
+waits on key injection, window focusing or COM calls
+"""
+
+import threading
+import time
+from collections import deque
+
+
+class ActionDispatcher:
+    """
+    Queue actions for a backend (MediaController, SpotifyController, ...)
+
+    Backend contract: execute_action(action, steps=1). Repeated volume
+    actions waiting in the queue are coalesced into one call with a larger
+    step count. When the queue is full the oldest pending action is dropped,
+    so the newest gesture always gets through.
+
+    Absolute volume levels (set_volume) go through the same queue and
+    worker: a pending level is overwritten by a newer one, so a backend
+    with set_volume(level) only ever receives the latest value.
+
+    An optional trace object passed to dispatch() is handed back through
+    on_complete(trace, start, end, result, error) on the worker thread once
+    the action has run (error is the exception the backend raised, or
+    None), or through on_discard(trace, reason) when the action never runs:
+    reason 'dropped' (queue full) or 'coalesced' (merged into a pending
+    action, which keeps its own trace). See ReactionTracer.
+
+    The worker starts on the first dispatch. After stop() further
+    dispatches are dropped until start() is called again.
+    """
+
+    COALESCE_ACTIONS = ("volume_up", "volume_down")
+    SET_VOLUME = "set_volume"
+
+    def __init__(self, backend, max_queue=8, coalesce=True, on_complete=None, on_discard=None):
+        """
+        Initialize dispatcher
+
+        Args:
+            backend: Object with execute_action(action, steps=1)
+            max_queue: Maximum number of pending actions
+            coalesce: Merge repeated queued volume actions
+            on_complete: Optional callback(trace, start, end, result, error) for traced actions
+            on_discard: Optional callback(trace, reason) for traced actions that never run
+        """
+        self.backend = backend
+        self.max_queue = max_queue
+        self.coalesce = coalesce
+        self.on_complete = on_complete
+        self.on_discard = on_discard
+
+        # Pending entries: [action, steps (level for SET_VOLUME), enqueue_time, trace]
+        self._queue = deque()
+        self._cond = threading.Condition()
+        self._running = False
+        self._stopped = False
+        self._thread = None
+
+        # Statistics
+        self.dispatched = 0
+        self.executed = 0
+        self.coalesced = 0
+        self.dropped = 0
+        self.errors = 0
+        self.last_latency = 0.0
+        self.max_latency = 0.0
+        self.total_latency = 0.0
+        self.last_execution_time = 0.0
+
+    def start(self):
+        """Start the worker thread (also after stop())"""
+        with self._cond:
+            self._stopped = False
+            self._start_worker()
+        return self
+
+    def _start_worker(self):
+        """Start the worker unless it is running (call with the lock held)"""
+        if self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._worker, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout=1.0):
+        """
+        Stop the worker thread after it drains the queue
+
+        Args:
+            timeout: Max seconds to wait for pending actions
+        """
+        with self._cond:
+            self._running = False
+            self._stopped = True
+            thread, self._thread = self._thread, None
+            self._cond.notify_all()
+        if thread is not None:
+            thread.join(timeout)
+
+    def dispatch(self, action, trace=None):
+        """
+        Queue an action without blocking
+
+        Args:
+            action: Action string (from ActionMapper)
+            trace: Optional object passed to on_complete after execution
+                   (or to on_discard if the action is coalesced or dropped)
+
+        Returns:
+            True if queued or merged into a pending action, False after stop()
+        """
+        if not action:
+            return False
+
+        with self._cond:
+            stopped = self._stopped
+            if stopped:
+                merged, dropped = False, trace  # Reported as dropped: it never runs
+            else:
+                self.dispatched += 1
+                self._start_worker()
+
+                merged = (
+                    self.coalesce and action in self.COALESCE_ACTIONS
+                    and bool(self._queue) and self._queue[-1][0] == action
+                )
+                if merged:
+                    self._queue[-1][1] += 1
+                    self.coalesced += 1
+                else:
+                    dropped = self._make_room()
+                    self._queue.append([action, 1, time.perf_counter(), trace])
+                    self._cond.notify()
+
+        # Outside the lock, so the callback may take its own
+        if merged:
+            self._discard(trace, 'coalesced')
+        else:
+            self._discard(dropped, 'dropped')
+        return not stopped
+
+    def set_volume(self, level):
+        """
+        Queue an absolute volume level without blocking
+
+        Args:
+            level: Volume level (0.0 - 1.0) for backend.set_volume
+
+        Returns:
+            True if queued or merged into a pending level, False after stop()
+        """
+        with self._cond:
+            if self._stopped:
+                return False
+            self.dispatched += 1
+            self._start_worker()
+
+            if self._queue and self._queue[-1][0] == self.SET_VOLUME:
+                self._queue[-1][1] = level
+                self.coalesced += 1
+                return True
+
+            dropped = self._make_room()
+            self._queue.append([self.SET_VOLUME, level, time.perf_counter(), None])
+            self._cond.notify()
+
+        self._discard(dropped, 'dropped')
+        return True
+
+    def _make_room(self):
+        """
+        Drop the oldest pending action if the queue is full (call with the lock held)
+
+        Returns:
+            Trace of the dropped action, or None
+        """
+        if len(self._queue) < self.max_queue:
+            return None
+        self.dropped += 1
+        return self._queue.popleft()[3]
+
+    def _discard(self, trace, reason):
+        """Report a traced action that will never run"""
+        if trace is not None and self.on_discard is not None:
+            self.on_discard(trace, reason)
+
+    def _worker(self):
+        """Worker loop: execute queued actions in order"""
+        init_thread = getattr(self.backend, 'init_worker_thread', None)
+        if init_thread:
+            init_thread()
+
+        while True:
+            with self._cond:
+                while not self._queue and self._running:
+                    self._cond.wait()
+                if not self._queue:
+                    return
+                action, steps, enqueue_time, trace = self._queue.popleft()
+
+            start = time.perf_counter()
+            result = None
+            error = None
+            try:
+                if action == self.SET_VOLUME:
+                    result = self.backend.set_volume(steps)
+                else:
+                    result = self.backend.execute_action(action, steps=steps)
+            except Exception as e:
+                self.errors += 1
+                error = e
+                print(f"Error executing {action}: {e}")
+            end = time.perf_counter()
+
+            if trace is not None and self.on_complete is not None:
+                self.on_complete(trace, start, end, result, error)
+
+            latency = start - enqueue_time
+            self.executed += 1
+            self.last_latency = latency
+            self.max_latency = max(self.max_latency, latency)
+            self.total_latency += latency
+            self.last_execution_time = end - start
+
+    def queue_depth(self):
+        """Number of pending actions"""
+        with self._cond:
+            return len(self._queue)
+
+    def wait_idle(self, timeout=1.0):
+        """
+        Wait until the queue is empty (useful in tests and on shutdown)
+
+        Returns:
+            True if the queue drained within the timeout
+        """
+        deadline = time.perf_counter() + timeout
+        while time.perf_counter() < deadline:
+            with self._cond:
+                if not self._queue and self.executed + self.coalesced + self.dropped >= self.dispatched:
+                    return True
+            time.sleep(0.001)
+        return False
+
+    def get_stats(self):
+        """Get dispatch statistics (latencies in seconds)"""
+        return {
+            'queue_depth': self.queue_depth(),
+            'dispatched': self.dispatched,
+            'executed': self.executed,
+            'coalesced': self.coalesced,
+            'dropped': self.dropped,
+            'errors': self.errors,
+            'last_latency': self.last_latency,
+            'mean_latency': self.total_latency / self.executed if self.executed else 0.0,
+            'max_latency': self.max_latency,
+            'last_execution_time': self.last_execution_time,
+        }
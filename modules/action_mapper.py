@@ -18,6 +18,9 @@ class ActionMapper:
     PREVIOUS_TRACK = "previous_track"
     MUTE = "mute"
     UNMUTE = "unmute"
+    LIKE_TRACK = "like_track"      # SpotifyController only
+    OPEN_QUEUE = "open_queue"      # SpotifyController only
+    SET_VOLUME = "set_volume"      # VolumeKnob (absolute level, not a mapped action)
     
     # Default gesture-to-action mapping
     DEFAULT_MAPPING = {
@@ -28,14 +31,51 @@ class ActionMapper:
         4: PREVIOUS_TRACK,     # V_SIGN (left)
     }
     
-    def __init__(self, custom_mapping=None):
+    # Default two-hand chords: (left hand class, right hand class) -> action
+    DEFAULT_CHORDS = {
+        (1, 1): MUTE,          # FIST + FIST
+        (0, 0): UNMUTE,        # PALM + PALM
+    }
+    
+    # Chords for a SpotifyController backend (pass as custom_chords)
+    SPOTIFY_CHORDS = {
+        (1, 3): LIKE_TRACK,    # FIST + POINT
+        (1, 4): OPEN_QUEUE,    # FIST + V_SIGN
+    }
+    
+    # Default motion gestures (MotionGestureRecognizer) -> action
+    DEFAULT_MOTIONS = {
+        "swipe_right": NEXT_TRACK,
+        "swipe_left": PREVIOUS_TRACK,
+        "swipe_up": VOLUME_UP,
+        "swipe_down": VOLUME_DOWN,
+        "push": PLAY_PAUSE,
+        "pull": MUTE,
+    }
+    
+    # Motions for a SpotifyController backend (pass as custom_motions)
+    SPOTIFY_MOTIONS = {
+        "swipe_right": NEXT_TRACK,
+        "swipe_left": PREVIOUS_TRACK,
+        "swipe_up": VOLUME_UP,
+        "swipe_down": VOLUME_DOWN,
+        "push": PLAY_PAUSE,
+        "circle_cw": LIKE_TRACK,
+        "circle_ccw": OPEN_QUEUE,
+    }
+    
+    def __init__(self, custom_mapping=None, custom_chords=None, custom_motions=None):
         """
         Initialize action mapper
         
         Args:
             custom_mapping: Dict of {gesture_class: action}
+            custom_chords: Dict of {(left_class, right_class): action}
+            custom_motions: Dict of {motion_name: action}
         """
         self.mapping = custom_mapping if custom_mapping else self.DEFAULT_MAPPING.copy()
+        self.chords = custom_chords if custom_chords else self.DEFAULT_CHORDS.copy()
+        self.motions = custom_motions if custom_motions else self.DEFAULT_MOTIONS.copy()
         self.last_action = None
         self.action_counter = 0
     
@@ -58,6 +98,50 @@ class ActionMapper:
         self.action_counter += 1
         return action
     
+    def get_chord_action(self, chord):
+        """
+        Get action for a two-hand chord (a single dict lookup)
+        
+        Args:
+            chord: (left_class, right_class) tuple of smoothed gesture classes
+            
+        Returns:
+            Action string, or None if the combination is not a chord
+        """
+        action = self.chords.get(chord)
+        
+        if action and action != self.last_action:
+            self.last_action = action
+            self.action_counter = 0
+        
+        if action:
+            self.action_counter += 1
+        return action
+    
+    def get_motion_action(self, motion):
+        """
+        Get action for a motion gesture
+        
+        Args:
+            motion: Motion name (e.g. "swipe_right")
+            
+        Returns:
+            Action string, or None if the motion is not mapped
+        """
+        return self.motions.get(motion)
+    
+    def set_chord_mapping(self, left_class, right_class, action):
+        """
+        Set custom mapping for a two-hand chord
+        
+        Args:
+            left_class: Gesture class of the left hand
+            right_class: Gesture class of the right hand
+            action: Action to map to
+        """
+        self.chords[(left_class, right_class)] = action
+        print(f"Mapped chord ({left_class}, {right_class}) to {action}")
+    
     def set_custom_mapping(self, gesture_class, action):
         """
         Set custom mapping for a gesture
@@ -72,6 +156,8 @@ class ActionMapper:
     def reset_mapping(self):
         """Reset to default mapping"""
         self.mapping = self.DEFAULT_MAPPING.copy()
+        self.chords = self.DEFAULT_CHORDS.copy()
+        self.motions = self.DEFAULT_MOTIONS.copy()
         print("Mapping reset to default")
     
     def get_mapping(self):
@@ -97,5 +183,8 @@ class ActionMapper:
             ActionMapper.PREVIOUS_TRACK: "⏮️ Previous Track",
             ActionMapper.MUTE: "🔇 Mute",
             ActionMapper.UNMUTE: "🔊 Unmute",
+            ActionMapper.LIKE_TRACK: "❤️ Like Track",
+            ActionMapper.OPEN_QUEUE: "📋 Open Queue",
+            ActionMapper.SET_VOLUME: "🎚️ Volume Knob",
         }
         return descriptions.get(action, "Unknown Action")
@@ -0,0 +1,294 @@
+"""
+MODULE 3b: Compact Gesture Model
+Pure-NumPy inference for trained gesture classifiers
+Loads without importing scikit-learn, for fast start-up and per-frame prediction
+"""
+
+import os
+import numpy as np
+from config import GESTURE_NAMES
+
+
+def _fold_forest(model, scaler):
+    """
+    Flatten a fitted RandomForestClassifier into node arrays
+
+    The scaler is folded into the split thresholds:
+    (x - mean) / scale <= t  <=>  x <= t * scale + mean
+    Leaves become self-loops with an infinite threshold, so traversal
+    needs no leaf test and simply runs for max_depth steps.
+    """
+    mean = scaler.mean_
+    scale = scaler.scale_
+
+    features, thresholds, children, values, roots = [], [], [], [], []
+    offset = 0
+    max_depth = 0
+
+    for estimator in model.estimators_:
+        tree = estimator.tree_
+        n_nodes = tree.node_count
+        node_ids = np.arange(n_nodes)
+        is_leaf = tree.children_left == -1
+
+        feature = np.where(is_leaf, 0, tree.feature)
+        threshold = np.where(is_leaf, np.inf, tree.threshold * scale[feature] + mean[feature])
+        left = np.where(is_leaf, node_ids, tree.children_left) + offset
+        right = np.where(is_leaf, node_ids, tree.children_right) + offset
+
+        value = tree.value[:, 0, :]
+        value = value / value.sum(axis=1, keepdims=True)
+
+        features.append(feature)
+        thresholds.append(threshold)
+        children.append(np.stack([left, right], axis=1))
+        values.append(value)
+        roots.append(offset)
+
+        offset += n_nodes
+        max_depth = max(max_depth, tree.max_depth)
+
+    return {
+        'feature': np.concatenate(features).astype(np.intp),
+        'threshold': np.concatenate(thresholds).astype(np.float64),
+        'children': np.concatenate(children).astype(np.intp).ravel(),
+        'value': np.concatenate(values).astype(np.float64),
+        'roots': np.array(roots, dtype=np.intp),
+        'max_depth': np.array(max_depth),
+    }
+
+
+def _fold_mlp(model, scaler):
+    """
+    Extract MLPClassifier weights with the scaler folded into layer 0
+
+    ((x - mean) / scale) @ W + b  ==  x @ (W / scale) + (b - (mean / scale) @ W)
+    """
+    mean = scaler.mean_
+    scale = scaler.scale_
+
+    weights = [np.asarray(w, dtype=np.float64) for w in model.coefs_]
+    biases = [np.asarray(b, dtype=np.float64) for b in model.intercepts_]
+
+    biases[0] = biases[0] - (mean / scale) @ weights[0]
+    weights[0] = weights[0] / scale[:, None]
+
+    arrays = {
+        'n_layers': np.array(len(weights)),
+        'activation': np.array(model.activation),
+        'out_activation': np.array(model.out_activation_),
+    }
+    for i, (w, b) in enumerate(zip(weights, biases)):
+        arrays[f'W{i}'] = w
+        arrays[f'b{i}'] = b
+    return arrays
+
+
+def export_compact_model(model, scaler, path):
+    """
+    Export a fitted model and scaler to a self-contained .npz file
+
+    Args:
+        model: Fitted RandomForestClassifier or MLPClassifier
+        scaler: Fitted StandardScaler
+        path: Output file path (should end in .npz)
+
+    Raises:
+        ValueError: If the model type has no compact representation
+    """
+    if hasattr(model, 'estimators_') and hasattr(model.estimators_[0], 'tree_'):
+        kind = 'random_forest'
+        arrays = _fold_forest(model, scaler)
+    elif hasattr(model, 'coefs_'):
+        kind = 'neural_network'
+        arrays = _fold_mlp(model, scaler)
+    else:
+        raise ValueError(f"Compact export not supported for {type(model).__name__}")
+
+    np.savez(path, kind=np.array(kind), classes=np.asarray(model.classes_), **arrays)
+
+
+def compact_model_path(model_path):
+    """
+    Find an up-to-date compact export of a saved model
+
+    A {model_path}_compact.npz older than {model_path}.pkl was left behind
+    by an earlier training run (save_model without export_compact) and
+    would silently load the old model, so it is ignored.
+
+    Args:
+        model_path: Model path without extension (as passed to save_model)
+
+    Returns:
+        Path of the .npz file, or None if missing or stale
+    """
+    compact_path = f"{model_path}_compact.npz"
+    if not os.path.exists(compact_path):
+        return None
+    pkl_path = f"{model_path}.pkl"
+    if os.path.exists(pkl_path) and os.path.getmtime(compact_path) < os.path.getmtime(pkl_path):
+        return None
+    return compact_path
+
+
+_ACTIVATIONS = {
+    'identity': lambda x: x,
+    'relu': lambda x: np.maximum(x, 0, out=x),
+    'tanh': np.tanh,
+    'logistic': lambda x: 1.0 / (1.0 + np.exp(-x)),
+}
+
+
+class CompactGestureModel:
+    """
+    NumPy-only gesture model loaded from export_compact_model output
+    Drop-in replacement for a trained GestureClassifier at runtime
+    """
+
+    GESTURES = GESTURE_NAMES  # Shared with the rest of the app; GestureClassifier would pull in sklearn
+
+    def __init__(self, path=None):
+        """
+        Initialize compact model
+
+        Args:
+            path: Optional .npz file to load immediately
+        """
+        self.kind = None
+        self.classes = None
+        self.is_trained = False
+        if path is not None:
+            self.load(path)
+
+    def load(self, path):
+        """
+        Load compact model from disk
+
+        Args:
+            path: Path to .npz file written by export_compact_model
+        """
+        with np.load(path, allow_pickle=False) as data:
+            self.kind = str(data['kind'])
+            self.classes = data['classes']
+
+            if self.kind == 'random_forest':
+                # Each node gets two consecutive slots (left, right) so one
+                # traversal step is a single gather: slot = children[slot + go_right]
+                self.feature = np.repeat(data['feature'], 2)
+                self.threshold = np.repeat(data['threshold'], 2)
+                self.children = 2 * data['children']
+                self.roots = 2 * data['roots']
+                self.n_trees = len(self.roots)
+                self.value = data['value'] / self.n_trees
+                self.max_depth = int(data['max_depth'])
+            elif self.kind == 'neural_network':
+                n_layers = int(data['n_layers'])
+                self.weights = [data[f'W{i}'] for i in range(n_layers)]
+                self.biases = [data[f'b{i}'] for i in range(n_layers)]
+                self.activation = _ACTIVATIONS[str(data['activation'])]
+                self.out_activation = str(data['out_activation'])
+            else:
+                raise ValueError(f"Unknown compact model kind: {self.kind}")
+
+        self.is_trained = True
+        print(f"Compact model loaded from {path}")
+
+    def _forest_proba_single(self, x):
+        """Class probabilities (n_classes,) for one sample; the per-frame hot path"""
+        slots = self.roots
+        for _ in range(self.max_depth):
+            slots = self.children.take(slots + (x.take(self.feature.take(slots)) > self.threshold.take(slots)))
+        return self.value.take(slots >> 1, axis=0).sum(axis=0)
+
+    def _forest_proba(self, X):
+        """Class probabilities (n_samples, n_classes) for the flattened forest"""
+        n_samples, n_features = X.shape
+        X_flat = X.ravel()
+        row_offsets = (np.arange(n_samples) * n_features)[:, None]
+        slots = np.broadcast_to(self.roots, (n_samples, self.n_trees))
+        for _ in range(self.max_depth):
+            values = X_flat.take(row_offsets + self.feature.take(slots))
+            slots = self.children.take(slots + (values > self.threshold.take(slots)))
+        return self.value.take(slots >> 1, axis=0).sum(axis=1)
+
+    def _mlp_proba(self, X):
+        """Class probabilities (n_samples, n_classes) for the MLP"""
+        h = X
+        last = len(self.weights) - 1
+        for i, (w, b) in enumerate(zip(self.weights, self.biases)):
+            h = h @ w + b
+            if i < last:
+                h = self.activation(h)
+
+        if self.out_activation == 'softmax':
+            h = np.exp(h - h.max(axis=1, keepdims=True))
+            return h / h.sum(axis=1, keepdims=True)
+
+        # Binary problem: single logistic output
+        p = 1.0 / (1.0 + np.exp(-h[:, 0]))
+        return np.stack([1 - p, p], axis=1)
+
+    def predict_proba(self, X):
+        """
+        Class probabilities for raw (unscaled) features
+
+        Args:
+            X: Feature matrix (n_samples, n_features)
+
+        Returns:
+            Probability matrix (n_samples, n_classes), columns ordered as self.classes
+        """
+        X = np.asarray(X, dtype=np.float64)
+        if self.kind == 'random_forest':
+            return self._forest_proba(X)
+        return self._mlp_proba(X)
+
+    def predict(self, features):
+        """
+        Predict gesture from features
+
+        Args:
+            features: Feature vector (n_features,)
+
+        Returns:
+            Tuple of (gesture_class, confidence)
+        """
+        if not self.is_trained:
+            raise ValueError("Model must be loaded before prediction")
+
+        if self.kind == 'random_forest':
+            probabilities = self._forest_proba_single(np.asarray(features, dtype=np.float64).ravel())
+        else:
+            probabilities = self._mlp_proba(np.asarray(features, dtype=np.float64).reshape(1, -1))[0]
+        best = np.argmax(probabilities)
+        return self.classes[best], probabilities[best]
+
+    def predict_batch(self, X):
+        """
+        Predict multiple samples
+
+        Args:
+            X: Feature matrix (n_samples, n_features)
+
+        Returns:
+            predictions: Array of gesture classes
+            confidences: Array of confidence scores
+        """
+        if not self.is_trained:
+            raise ValueError("Model must be loaded before prediction")
+
+        probabilities = self.predict_proba(X)
+        best = np.argmax(probabilities, axis=1)
+        return self.classes[best], probabilities[np.arange(len(best)), best]
+
+    def get_gesture_name(self, gesture_class):
+        """
+        Get gesture name from class
+
+        Args:
+            gesture_class: Gesture class index
+
+        Returns:
+            Gesture name string
+        """
+        return self.GESTURES.get(gesture_class, "UNKNOWN")
@@ -0,0 +1,348 @@
+"""
+MODULE 8: Gesture Dataset Store
+Append-only, memory-mappable storage for collected gesture samples
+
+Layout (one directory per gesture, e.g. data/0_PALM/):
+    features.bin   - float32 rows of n_features
+    landmarks.bin  - float32 rows of 21 x 3
+    index.bin      - one INDEX_DTYPE record per sample (label, session, timestamp)
+
+Rows are appended in place, so saving a sample is O(1) and loading a
+gesture is a single np.memmap instead of one np.load per sample.
+The index is written last and defines the sample count; rows left in
+the column files by an interrupted write are cut off before the next
+append, so the columns stay aligned.
+
+Per-sample .npy files from older collections (features_{id}.npy,
+landmarks_{id}.npy) can be imported with convert_legacy(); the imported
+sample IDs are listed in legacy_imported.txt, so files kept after the
+import are neither imported again nor loaded next to the store.
+"""
+
+import os
+import time
+import numpy as np
+
+
+class GestureDatasetStore:
+    """
+    Columnar dataset store for gesture samples
+    """
+
+    FEATURES_FILE = "features.bin"
+    LANDMARKS_FILE = "landmarks.bin"
+    INDEX_FILE = "index.bin"
+    IMPORTED_FILE = "legacy_imported.txt"
+
+    LANDMARK_SHAPE = (21, 3)
+    INDEX_DTYPE = np.dtype([
+        ('label', '<i4'),
+        ('session', '<i4'),
+        ('timestamp', '<f8'),
+    ])
+
+    def __init__(self, data_dir="data", gestures=None, n_features=9):
+        """
+        Initialize dataset store
+
+        Args:
+            data_dir: Root data directory
+            gestures: Dict of {gesture_id: gesture_name}
+            n_features: Length of each feature vector
+        """
+        self.data_dir = data_dir
+        self.gestures = gestures if gestures else {
+            0: "PALM",
+            1: "FIST",
+            2: "PINCH",
+            3: "POINT",
+            4: "V_SIGN",
+        }
+        self.n_features = n_features
+
+        for gesture_id in self.gestures:
+            os.makedirs(self._gesture_dir(gesture_id), exist_ok=True)
+
+    def _gesture_dir(self, gesture_id):
+        """Directory holding one gesture's files"""
+        return os.path.join(self.data_dir, f"{gesture_id}_{self.gestures[gesture_id]}")
+
+    def _path(self, gesture_id, filename):
+        return os.path.join(self._gesture_dir(gesture_id), filename)
+
+    def count(self, gesture_id):
+        """
+        Number of stored samples for a gesture (O(1), from the index size)
+
+        Args:
+            gesture_id: Gesture class index
+        """
+        path = self._path(gesture_id, self.INDEX_FILE)
+        if not os.path.exists(path):
+            return 0
+        return os.path.getsize(path) // self.INDEX_DTYPE.itemsize
+
+    def _row_sizes(self):
+        """Bytes per row of each file"""
+        return {
+            self.FEATURES_FILE: self.n_features * 4,
+            self.LANDMARKS_FILE: int(np.prod(self.LANDMARK_SHAPE)) * 4,
+            self.INDEX_FILE: self.INDEX_DTYPE.itemsize,
+        }
+
+    def _truncate_to_count(self, gesture_id):
+        """
+        Drop partial or orphan rows after an interrupted append
+
+        Args:
+            gesture_id: Gesture class index
+
+        Returns:
+            Number of files truncated
+        """
+        n = self.count(gesture_id)
+        truncated = 0
+        for filename, row_size in self._row_sizes().items():
+            path = self._path(gesture_id, filename)
+            if os.path.exists(path) and os.path.getsize(path) > n * row_size:
+                with open(path, "r+b") as f:
+                    f.truncate(n * row_size)
+                truncated += 1
+        return truncated
+
+    def total_count(self):
+        """Number of stored samples across all gestures"""
+        return sum(self.count(gesture_id) for gesture_id in self.gestures)
+
+    def new_session(self):
+        """
+        Allocate a session ID one higher than any stored so far
+
+        Returns:
+            Session ID (int)
+        """
+        last = -1
+        for gesture_id in self.gestures:
+            index = self._memmap(gesture_id, self.INDEX_FILE, self.INDEX_DTYPE, ())
+            if index is not None and len(index) > 0:
+                last = max(last, int(index['session'].max()))
+        return last + 1
+
+    def append(self, gesture_id, features, landmarks, timestamp=None, session_id=0):
+        """
+        Append one sample
+
+        Args:
+            gesture_id: Gesture class index
+            features: Feature vector (n_features,)
+            landmarks: Landmark array (21, 3)
+            timestamp: Capture time (defaults to now)
+            session_id: Collection session ID
+
+        Returns:
+            Sample ID within the gesture
+        """
+        self.append_batch(
+            gesture_id,
+            np.asarray(features)[None],
+            np.asarray(landmarks)[None],
+            None if timestamp is None else [timestamp],
+            session_id,
+        )
+        return self.count(gesture_id) - 1
+
+    def append_batch(self, gesture_id, features, landmarks, timestamps=None, session_id=0):
+        """
+        Append many samples in one write per file
+
+        Args:
+            gesture_id: Gesture class index
+            features: Feature matrix (N, n_features)
+            landmarks: Landmark array (N, 21, 3)
+            timestamps: Capture times (N,), defaults to now
+            session_id: Collection session ID
+        """
+        features = np.ascontiguousarray(features, dtype=np.float32).reshape(-1, self.n_features)
+        landmarks = np.ascontiguousarray(landmarks, dtype=np.float32).reshape((-1,) + self.LANDMARK_SHAPE)
+        if len(features) != len(landmarks):
+            raise ValueError("features and landmarks must have the same number of samples")
+
+        index = np.empty(len(features), dtype=self.INDEX_DTYPE)
+        index['label'] = gesture_id
+        index['session'] = session_id
+        index['timestamp'] = time.time() if timestamps is None else timestamps
+
+        # Index last: a sample only counts once all of its columns are written,
+        # and leftovers of an earlier interrupted append are dropped first
+        self._truncate_to_count(gesture_id)
+        for filename, array in [
+            (self.FEATURES_FILE, features),
+            (self.LANDMARKS_FILE, landmarks),
+            (self.INDEX_FILE, index),
+        ]:
+            with open(self._path(gesture_id, filename), "ab") as f:
+                f.write(array.tobytes())
+
+    def _memmap(self, gesture_id, filename, dtype, row_shape):
+        """Read-only memmap over the first count() rows of a file, or None"""
+        n = self.count(gesture_id)
+        path = self._path(gesture_id, filename)
+        if n == 0 or not os.path.exists(path):
+            return None
+        return np.memmap(path, dtype=dtype, mode='r', shape=(n,) + row_shape)
+
+    def load_gesture(self, gesture_id):
+        """
+        Memory-map one gesture's samples
+
+        Args:
+            gesture_id: Gesture class index
+
+        Returns:
+            features: (N, n_features) float32
+            landmarks: (N, 21, 3) float32
+            index: (N,) INDEX_DTYPE records
+            (all None if the gesture has no samples)
+        """
+        return (
+            self._memmap(gesture_id, self.FEATURES_FILE, np.float32, (self.n_features,)),
+            self._memmap(gesture_id, self.LANDMARKS_FILE, np.float32, self.LANDMARK_SHAPE),
+            self._memmap(gesture_id, self.INDEX_FILE, self.INDEX_DTYPE, ()),
+        )
+
+    def load_dataset(self, use_landmarks=False):
+        """
+        Load all gestures as a training dataset
+
+        Args:
+            use_landmarks: Return landmarks (N, 21, 3) instead of features
+
+        Returns:
+            X: Feature matrix (or landmark array)
+            y: Label vector
+        """
+        X = []
+        y = []
+        for gesture_id in sorted(self.gestures):
+            features, landmarks, index = self.load_gesture(gesture_id)
+            if index is None:
+                continue
+            X.append(landmarks if use_landmarks else features)
+            y.append(index['label'])
+
+        if not X:
+            shape = (0,) + self.LANDMARK_SHAPE if use_landmarks else (0, self.n_features)
+            return np.empty(shape, dtype=np.float32), np.empty(0, dtype=np.int32)
+        return np.concatenate(X), np.concatenate(y)
+
+    def _imported_ids(self, gesture_id):
+        """Legacy sample IDs already imported into the store"""
+        path = self._path(gesture_id, self.IMPORTED_FILE)
+        if not os.path.exists(path):
+            return set()
+        with open(path) as f:
+            return {int(line) for line in f if line.strip()}
+
+    def _legacy_sample_ids(self, gesture_id):
+        """Sorted IDs of legacy features_{id}.npy files not imported yet"""
+        imported = self._imported_ids(gesture_id)
+        return sorted(
+            sample_id for sample_id in (
+                int(f[len("features_"):-len(".npy")])
+                for f in os.listdir(self._gesture_dir(gesture_id))
+                if f.startswith("features_") and f.endswith(".npy")
+            )
+            if sample_id not in imported
+        )
+
+    def has_legacy_files(self):
+        """Check for per-sample .npy files from older collections that are not imported yet"""
+        return any(self._legacy_sample_ids(gesture_id) for gesture_id in self.gestures)
+
+    def load_legacy(self, use_landmarks=False):
+        """
+        Load the legacy per-sample files that are not imported yet, one by one
+
+        Args:
+            use_landmarks: Load landmarks_{id}.npy instead of features_{id}.npy
+
+        Returns:
+            X: Feature matrix (or landmark array)
+            y: Label vector
+        """
+        prefix = "landmarks_" if use_landmarks else "features_"
+        X = []
+        y = []
+        for gesture_id in sorted(self.gestures):
+            gesture_dir = self._gesture_dir(gesture_id)
+            for sample_id in self._legacy_sample_ids(gesture_id):
+                path = os.path.join(gesture_dir, f"{prefix}{sample_id}.npy")
+                if os.path.exists(path):
+                    X.append(np.load(path))
+                    y.append(gesture_id)
+
+        if not X:
+            shape = (0,) + self.LANDMARK_SHAPE if use_landmarks else (0, self.n_features)
+            return np.empty(shape, dtype=np.float32), np.empty(0, dtype=np.int32)
+        return np.array(X, dtype=np.float32), np.array(y, dtype=np.int32)
+
+    def convert_legacy(self, remove=False):
+        """
+        Import per-sample features_{id}.npy / landmarks_{id}.npy files
+        Imported IDs are recorded, so running it again imports nothing twice
+
+        Args:
+            remove: Delete the .npy files after importing them
+
+        Returns:
+            Number of samples converted
+        """
+        converted = 0
+        session_id = self.new_session()
+
+        for gesture_id in sorted(self.gestures):
+            gesture_dir = self._gesture_dir(gesture_id)
+
+            features = []
+            landmarks = []
+            timestamps = []
+            imported = []
+            used_files = []
+            for sample_id in self._legacy_sample_ids(gesture_id):
+                feature_file = os.path.join(gesture_dir, f"features_{sample_id}.npy")
+                landmarks_file = os.path.join(gesture_dir, f"landmarks_{sample_id}.npy")
+                if not os.path.exists(landmarks_file):
+                    print(f"⚠️  Skipping sample {sample_id} of {self.gestures[gesture_id]}: no landmarks file")
+                    continue
+                features.append(np.load(feature_file))
+                landmarks.append(np.load(landmarks_file))
+                timestamps.append(os.path.getmtime(feature_file))
+                imported.append(sample_id)
+                used_files.extend([feature_file, landmarks_file])
+
+            if not features:
+                continue
+
+            self.append_batch(gesture_id, np.array(features), np.array(landmarks), timestamps, session_id)
+            with open(self._path(gesture_id, self.IMPORTED_FILE), "a") as f:
+                f.write("".join(f"{sample_id}\n" for sample_id in imported))
+            converted += len(features)
+
+            if remove:
+                for path in used_files:
+                    os.remove(path)
+
+        return converted
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Convert per-sample .npy data to the dataset store')
+    parser.add_argument('--data-dir', default='data', help='Data directory')
+    parser.add_argument('--remove', action='store_true', help='Delete .npy files after converting')
+    args = parser.parse_args()
+
+    store = GestureDatasetStore(args.data_dir)
+    converted = store.convert_legacy(remove=args.remove)
+    print(f"✓ Converted {converted} samples ({store.total_count()} now in store)")
@@ -20,12 +20,26 @@ class FeatureExtractor:
     RING_TIP = 16
     PINKY_TIP = 20
     
+    MIDDLE_MCP = 9
+    
     THUMB_IP = 3
     INDEX_PIP = 6
     MIDDLE_PIP = 10
     RING_PIP = 14
     PINKY_PIP = 18
     
+    # Finger (tip, pip) pairs used for the open-finger count
+    FINGER_PAIRS = [
+        (THUMB_TIP, THUMB_IP),
+        (INDEX_TIP, INDEX_PIP),
+        (MIDDLE_TIP, MIDDLE_PIP),
+        (RING_TIP, RING_PIP),
+        (PINKY_TIP, PINKY_PIP),
+    ]
+    
+    # Key points compared in extract_all_distances
+    KEY_POINTS = [WRIST, THUMB_TIP, INDEX_TIP, MIDDLE_TIP, RING_TIP, PINKY_TIP]
+    
     def __init__(self):
         self.landmarks = None
     
@@ -87,6 +101,8 @@ class FeatureExtractor:
         Returns:
             Feature vector (numpy array)
         """
+        # Computed in float64 like extract_features_batch, whatever the input dtype
+        landmarks = np.asarray(landmarks, dtype=np.float64)
         self.landmarks = landmarks
         features = []
         
@@ -151,6 +167,28 @@ class FeatureExtractor:
         
         return np.array(features, dtype=np.float32)
     
+    @staticmethod
+    def pinch_ratio(landmarks):
+        """
+        Thumb-index distance normalized by palm length (wrist to middle-finger base)
+        
+        Independent of how far the hand is from the camera: about 0.1-0.2
+        when pinched and above 1 with thumb and index spread wide.
+        
+        Args:
+            landmarks: Array of 21 (x, y, z) points
+            
+        Returns:
+            Pinch ratio (0.0 for a degenerate hand)
+        """
+        thumb, index = landmarks[FeatureExtractor.THUMB_TIP], landmarks[FeatureExtractor.INDEX_TIP]
+        wrist, middle = landmarks[FeatureExtractor.WRIST], landmarks[FeatureExtractor.MIDDLE_MCP]
+        palm = sqrt((wrist[0] - middle[0])**2 + (wrist[1] - middle[1])**2 + (wrist[2] - middle[2])**2)
+        if palm == 0:
+            return 0.0
+        pinch = sqrt((thumb[0] - index[0])**2 + (thumb[1] - index[1])**2 + (thumb[2] - index[2])**2)
+        return float(pinch / palm)
+    
     def extract_all_distances(self, landmarks):
         """
         Extract ALL pairwise distances between key points
@@ -162,14 +200,12 @@ class FeatureExtractor:
         Returns:
             Feature vector with all distances
         """
+        landmarks = np.asarray(landmarks, dtype=np.float64)
         self.landmarks = landmarks
         features = []
         
         # Key points to compare
-        key_points = [
-            self.WRIST, self.THUMB_TIP, self.INDEX_TIP, 
-            self.MIDDLE_TIP, self.RING_TIP, self.PINKY_TIP
-        ]
+        key_points = self.KEY_POINTS
         
         # Get all pairwise distances
         for i in range(len(key_points)):
@@ -181,3 +217,88 @@ class FeatureExtractor:
                 features.append(dist)
         
         return np.array(features, dtype=np.float32)
+    
+    # ==================== BATCH (VECTORIZED) EXTRACTION ====================
+    
+    @staticmethod
+    def _batch_distance(a, b):
+        """Row-wise Euclidean distance between two (N, 3) arrays"""
+        return np.sqrt(np.sum((a - b) ** 2, axis=-1))
+    
+    @staticmethod
+    def _batch_angle(p1, p2, p3):
+        """
+        Row-wise angle at p2 formed by p1-p2-p3 (degrees)
+        Degenerate (zero-length) vectors give 0, same as angle_between_points
+        """
+        v1 = p1 - p2
+        v2 = p3 - p2
+        dot_product = np.sum(v1 * v2, axis=-1)
+        mags = np.sqrt(np.sum(v1 ** 2, axis=-1)) * np.sqrt(np.sum(v2 ** 2, axis=-1))
+        
+        valid = mags != 0
+        cos_angle = np.divide(dot_product, mags, out=np.zeros_like(dot_product), where=valid)
+        angles = np.degrees(np.arccos(np.clip(cos_angle, -1, 1)))
+        return np.where(valid, angles, 0.0)
+    
+    def extract_features_batch(self, landmarks):
+        """
+        Vectorized version of extract_features for many hands at once
+        
+        Args:
+            landmarks: Array of shape (N, 21, 3)
+            
+        Returns:
+            Feature matrix (N, 9), row i equal to extract_features(landmarks[i])
+        """
+        lm = np.asarray(landmarks, dtype=np.float64)
+        if lm.ndim != 3 or lm.shape[1:] != (21, 3):
+            raise ValueError(f"Expected landmarks of shape (N, 21, 3), got {lm.shape}")
+        
+        features = np.empty((lm.shape[0], 9), dtype=np.float64)
+        
+        # 1-3. Pinch and palm-openness distances
+        features[:, 0] = self._batch_distance(lm[:, self.THUMB_TIP], lm[:, self.INDEX_TIP])
+        features[:, 1] = self._batch_distance(lm[:, self.THUMB_TIP], lm[:, self.MIDDLE_TIP])
+        features[:, 2] = self._batch_distance(lm[:, self.INDEX_TIP], lm[:, self.PINKY_TIP])
+        
+        # 4. Number of fingers open (tip above PIP joint)
+        tips, pips = zip(*self.FINGER_PAIRS)
+        features[:, 3] = np.sum(lm[:, tips, 1] < lm[:, pips, 1], axis=1)
+        
+        # 5. Wrist position
+        features[:, 4] = lm[:, self.WRIST, 0]
+        features[:, 5] = lm[:, self.WRIST, 1]
+        
+        # 6-7. Angles
+        features[:, 6] = self._batch_angle(
+            lm[:, self.THUMB_IP], lm[:, self.THUMB_TIP], lm[:, self.INDEX_TIP]
+        )
+        features[:, 7] = self._batch_angle(
+            lm[:, self.INDEX_TIP], lm[:, self.MIDDLE_TIP], lm[:, self.RING_TIP]
+        )
+        
+        # 8. Hand size
+        features[:, 8] = self._batch_distance(lm[:, self.WRIST], lm[:, self.INDEX_TIP])
+        
+        return features.astype(np.float32)
+    
+    def extract_all_distances_batch(self, landmarks):
+        """
+        Vectorized version of extract_all_distances
+        
+        Args:
+            landmarks: Array of shape (N, 21, 3)
+            
+        Returns:
+            Distance matrix (N, 15) in the same pair order as extract_all_distances
+        """
+        lm = np.asarray(landmarks, dtype=np.float64)
+        if lm.ndim != 3 or lm.shape[1:] != (21, 3):
+            raise ValueError(f"Expected landmarks of shape (N, 21, 3), got {lm.shape}")
+        
+        i, j = np.triu_indices(len(self.KEY_POINTS), k=1)
+        key_points = np.array(self.KEY_POINTS)
+        distances = self._batch_distance(lm[:, key_points[i]], lm[:, key_points[j]])
+        
+        return distances.astype(np.float32)
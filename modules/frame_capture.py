@@ -0,0 +1,293 @@
+"""
+MODULE 7: Threaded Frame Capture
+Reads frames on a background thread so capture never waits on inference
+Sources: webcam ID, video file, or a directory of images
+"""
+
+import os
+import threading
+import time
+import cv2
+
+
+class ImageFolderCapture:
+    """
+    cv2.VideoCapture-like reader over a directory of images
+    Frames are returned in sorted filename order
+    """
+
+    IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.bmp')
+
+    def __init__(self, directory):
+        """
+        Initialize image folder reader
+
+        Args:
+            directory: Directory containing image files
+        """
+        self.directory = directory
+        self.files = sorted(
+            os.path.join(directory, f) for f in os.listdir(directory)
+            if f.lower().endswith(self.IMAGE_EXTENSIONS)
+        )
+        self.index = 0
+
+    def isOpened(self):
+        """True while the folder holds at least one image"""
+        return len(self.files) > 0
+
+    def read(self):
+        """
+        Read the next image
+
+        Returns:
+            Tuple of (success, frame)
+        """
+        while self.index < len(self.files):
+            frame = cv2.imread(self.files[self.index])
+            self.index += 1
+            if frame is not None:
+                return True, frame
+        return False, None
+
+    def release(self):
+        """Nothing to release; kept for VideoCapture compatibility"""
+        self.index = len(self.files)
+
+    def get(self, prop):
+        """Capture properties are not available for image folders"""
+        return 0.0
+
+    def set(self, prop, value):
+        """Capture properties cannot be changed for image folders"""
+        return False
+
+
+def open_capture(source):
+    """
+    Open a frame source
+
+    Args:
+        source: Camera ID (int or digit string), video file path, or image directory
+
+    Returns:
+        Object with VideoCapture-style isOpened/read/release methods
+    """
+    if isinstance(source, int):
+        return cv2.VideoCapture(source)
+    if isinstance(source, str) and source.isdigit():
+        return cv2.VideoCapture(int(source))
+    if os.path.isdir(source):
+        return ImageFolderCapture(source)
+    return cv2.VideoCapture(source)
+
+
+class ThreadedCapture:
+    """
+    Producer thread that keeps only the newest frame
+
+    With drop_stale=True (live camera) a frame not yet consumed is
+    overwritten by the next one, so read() always returns the freshest
+    frame. With drop_stale=False (files, benchmarks) the producer waits
+    for the consumer instead, so every frame is processed exactly once.
+    """
+
+    def __init__(self, source=0, drop_stale=None):
+        """
+        Initialize threaded capture
+
+        Args:
+            source: Camera ID, video file path, or image directory
+            drop_stale: Drop unconsumed frames (default: True for cameras only)
+        """
+        self.source = source
+        self.cap = open_capture(source)
+        if drop_stale is None:
+            drop_stale = isinstance(source, int) or (isinstance(source, str) and source.isdigit())
+        self.drop_stale = drop_stale
+
+        # Single-slot buffer
+        self._frame = None
+        self._frame_time = 0.0
+        self._has_frame = False
+        self._finished = False
+        self._running = False
+        self._release_on_exit = False
+        self._cond = threading.Condition()
+        self._thread = None
+
+        # Property changes queued by set(), applied on the producer thread
+        self._pending_props = []
+
+        # Timestamp (time.perf_counter) of the frame last returned by read()
+        self.last_frame_time = 0.0
+
+        # Statistics
+        self.frames_captured = 0
+        self.frames_dropped = 0
+        self.frames_read = 0
+
+    def isOpened(self):
+        """Check if the underlying source opened"""
+        return self.cap.isOpened()
+
+    def start(self):
+        """Start the producer thread"""
+        if self._running:
+            return self
+        self._running = True
+        self._thread = threading.Thread(target=self._update, daemon=True)
+        self._thread.start()
+        return self
+
+    @property
+    def finished(self):
+        """True once the source is exhausted or the producer thread has died"""
+        return self._finished or (self._thread is not None and not self._thread.is_alive())
+
+    def _update(self):
+        """Producer loop: read frames and publish them into the slot"""
+        try:
+            self._produce()
+        finally:
+            # A source that raised is as finished as one that ran out
+            with self._cond:
+                self._finished = True
+                release = self._release_on_exit
+                self._cond.notify_all()
+            if release:
+                self.cap.release()
+
+    def _produce(self):
+        """Read frames until the source ends or release() is called"""
+        while self._running:
+            self._apply_pending_props()
+            ret, frame = self.cap.read()
+            frame_time = time.perf_counter()
+
+            with self._cond:
+                if not ret:
+                    break
+
+                if not self.drop_stale:
+                    while self._has_frame and self._running:
+                        self._cond.wait(0.1)
+                elif self._has_frame:
+                    self.frames_dropped += 1
+
+                self._frame = frame
+                self._frame_time = frame_time
+                self._has_frame = True
+                self.frames_captured += 1
+                self._cond.notify_all()
+
+    def read(self, timeout=1.0):
+        """
+        Get the newest unread frame, waiting for one if necessary
+
+        Args:
+            timeout: Max seconds to wait for a new frame
+
+        Returns:
+            Tuple of (success, frame); success is False once the source is
+            exhausted or no frame arrived within the timeout. Only the
+            former is final: check `finished` to tell them apart (a camera
+            can take longer than the timeout to deliver its first frame)
+        """
+        if not self._running:
+            self.start()
+
+        with self._cond:
+            if not self._has_frame and not self._finished:
+                self._cond.wait_for(lambda: self._has_frame or self._finished, timeout)
+
+            if not self._has_frame:
+                return False, None
+
+            frame = self._frame
+            self.last_frame_time = self._frame_time
+            self._frame = None
+            self._has_frame = False
+            self.frames_read += 1
+            self._cond.notify_all()
+
+        return True, frame
+
+    def get(self, prop):
+        """Read a capture property (cv2.CAP_PROP_*)"""
+        return self.cap.get(prop)
+
+    def set(self, prop, value):
+        """
+        Change a capture property (cv2.CAP_PROP_*)
+
+        The change is applied by the producer thread before its next read,
+        so it never races with a read in progress.
+
+        Returns:
+            True (the change is queued, not yet applied)
+        """
+        with self._cond:
+            self._pending_props.append((prop, value))
+        if not self._running:
+            self._apply_pending_props()
+        return True
+
+    def _apply_pending_props(self):
+        """Apply queued property changes (producer thread, or directly before start)"""
+        with self._cond:
+            pending, self._pending_props = self._pending_props, []
+        for prop, value in pending:
+            self.cap.set(prop, value)
+
+    def release(self):
+        """
+        Stop the producer thread and release the source
+
+        A producer still blocked in cap.read() after the join timeout
+        releases the source itself once that read returns.
+        """
+        self._running = False
+        with self._cond:
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+        with self._cond:
+            if self._thread is not None and not self._finished:
+                self._release_on_exit = True
+                return
+        self.cap.release()
+
+    def get_stats(self):
+        """Get capture statistics"""
+        return {
+            'frames_captured': self.frames_captured,
+            'frames_read': self.frames_read,
+            'frames_dropped': self.frames_dropped,
+            'drop_stale': self.drop_stale,
+        }
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Measure raw capture throughput')
+    parser.add_argument('source', nargs='?', default='0', help='Camera ID, video file or image directory')
+    args = parser.parse_args()
+
+    capture = ThreadedCapture(args.source)
+    if not capture.isOpened():
+        print(f"Error: Cannot open source {args.source}")
+    else:
+        start = time.perf_counter()
+        while True:
+            ret, frame = capture.read()
+            if not ret and capture.finished:
+                break
+        elapsed = time.perf_counter() - start
+        capture.release()
+
+        stats = capture.get_stats()
+        fps = stats['frames_read'] / elapsed if elapsed > 0 else 0
+        print(f"✓ Read {stats['frames_read']} frames in {elapsed:.2f}s ({fps:.1f} FPS)")
+        print(f"  Dropped: {stats['frames_dropped']}")
@@ -0,0 +1,366 @@
+"""
+MODULE 10: Adaptive Frame Scheduling
+Skips hand detection and classification on frames where nothing changes,
+and drops into a low-power state when no hand has been seen for a while
+Motion is a frame difference on a tiny grayscale thumbnail, so the check
+costs far less than the inference it saves
+"""
+
+import time
+import cv2
+
+
+class MotionDetector:
+    """
+    Frame-to-frame motion on a downscaled grayscale thumbnail
+    """
+
+    def __init__(self, thumbnail_size=(32, 24)):
+        """
+        Initialize motion detector
+
+        Args:
+            thumbnail_size: (width, height) of the comparison thumbnail
+        """
+        self.thumbnail_size = thumbnail_size
+        self._prev_thumbnail = None
+
+    def measure(self, frame):
+        """
+        Mean absolute difference to the previous frame's thumbnail
+
+        Args:
+            frame: BGR or grayscale frame
+
+        Returns:
+            Motion score (0-255), 0 for the first frame
+        """
+        thumbnail = cv2.resize(frame, self.thumbnail_size, interpolation=cv2.INTER_AREA)
+        if thumbnail.ndim == 3:
+            thumbnail = cv2.cvtColor(thumbnail, cv2.COLOR_BGR2GRAY)
+
+        if self._prev_thumbnail is None or self._prev_thumbnail.shape != thumbnail.shape:
+            motion = 0.0
+        else:
+            motion = float(cv2.absdiff(thumbnail, self._prev_thumbnail).mean())
+        self._prev_thumbnail = thumbnail
+        return motion
+
+    def reset(self):
+        """Forget the reference thumbnail"""
+        self._prev_thumbnail = None
+
+
+class AdaptiveFrameScheduler:
+    """
+    Decide per frame whether to run inference
+
+    Every frame is processed while there is motion or the gesture keeps
+    changing. Once the gesture has been stable for stable_frames
+    inferences with no motion, the inference interval doubles up to
+    max_interval frames. Any motion above motion_threshold, or a gesture
+    change, drops it straight back to every frame.
+
+    Worst-case reaction latency: a frame is always processed when
+    max_latency seconds have passed since the last inference, whatever
+    the interval.
+    """
+
+    def __init__(self, enabled=True, max_interval=6, motion_threshold=4.0,
+                 stable_frames=15, max_latency=0.25, thumbnail_size=(32, 24)):
+        """
+        Initialize frame scheduler
+
+        Args:
+            enabled: False processes every frame (statistics still collected)
+            max_interval: Max frames between inferences when idle
+            motion_threshold: Mean absolute thumbnail difference (0-255) that counts as motion
+            stable_frames: Unchanged inferences before the interval starts growing
+            max_latency: Max seconds between inferences
+            thumbnail_size: (width, height) of the motion thumbnail
+        """
+        self.enabled = enabled
+        self.max_interval = max_interval
+        self.motion_threshold = motion_threshold
+        self.stable_frames = stable_frames
+        self.max_latency = max_latency
+        self.motion_detector = MotionDetector(thumbnail_size)
+
+        self.interval = 1
+        self.motion = 0.0
+        self._since_inference = 0
+        self._last_inference_time = None
+        self._last_gesture = None
+        self._stable_count = 0
+
+        # Statistics
+        self.frames_seen = 0
+        self.frames_processed = 0
+        self.frames_skipped = 0
+        self._start_time = None
+        self._last_frame_time = None
+
+    def should_process(self, frame, now=None):
+        """
+        Decide whether to run inference on this frame
+
+        Args:
+            frame: Current frame
+            now: Frame timestamp (time.perf_counter), defaults to now
+
+        Returns:
+            True to run detection and classification
+        """
+        if now is None:
+            now = time.perf_counter()
+        if self._start_time is None:
+            self._start_time = now
+        self._last_frame_time = now
+        self.frames_seen += 1
+        self._since_inference += 1
+
+        if self.enabled:
+            self.motion = self.motion_detector.measure(frame)
+            if self.motion >= self.motion_threshold:
+                self.interval = 1
+                self._stable_count = 0
+
+        due = (
+            not self.enabled
+            or self._last_inference_time is None
+            or self._since_inference >= self.interval
+            or now - self._last_inference_time >= self.max_latency
+        )
+
+        if due:
+            self._since_inference = 0
+            self._last_inference_time = now
+            self.frames_processed += 1
+        else:
+            self.frames_skipped += 1
+        return due
+
+    def update(self, gesture):
+        """
+        Report the gesture produced by a processed frame
+
+        Args:
+            gesture: Smoothed gesture (None when no hand)
+        """
+        if gesture != self._last_gesture:
+            self._last_gesture = gesture
+            self._stable_count = 0
+            self.interval = 1
+            return
+
+        self._stable_count += 1
+        if self._stable_count >= self.stable_frames and self.motion < self.motion_threshold:
+            self.interval = min(self.interval * 2, self.max_interval)
+
+    def max_gap(self, fps):
+        """
+        Longest planned time between inferences
+
+        Args:
+            fps: Capture frame rate
+
+        Returns:
+            Seconds between inferences on a static scene (one frame when disabled)
+        """
+        frame_time = 1.0 / fps
+        if not self.enabled:
+            return frame_time
+        return min(self.max_interval * frame_time, self.max_latency + frame_time)
+
+    def reset(self):
+        """Return to full rate and forget the motion reference"""
+        self.interval = 1
+        self._since_inference = 0
+        self._last_inference_time = None
+        self.motion_detector.reset()
+        self._stable_count = 0
+
+    def get_stats(self):
+        """Get capture vs inference rates"""
+        elapsed = 0.0
+        if self._start_time is not None:
+            elapsed = self._last_frame_time - self._start_time
+        return {
+            'interval': self.interval,
+            'motion': self.motion,
+            'frames_seen': self.frames_seen,
+            'frames_processed': self.frames_processed,
+            'frames_skipped': self.frames_skipped,
+            'capture_fps': (self.frames_seen - 1) / elapsed if elapsed > 0 else 0.0,
+            'inference_fps': (self.frames_processed - 1) / elapsed if elapsed > 0 else 0.0,
+        }
+
+
+class IdlePowerSaver:
+    """
+    Low-power state for when nobody is in front of the camera
+
+    After idle_timeout seconds without a hand, the capture is switched to
+    a lower resolution and frame rate and full inference stops. Frames are
+    then only checked for a hand on a downscaled copy, at most every
+    check_interval seconds, or immediately when the thumbnail shows motion
+    (a hand coming into view). A hand wakes the loop on that same frame
+    and the original capture settings are restored.
+
+    Usage in a capture loop:
+        if saver.skip_frame(frame, has_hand):
+            continue            # asleep, frame not processed
+        ... full processing ...
+        saver.update(hand_present)
+    """
+
+    CAPTURE_PROPS = (cv2.CAP_PROP_FRAME_WIDTH, cv2.CAP_PROP_FRAME_HEIGHT, cv2.CAP_PROP_FPS)
+
+    def __init__(self, capture=None, enabled=True, idle_timeout=30.0, check_interval=0.5,
+                 presence_width=160, low_power_size=(320, 240), low_power_fps=10,
+                 motion_threshold=4.0):
+        """
+        Initialize power saver
+
+        Args:
+            capture: Object with cv2-style get/set (VideoCapture, ThreadedCapture),
+                     or None to leave capture settings alone
+            enabled: False never enters the low-power state
+            idle_timeout: Seconds without a hand before sleeping
+            check_interval: Max seconds between presence checks while asleep
+            presence_width: Width of the frame used for presence checks
+            low_power_size: (width, height) requested from the camera while asleep
+            low_power_fps: Frame rate requested from the camera while asleep
+            motion_threshold: Thumbnail motion that triggers an immediate check
+        """
+        self.capture = capture
+        self.enabled = enabled
+        self.idle_timeout = idle_timeout
+        self.check_interval = check_interval
+        self.presence_width = presence_width
+        self.low_power_size = low_power_size
+        self.low_power_fps = low_power_fps
+        self.motion_threshold = motion_threshold
+        self.motion_detector = MotionDetector()
+
+        self.low_power = False
+        self._last_hand_time = None
+        self._last_check_time = 0.0
+        self._sleep_start = 0.0
+        self._last_time = 0.0
+        self._saved_props = None
+
+        # Statistics
+        self.sleeps = 0
+        self.wakes = 0
+        self.presence_checks = 0
+        self.frames_skipped = 0
+        self.time_in_low_power = 0.0
+
+    def update(self, hand_present, now=None):
+        """
+        Report whether the last processed frame contained a hand
+
+        Args:
+            hand_present: True if a hand was detected
+            now: Timestamp (time.perf_counter), defaults to now
+
+        Returns:
+            True if this call entered the low-power state
+        """
+        if now is None:
+            now = time.perf_counter()
+        self._last_time = now
+        if hand_present or self._last_hand_time is None:
+            self._last_hand_time = now
+            return False
+
+        if self.enabled and not self.low_power and now - self._last_hand_time >= self.idle_timeout:
+            self.sleep(now)
+            return True
+        return False
+
+    def skip_frame(self, frame, has_hand, now=None):
+        """
+        While asleep, run a cheap presence check and decide whether to skip the frame
+
+        Args:
+            frame: Full-size frame
+            has_hand: Callable taking a downscaled frame and returning True if it holds a hand
+            now: Timestamp (time.perf_counter), defaults to now
+
+        Returns:
+            True to skip full processing of this frame; False when awake
+            (including a wake-up on this frame)
+        """
+        if not self.low_power:
+            return False
+        if now is None:
+            now = time.perf_counter()
+        self._last_time = now
+
+        motion = self.motion_detector.measure(frame)
+        if motion >= self.motion_threshold or now - self._last_check_time >= self.check_interval:
+            self._last_check_time = now
+            self.presence_checks += 1
+            if has_hand(self.downscale(frame)):
+                self.wake(now)
+                return False
+
+        self.frames_skipped += 1
+        return True
+
+    def downscale(self, frame):
+        """Shrink a frame to presence_width for the presence check"""
+        h, w = frame.shape[:2]
+        if w <= self.presence_width:
+            return frame
+        height = int(round(h * self.presence_width / w))
+        return cv2.resize(frame, (self.presence_width, height), interpolation=cv2.INTER_AREA)
+
+    def sleep(self, now=None):
+        """Enter the low-power state"""
+        if self.low_power:
+            return
+        self.low_power = True
+        self._sleep_start = time.perf_counter() if now is None else now
+        self._last_check_time = self._sleep_start
+        self.motion_detector.reset()
+        self.sleeps += 1
+
+        if self.capture is not None:
+            self._saved_props = [(prop, self.capture.get(prop)) for prop in self.CAPTURE_PROPS]
+            width, height = self.low_power_size
+            for prop, value in zip(self.CAPTURE_PROPS, (width, height, self.low_power_fps)):
+                self.capture.set(prop, value)
+
+    def wake(self, now=None):
+        """Leave the low-power state and restore the capture settings"""
+        if not self.low_power:
+            return
+        now = time.perf_counter() if now is None else now
+        self.low_power = False
+        self._last_hand_time = now
+        self.time_in_low_power += now - self._sleep_start
+        self.wakes += 1
+
+        if self.capture is not None and self._saved_props:
+            for prop, value in self._saved_props:
+                # 0 means the backend does not report the property
+                if value > 0:
+                    self.capture.set(prop, value)
+            self._saved_props = None
+
+    def get_stats(self):
+        """Get power-saving statistics"""
+        time_in_low_power = self.time_in_low_power
+        if self.low_power:
+            time_in_low_power += max(self._last_time - self._sleep_start, 0.0)
+        return {
+            'low_power': self.low_power,
+            'sleeps': self.sleeps,
+            'wakes': self.wakes,
+            'presence_checks': self.presence_checks,
+            'frames_skipped': self.frames_skipped,
+            'time_in_low_power': time_in_low_power,
+        }
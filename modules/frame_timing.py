@@ -0,0 +1,153 @@
+"""
+MODULE 14: Frame Timing
+Rolling FPS, frame-time jitter, dropped-frame detection and stall alerts
+Shared by main_pipeline and the standalone Spotify loops
+"""
+
+import time
+import numpy as np
+
+
+class FrameTimer:
+    """
+    Frame-to-frame timing over a rolling window
+
+    Call tick() once per frame. Reports:
+        fps_ema     - exponentially-weighted FPS (reacts within a few frames)
+        fps_window  - FPS over the last `window` frames
+        jitter_ms   - standard deviation of frame times in the window
+        dropped     - frames missing from gaps longer than 1.5x the expected interval
+        stalls      - frame times above stall_threshold
+
+    frames, dropped, stalls and max_frame_time are lifetime counters for the
+    end-of-run summary; reset() clears only the rolling state.
+    """
+
+    def __init__(self, window=120, ema_alpha=0.1, stall_threshold=0.1, expected_fps=None,
+                 on_stall=None):
+        """
+        Initialize frame timer
+
+        Args:
+            window: Number of recent frame times kept
+            ema_alpha: Weight of the newest frame in fps_ema
+            stall_threshold: Frame time (seconds) reported as a stall
+            expected_fps: Nominal source FPS for drop detection (default: window median)
+            on_stall: Optional callback(frame_time, frame_index) for each stall
+        """
+        self.window = window
+        self.ema_alpha = ema_alpha
+        self.stall_threshold = stall_threshold
+        self.expected_fps = expected_fps
+        self.on_stall = on_stall
+
+        self._times = np.zeros(window, dtype=np.float64)
+        self._pos = 0
+        self._count = 0
+        self._last_tick = None
+
+        self.frames = 0
+        self.fps_ema = 0.0
+        self._ema_frame_time = None
+        self.dropped = 0
+        self.stalls = 0
+        self.max_frame_time = 0.0
+        self.last_frame_time = 0.0
+
+    def tick(self, now=None):
+        """
+        Mark the end of a frame
+
+        Args:
+            now: Timestamp in seconds (default: time.perf_counter())
+
+        Returns:
+            Time since the previous tick in seconds (0.0 for the first frame)
+        """
+        if now is None:
+            now = time.perf_counter()
+        self.frames += 1
+
+        if self._last_tick is None:
+            self._last_tick = now
+            return 0.0
+
+        frame_time = now - self._last_tick
+        self._last_tick = now
+        self.last_frame_time = frame_time
+
+        # Drop detection against the interval before this frame is added
+        expected = self._expected_interval()
+        if expected > 0 and frame_time > 1.5 * expected:
+            self.dropped += int(round(frame_time / expected)) - 1
+
+        self._times[self._pos] = frame_time
+        self._pos = (self._pos + 1) % self.window
+        self._count = min(self._count + 1, self.window)
+
+        if self._ema_frame_time is None:
+            self._ema_frame_time = frame_time
+        else:
+            self._ema_frame_time += self.ema_alpha * (frame_time - self._ema_frame_time)
+        self.fps_ema = 1.0 / self._ema_frame_time if self._ema_frame_time > 0 else 0.0
+
+        self.max_frame_time = max(self.max_frame_time, frame_time)
+        if frame_time > self.stall_threshold:
+            self.stalls += 1
+            if self.on_stall is not None:
+                self.on_stall(frame_time, self.frames)
+
+        return frame_time
+
+    def _expected_interval(self):
+        """Nominal frame interval (seconds), 0 if unknown yet"""
+        if self.expected_fps:
+            return 1.0 / self.expected_fps
+        if self._count < 10:
+            return 0.0
+        return float(np.median(self._times[:self._count]))
+
+    @property
+    def fps_window(self):
+        """FPS over the last `window` frames"""
+        if self._count == 0:
+            return 0.0
+        total = self._times[:self._count].sum()
+        return float(self._count / total) if total > 0 else 0.0
+
+    @property
+    def jitter_ms(self):
+        """Standard deviation of frame times in the window (milliseconds)"""
+        if self._count < 2:
+            return 0.0
+        return float(self._times[:self._count].std() * 1000.0)
+
+    def reset(self):
+        """
+        Forget the rolling window and FPS average (e.g. after a deliberate pause)
+
+        The lifetime counters (frames, dropped, stalls, max_frame_time) are
+        kept, and the first tick after a reset starts a new interval, so the
+        pause itself is never counted as a stall or as dropped frames.
+        """
+        self._pos = 0
+        self._count = 0
+        self._last_tick = None
+        self._ema_frame_time = None
+        self.fps_ema = 0.0
+        self.last_frame_time = 0.0
+
+    def get_stats(self):
+        """Get frame timing statistics (times in milliseconds)"""
+        window = self._times[:self._count]
+        return {
+            'frames': self.frames,
+            'fps_ema': self.fps_ema,
+            'fps_window': self.fps_window,
+            'frame_time_ms': self.last_frame_time * 1000.0,
+            'frame_time_p95_ms': float(np.percentile(window, 95) * 1000.0) if self._count else 0.0,
+            'max_frame_time_ms': self.max_frame_time * 1000.0,
+            'jitter_ms': self.jitter_ms,
+            'dropped': self.dropped,
+            'stalls': self.stalls,
+        }
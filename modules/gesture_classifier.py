@@ -10,6 +10,7 @@ from sklearn.svm import SVC
 from sklearn.neural_network import MLPClassifier
 from sklearn.preprocessing import StandardScaler
 import os
+from modules.compact_model import export_compact_model
 
 class GestureClassifier:
     """
@@ -93,14 +94,14 @@ class GestureClassifier:
         # Scale features
         features_scaled = self.scaler.transform(features.reshape(1, -1))
         
-        # Predict
-        prediction = self.model.predict(features_scaled)[0]
-        
-        # Get confidence
+        # Label and confidence from a single probability evaluation
         if hasattr(self.model, 'predict_proba'):
             probabilities = self.model.predict_proba(features_scaled)[0]
-            confidence = probabilities[prediction]
+            best = np.argmax(probabilities)
+            prediction = self.model.classes_[best]
+            confidence = probabilities[best]
         else:
+            prediction = self.model.predict(features_scaled)[0]
             confidence = 0.0
         
         return prediction, confidence
@@ -120,22 +121,26 @@ class GestureClassifier:
             raise ValueError("Model must be trained before prediction")
         
         X_scaled = self.scaler.transform(X)
-        predictions = self.model.predict(X_scaled)
         
         if hasattr(self.model, 'predict_proba'):
             probabilities = self.model.predict_proba(X_scaled)
-            confidences = np.max(probabilities, axis=1)
+            best = np.argmax(probabilities, axis=1)
+            predictions = self.model.classes_[best]
+            confidences = probabilities[np.arange(len(best)), best]
         else:
+            predictions = self.model.predict(X_scaled)
             confidences = np.ones(len(predictions))
         
         return predictions, confidences
     
-    def save_model(self, model_path):
+    def save_model(self, model_path, export_compact=False):
         """
         Save trained model to disk
         
         Args:
             model_path: Path to save model
+            export_compact: Also write {model_path}_compact.npz for
+                            CompactGestureModel (random_forest / neural_network only)
         """
         if not self.is_trained:
             print("Warning: Model not trained yet!")
@@ -146,6 +151,10 @@ class GestureClassifier:
         joblib.dump(self.model, f"{model_path}.pkl")
         joblib.dump(self.scaler, f"{model_path}_scaler.pkl")
         
+        if export_compact:
+            export_compact_model(self.model, self.scaler, f"{model_path}_compact.npz")
+            print(f"Compact model saved to {model_path}_compact.npz")
+        
         print(f"Model saved to {model_path}")
     
     def load_model(self, model_path):
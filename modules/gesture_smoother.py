@@ -0,0 +1,167 @@
+"""
+MODULE 4b: Gesture Smoothing
+Stabilize per-frame gesture predictions with a fixed-size ring buffer
+Supports majority, confidence-weighted and exponential-decay voting with hysteresis
+"""
+
+import numpy as np
+
+
+class GestureSmoother:
+    """
+    Ring-buffer gesture smoother
+
+    Per-class scores are updated incrementally (add the new vote, subtract
+    the evicted one), so each update costs O(number of classes) regardless
+    of history size and allocates nothing.
+
+    Modes:
+        'majority'  - each frame counts 1
+        'weighted'  - each frame counts its confidence
+        'decay'     - all scores decay by `decay` per frame, new frame adds its confidence;
+                      old frames fade out instead of leaving a window, so
+                      history_size is ignored and no ring buffer is allocated
+
+    Hysteresis: a new gesture takes over only when its share of the total
+    score reaches enter_threshold; the current gesture is kept while its
+    share stays at or above exit_threshold. With both at 0 the smoother
+    reduces to a plain vote that keeps the current gesture on ties.
+    """
+
+    MODES = ('majority', 'weighted', 'decay')
+
+    def __init__(self, history_size=5, mode='majority', decay=0.7,
+                 enter_threshold=0.0, exit_threshold=0.0):
+        """
+        Initialize gesture smoother
+
+        Args:
+            history_size: Number of frames in the voting window (unused in 'decay' mode)
+            mode: 'majority', 'weighted' or 'decay'
+            decay: Per-frame score multiplier for 'decay' mode
+            enter_threshold: Min score share for a new gesture to take over
+            exit_threshold: Min score share for the current gesture to stay
+        """
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown smoothing mode: {mode}")
+
+        self.history_size = history_size
+        self.mode = mode
+        self.decay = decay
+        self.enter_threshold = enter_threshold
+        self.exit_threshold = exit_threshold
+
+        # Gesture labels (ints or strings) map to dense slots in the score array
+        self._slots = {}
+        self._labels = []
+        self._scores = np.zeros(8, dtype=np.float64)
+
+        # Ring buffer of (slot, weight); slot -1 marks an empty entry
+        ring_size = 0 if mode == 'decay' else history_size
+        self._ring_slots = np.full(ring_size, -1, dtype=np.int64)
+        self._ring_weights = np.zeros(ring_size, dtype=np.float64)
+        self._pos = 0
+        self._count = 0
+
+        self.current = None
+
+    def _slot(self, gesture):
+        """Slot index for a gesture label, growing the score array if needed"""
+        slot = self._slots.get(gesture)
+        if slot is None:
+            slot = len(self._labels)
+            self._slots[gesture] = slot
+            self._labels.append(gesture)
+            if slot >= len(self._scores):
+                self._scores = np.concatenate([self._scores, np.zeros(len(self._scores))])
+        return slot
+
+    def _recompute_scores(self):
+        """Rebuild scores from the ring buffer to cancel floating-point drift"""
+        self._scores[:] = 0.0
+        valid = self._ring_slots >= 0
+        np.add.at(self._scores, self._ring_slots[valid], self._ring_weights[valid])
+
+    def update(self, gesture, confidence=1.0):
+        """
+        Add one frame's prediction and get the smoothed gesture
+
+        Args:
+            gesture: Predicted gesture label
+            confidence: Prediction confidence (used by 'weighted' and 'decay')
+
+        Returns:
+            Smoothed gesture label, or None if no gesture qualifies
+        """
+        slot = self._slot(gesture)
+        weight = 1.0 if self.mode == 'majority' else float(confidence)
+
+        if self.mode == 'decay':
+            # Past frames live on only in the decayed scores
+            self._scores *= self.decay
+            self._scores[slot] += weight
+            self._count += 1
+            return self._vote()
+
+        evicted = self._ring_slots[self._pos]
+        if evicted >= 0:
+            self._scores[evicted] -= self._ring_weights[self._pos]
+        self._scores[slot] += weight
+
+        self._ring_slots[self._pos] = slot
+        self._ring_weights[self._pos] = weight
+        self._pos = (self._pos + 1) % self.history_size
+        self._count = min(self._count + 1, self.history_size)
+
+        if self._pos == 0 and self.mode == 'weighted':
+            self._recompute_scores()
+
+        return self._vote()
+
+    def _vote(self):
+        """Apply hysteresis to the current scores"""
+        n = len(self._labels)
+        scores = self._scores[:n]
+        total = scores.sum()
+        if total <= 0:
+            self.current = None
+            return None
+
+        best = int(np.argmax(scores))
+        best_share = scores[best] / total
+
+        current_slot = self._slots.get(self.current) if self.current is not None else None
+        current_share = scores[current_slot] / total if current_slot is not None else 0.0
+
+        if current_slot is not None and current_share >= self.exit_threshold:
+            # Keep the current gesture unless another clearly outvotes it
+            if best != current_slot and scores[best] > scores[current_slot] and best_share >= self.enter_threshold:
+                self.current = self._labels[best]
+        elif best_share >= self.enter_threshold:
+            self.current = self._labels[best]
+        else:
+            self.current = None
+
+        return self.current
+
+    def get_scores(self):
+        """
+        Get current per-gesture scores
+
+        Returns:
+            Dict of {gesture: score}
+        """
+        return {label: float(self._scores[slot]) for label, slot in self._slots.items()}
+
+    def reset(self):
+        """Clear history and current gesture"""
+        self._scores[:] = 0.0
+        self._ring_slots[:] = -1
+        self._ring_weights[:] = 0.0
+        self._pos = 0
+        self._count = 0
+        self.current = None
+
+    def __len__(self):
+        """Number of frames currently in the window (in 'decay' mode: since the last reset)"""
+        return self._count
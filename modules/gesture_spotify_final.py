@@ -11,10 +11,32 @@ import time
 import subprocess
 import psutil
 import os
+import sys
 import json
 from sklearn.ensemble import RandomForestClassifier
 import joblib
 
+try:
+    from modules.hand_detection import HandRoiTracker
+    from modules.frame_scheduler import IdlePowerSaver
+    from modules.frame_timing import FrameTimer
+except ImportError:
+    from hand_detection import HandRoiTracker
+    from frame_scheduler import IdlePowerSaver
+    from frame_timing import FrameTimer
+
+try:
+    from config import HAND_DETECTION_CONFIG, POWER_SAVER_CONFIG
+except ImportError:
+    # Run from inside modules/: config.py lives one level up
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from config import HAND_DETECTION_CONFIG, POWER_SAVER_CONFIG
+
+try:
+    from modules.gesture_smoother import GestureSmoother
+except ImportError:
+    from gesture_smoother import GestureSmoother
+
 # ================================
 # 🎵 SPOTIFY CONTROLLER
 # ================================
@@ -100,7 +122,7 @@ class SpotifyController:
 # ================================
 
 class HandGestureDetector:
-    def __init__(self):
+    def __init__(self, roi_tracking=False):
         self.mp_hands = mp.solutions.hands
         self.hands = self.mp_hands.Hands(
             static_image_mode=False,
@@ -109,6 +131,7 @@ class HandGestureDetector:
             min_tracking_confidence=0.5
         )
         self.mp_draw = mp.solutions.drawing_utils
+        self.roi_tracker = HandRoiTracker(enabled=roi_tracking)
         
         # Load trained model
         try:
@@ -192,10 +215,20 @@ class HandGestureDetector:
             prediction = self.model.predict([features])[0]
             return prediction
     
+    def has_hand(self, frame):
+        """
+        Presence check only (no drawing or gesture detection), used in power saving mode
+        
+        The frame is the power saver's downscaled copy, so the ROI crop (in
+        full-size pixels) is dropped and the whole frame is checked.
+        """
+        self.roi_tracker.reset()
+        results = self.hands.process(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+        return bool(results.multi_hand_landmarks)
+    
     def process_frame(self, frame):
         """Process frame and detect gestures"""
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        results = self.hands.process(rgb_frame)
+        results = self.roi_tracker.process(self.hands, frame, cv2.COLOR_BGR2RGB)
         
         gesture = "none"
         features = []
@@ -280,8 +313,9 @@ def main():
     
     # Initialize components
     spotify_ctrl = SpotifyController()
-    gesture_detector = HandGestureDetector()
+    gesture_detector = HandGestureDetector(roi_tracking=HAND_DETECTION_CONFIG['roi_tracking'])
     action_mapper = GestureActionMapper(spotify_ctrl)
+    smoother = GestureSmoother(history_size=5, enter_threshold=0.6, exit_threshold=0.4)
     
     # Auto-launch Spotify
     print("🎵 Checking Spotify...")
@@ -305,6 +339,14 @@ def main():
         print("❌ Cannot open camera")
         return
     
+    # Low-power state when nobody is in front of the camera
+    power_saver = IdlePowerSaver(capture=cap, **POWER_SAVER_CONFIG)
+    
+    # Rolling FPS / frame-time statistics with stall warnings
+    frame_timer = FrameTimer(
+        on_stall=lambda frame_time, frame: print(f"⚠️  Frame {frame} stalled: {frame_time * 1000:.0f} ms")
+    )
+    
     print("📷 Camera started - Show your hand gestures!")
     print("\n🎮 GESTURE CONTROLS:")
     print("✋ PALM → Play/Pause")
@@ -324,17 +366,36 @@ def main():
             # Flip frame for mirror effect
             frame = cv2.flip(frame, 1)
             
+            if power_saver.skip_frame(frame, gesture_detector.has_hand):
+                cv2.putText(frame, "Power saving - show a hand to wake", (10, 30),
+                           cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 165, 255), 2)
+                cv2.imshow('Gesture Controlled Spotify', frame)
+                if cv2.waitKey(1) & 0xFF == ord('q'):
+                    break
+                continue
+            
             # Process frame and detect gestures
             processed_frame, gesture, features = gesture_detector.process_frame(frame)
+            if power_saver.update(gesture != "none"):
+                print("💤 No hand detected, entering power saving mode")
+                frame_timer.reset()
             
-            # Execute Spotify action if gesture detected
+            # Execute Spotify action once the smoothed gesture is stable
             if gesture != "none":
-                action_mapper.execute_action(gesture)
+                gesture = smoother.update(gesture)
+                if gesture is not None:
+                    action_mapper.execute_action(gesture)
+            else:
+                smoother.reset()
             
             # Display instructions
             cv2.putText(processed_frame, "Show hand gestures to control Spotify", 
                        (10, 450), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
             
+            frame_timer.tick()
+            cv2.putText(processed_frame, f"FPS: {frame_timer.fps_ema:.1f} (jitter {frame_timer.jitter_ms:.1f} ms)",
+                       (10, 420), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 0), 1)
+            
             # Show frame
             cv2.imshow('Gesture Controlled Spotify', processed_frame)
             
@@ -348,6 +409,9 @@ def main():
     finally:
         cap.release()
         cv2.destroyAllWindows()
+        timing = frame_timer.get_stats()
+        print(f"📊 {timing['fps_window']:.1f} FPS, frame time p95 {timing['frame_time_p95_ms']:.1f} ms, "
+              f"{timing['stalls']} stalls, {timing['dropped']} dropped")
         print("🎵 Gesture control stopped")
 
 if __name__ == "__main__":
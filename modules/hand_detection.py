@@ -1,19 +1,295 @@
 """
 MODULE 1: Hand Detection using MediaPipe
 Detects hands in video frames and extracts 21 landmark points
+MediaPipe is imported by HandDetector itself, so the tracking and
+drawing helpers here also work for replayed landmarks without it
 """
 
 import cv2
-import mediapipe as mp
 import numpy as np
 
+# Hand skeleton as polyline chains (covers all MediaPipe HAND_CONNECTIONS)
+SKELETON_CHAINS = [
+    [0, 1, 2, 3, 4],          # Thumb
+    [5, 6, 7, 8],             # Index
+    [9, 10, 11, 12],          # Middle
+    [13, 14, 15, 16],         # Ring
+    [17, 18, 19, 20],         # Pinky
+    [0, 5, 9, 13, 17, 0],     # Palm
+]
+CONNECTION_COLOR = (255, 255, 255)
+LANDMARK_COLOR = (0, 0, 255)
+
+
+def draw_hand_landmarks(frame, landmarks):
+    """
+    Draw hand skeletons with two cv2.polylines calls for all hands
+    
+    Args:
+        frame: Frame to draw on (modified in place)
+        landmarks: (N, 21, 3) normalized landmarks
+        
+    Returns:
+        frame
+    """
+    if len(landmarks) == 0:
+        return frame
+    
+    h, w = frame.shape[:2]
+    points = (np.asarray(landmarks)[..., :2] * (w, h)).astype(np.int32)
+    
+    # Bones: one polyline per finger chain per hand
+    chains = [hand[chain] for hand in points for chain in SKELETON_CHAINS]
+    cv2.polylines(frame, chains, False, CONNECTION_COLOR, 2)
+    
+    # Joints: zero-length thick segments render as filled dots
+    joints = np.repeat(points.reshape(-1, 1, 2), 2, axis=1)
+    cv2.polylines(frame, joints, False, LANDMARK_COLOR, 6)
+    
+    return frame
+
+
+class HandRoiTracker:
+    """
+    Run MediaPipe on a crop around the last known hand position
+    
+    Once a hand is found, later frames are cropped to its expanded bounding
+    box and the landmarks are remapped to full-frame coordinates in place,
+    so callers see the same results as a full-frame run. The crop stays put
+    while the hand remains well inside it (MediaPipe's own video-mode
+    tracking relies on a stable input frame) and is re-centred otherwise.
+    If the crop yields no hand, the same frame is re-run at full size.
+    
+    A crop cannot see a hand entering elsewhere in the frame, so when more
+    hands are allowed than the crop holds (max_hands > 1), every
+    `full_frame_interval`-th frame is run at full size.
+    """
+    
+    def __init__(self, enabled=True, margin=0.35, min_size=0.3, recenter_fraction=0.1, max_hands=1,
+                 full_frame_interval=15):
+        """
+        Initialize ROI tracker
+        
+        Args:
+            enabled: False runs every frame at full size (plain hands.process)
+            margin: Crop padding around the hand, as a fraction of hand size
+            min_size: Minimum crop side, as a fraction of the frame's shorter side
+            recenter_fraction: Re-centre when the hand gets this close to the crop edge
+            max_hands: Hands the detector may find (more than the crop holds triggers full-frame runs)
+            full_frame_interval: Crop runs between full-frame runs while hands may be missing
+        """
+        self.enabled = enabled
+        self.margin = margin
+        self.min_size = min_size
+        self.recenter_fraction = recenter_fraction
+        self.max_hands = max_hands
+        self.full_frame_interval = full_frame_interval
+        
+        self.roi = None  # (x0, y0, x1, y1) in pixels
+        self._roi_streak = 0  # Crop runs since the last full-frame run
+        self.roi_runs = 0
+        self.full_frame_runs = 0
+        self.fallbacks = 0
+        self.refreshes = 0
+    
+    def process(self, hands, frame, conversion=None):
+        """
+        Drop-in replacement for hands.process(frame)
+        
+        Args:
+            hands: mediapipe Hands instance
+            frame: Full frame (RGB, or any format when conversion is given)
+            conversion: Optional cv2.cvtColor code applied after cropping,
+                        e.g. cv2.COLOR_BGR2RGB, so only the crop is converted
+            
+        Returns:
+            MediaPipe results with landmarks in full-frame coordinates
+        """
+        def run(image):
+            if conversion is not None:
+                image = cv2.cvtColor(image, conversion)
+            return hands.process(np.ascontiguousarray(image))
+        
+        if not self.enabled:
+            return run(frame)
+        
+        h, w = frame.shape[:2]
+        
+        if self.roi is not None and self._roi_streak >= self.full_frame_interval:
+            # Look for hands outside the crop
+            self.refreshes += 1
+        elif self.roi is not None:
+            x0, y0, x1, y1 = self.roi
+            results = run(frame[y0:y1, x0:x1])
+            self.roi_runs += 1
+            if results.multi_hand_landmarks:
+                self._remap(results, x0, y0, x1 - x0, y1 - y0, w, h)
+                self._update_roi(results, w, h)
+                if len(results.multi_hand_landmarks) < self.max_hands:
+                    self._roi_streak += 1
+                return results
+            self.fallbacks += 1
+        
+        results = run(frame)
+        self.full_frame_runs += 1
+        self._roi_streak = 0
+        self._update_roi(results, w, h)
+        return results
+    
+    @staticmethod
+    def _remap(results, x0, y0, crop_w, crop_h, w, h):
+        """Convert crop-normalized landmarks to frame-normalized, in place"""
+        sx, sy = crop_w / w, crop_h / h
+        ox, oy = x0 / w, y0 / h
+        for hand_landmarks in results.multi_hand_landmarks:
+            for landmark in hand_landmarks.landmark:
+                landmark.x = landmark.x * sx + ox
+                landmark.y = landmark.y * sy + oy
+                landmark.z = landmark.z * sx
+    
+    def _update_roi(self, results, w, h):
+        """Keep, move or drop the crop based on where the hands are"""
+        if not results.multi_hand_landmarks:
+            self.roi = None
+            return
+        
+        points = np.array([
+            (landmark.x * w, landmark.y * h)
+            for hand_landmarks in results.multi_hand_landmarks
+            for landmark in hand_landmarks.landmark
+        ])
+        hx0, hy0 = points.min(axis=0)
+        hx1, hy1 = points.max(axis=0)
+        
+        # Sticky: keep the crop while the hand is inside its inner region
+        if self.roi is not None:
+            x0, y0, x1, y1 = self.roi
+            pad_x = (x1 - x0) * self.recenter_fraction
+            pad_y = (y1 - y0) * self.recenter_fraction
+            if hx0 >= x0 + pad_x and hy0 >= y0 + pad_y and hx1 <= x1 - pad_x and hy1 <= y1 - pad_y:
+                return
+        
+        # Square crop centred on the hand, padded and clamped to the frame
+        size = max(hx1 - hx0, hy1 - hy0) * (1 + 2 * self.margin)
+        size = int(min(max(size, self.min_size * min(w, h)), min(w, h)))
+        cx, cy = (hx0 + hx1) / 2, (hy0 + hy1) / 2
+        x0 = int(min(max(cx - size / 2, 0), w - size))
+        y0 = int(min(max(cy - size / 2, 0), h - size))
+        self.roi = (x0, y0, x0 + size, y0 + size)
+    
+    def reset(self):
+        """Forget the crop; the next frame runs at full size"""
+        self.roi = None
+        self._roi_streak = 0
+    
+    def get_stats(self):
+        """Get crop/full-frame run counts"""
+        return {
+            'roi_runs': self.roi_runs,
+            'full_frame_runs': self.full_frame_runs,
+            'fallbacks': self.fallbacks,
+            'refreshes': self.refreshes,
+        }
+
+class HandTracker:
+    """
+    Assign stable track IDs to hands across frames
+
+    MediaPipe's hand order can swap from frame to frame, so each detected
+    hand is matched to the nearest existing track by landmark centroid.
+    Hands whose handedness ("Left"/"Right") contradicts the track's are
+    never matched. Unmatched hands start new tracks; tracks not seen for
+    more than max_missed frames end.
+    """
+
+    def __init__(self, max_distance=0.25, max_missed=5):
+        """
+        Initialize hand tracker
+
+        Args:
+            max_distance: Largest centroid move (normalized units) matched to a track
+            max_missed: Frames a track survives without a matching hand
+        """
+        self.max_distance = max_distance
+        self.max_missed = max_missed
+
+        self.tracks = {}  # track_id -> {'centroid', 'handedness', 'missed'}
+        self.ended = []   # Track IDs ended by the last update
+        self._next_id = 0
+
+    def update(self, landmarks, handedness=None):
+        """
+        Match this frame's hands to tracks
+
+        Args:
+            landmarks: (N, 21, 3) normalized landmarks (or a list of (21, 3))
+            handedness: Optional list of N "Left"/"Right" labels (None = unknown)
+
+        Returns:
+            List of N track IDs, aligned with landmarks
+        """
+        n = len(landmarks)
+        centroids = np.asarray(landmarks, dtype=np.float32).reshape(n, 21, 3)[:, :, :2].mean(axis=1)
+        if handedness is None:
+            handedness = [None] * n
+
+        # Greedy matching on all (hand, track) pairs, closest first
+        track_ids = list(self.tracks)
+        pairs = []
+        for i in range(n):
+            for track_id in track_ids:
+                track = self.tracks[track_id]
+                if handedness[i] and track['handedness'] and handedness[i] != track['handedness']:
+                    continue
+                distance = float(np.linalg.norm(centroids[i] - track['centroid']))
+                if distance <= self.max_distance:
+                    pairs.append((distance, i, track_id))
+        pairs.sort()
+
+        assigned = [None] * n
+        matched = set()
+        for _, i, track_id in pairs:
+            if assigned[i] is None and track_id not in matched:
+                assigned[i] = track_id
+                matched.add(track_id)
+
+        for i in range(n):
+            if assigned[i] is None:
+                assigned[i] = self._next_id
+                self._next_id += 1
+                self.tracks[assigned[i]] = {'handedness': None}
+            track = self.tracks[assigned[i]]
+            track['centroid'] = centroids[i]
+            track['handedness'] = handedness[i] or track['handedness']
+            track['missed'] = 0
+
+        self.ended = []
+        for track_id in track_ids:
+            if track_id not in matched:
+                self.tracks[track_id]['missed'] += 1
+                if self.tracks[track_id]['missed'] > self.max_missed:
+                    del self.tracks[track_id]
+                    self.ended.append(track_id)
+
+        return assigned
+
+    def reset(self):
+        """End all tracks"""
+        self.ended = list(self.tracks)
+        self.tracks = {}
+
 class HandDetector:
     """
     Detects hand landmarks using MediaPipe
     Returns 21 landmark coordinates for each detected hand
+    
+    Landmarks are written into one preallocated buffer, and everything
+    detect_hands and get_landmarks return is a view into it: the next
+    detect_hands call overwrites them in place (has_hand does not touch
+    the buffer). Copy what must outlive the current frame.
     """
     
-    def __init__(self, mode=False, max_hands=2, detection_con=0.5, tracking_con=0.5):
+    def __init__(self, mode=False, max_hands=2, detection_con=0.5, tracking_con=0.5, draw=True, roi_tracking=False):
         """
         Initialize hand detector
         
@@ -22,13 +298,17 @@ class HandDetector:
             max_hands: Maximum number of hands to detect
             detection_con: Minimum confidence for hand detection
             tracking_con: Minimum confidence for hand tracking
+            draw: Draw landmarks inside detect_hands (False = call draw_landmarks separately)
+            roi_tracking: Run detection on a crop around the last hand (see HandRoiTracker)
         """
         self.mode = mode
         self.max_hands = max_hands
         self.detection_con = detection_con
         self.tracking_con = tracking_con
+        self.draw = draw
         
         # Initialize MediaPipe Hands
+        import mediapipe as mp
         self.mp_hands = mp.solutions.hands
         self.hands = self.mp_hands.Hands(
             static_image_mode=self.mode,
@@ -37,41 +317,123 @@ class HandDetector:
             min_tracking_confidence=self.tracking_con
         )
         self.mp_drawing = mp.solutions.drawing_utils
+        self.roi_tracker = HandRoiTracker(enabled=roi_tracking, max_hands=max_hands)
+        
+        # Landmark buffer reused across frames (no per-frame allocation)
+        self.landmarks_buffer = np.zeros((self.max_hands, 21, 3), dtype=np.float32)
+        self._buffer_flat = memoryview(self.landmarks_buffer).cast('B').cast('f')
+        self.hand_scores = np.zeros(self.max_hands, dtype=np.float32)
+        self.handedness = [None] * self.max_hands
+        self.num_hands = 0
+    
+    def _fill_landmarks(self, hand_idx, hand_landmarks):
+        """
+        Copy one hand's 21 landmarks into the shared buffer
         
-    def detect_hands(self, frame):
+        Args:
+            hand_idx: Slot in landmarks_buffer
+            hand_landmarks: MediaPipe NormalizedLandmarkList
+        """
+        flat = self._buffer_flat
+        k = hand_idx * 63
+        for landmark in hand_landmarks.landmark:
+            flat[k] = landmark.x
+            flat[k + 1] = landmark.y
+            flat[k + 2] = landmark.z
+            k += 3
+    
+    def detect_hands(self, frame, draw=None):
         """
         Detect hands in frame
         
+        The returned landmark arrays are views into landmarks_buffer and are
+        overwritten by the next call; copy them to keep them longer.
+        
         Args:
             frame: Input image frame (BGR format)
+            draw: Override the detector's draw setting for this call
             
         Returns:
-            frame: Frame with hand landmarks drawn
-            landmarks: List of 21 (x, y, z) coordinates for each detected hand
+            frame: Frame with hand landmarks drawn (if drawing is enabled)
+            landmarks: List of (21, 3) float32 views, one per detected hand
         """
-        # Convert BGR to RGB
-        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        results = self.hands.process(frame_rgb)
+        # Convert BGR to RGB (only the tracked crop when ROI tracking is on)
+        results = self.roi_tracker.process(self.hands, frame, cv2.COLOR_BGR2RGB)
         
-        landmarks_list = []
+        self.num_hands = 0
         
         if results.multi_hand_landmarks:
-            for hand_landmarks in results.multi_hand_landmarks:
+            for hand_idx, hand_landmarks in enumerate(results.multi_hand_landmarks[:self.max_hands]):
                 # Extract 21 landmarks for each hand
-                hand_coords = []
-                for landmark in hand_landmarks.landmark:
-                    hand_coords.append([landmark.x, landmark.y, landmark.z])
-                landmarks_list.append(np.array(hand_coords))
-                
-                # Draw hand landmarks on frame (optional visualization)
-                self.mp_drawing.draw_landmarks(
-                    frame,
-                    hand_landmarks,
-                    self.mp_hands.HAND_CONNECTIONS
-                )
+                self._fill_landmarks(hand_idx, hand_landmarks)
+                self.num_hands = hand_idx + 1
+            
+            # Handedness label ("Left"/"Right") and detection score per hand
+            if results.multi_handedness:
+                for hand_idx, handedness in enumerate(results.multi_handedness[:self.num_hands]):
+                    classification = handedness.classification[0]
+                    self.handedness[hand_idx] = classification.label
+                    self.hand_scores[hand_idx] = classification.score
+        
+        # Draw hand landmarks on frame (optional visualization)
+        if self.draw if draw is None else draw:
+            self.draw_landmarks(frame)
         
+        landmarks_list = [self.landmarks_buffer[i] for i in range(self.num_hands)]
         return frame, landmarks_list
     
+    def has_hand(self, frame):
+        """
+        Presence check used in power saving mode
+        
+        The frame is the power saver's downscaled copy, so the ROI crop (in
+        full-size pixels) is dropped and the whole frame is checked. The
+        landmark buffer and the last detection are left as they are.
+        
+        Args:
+            frame: Input image frame (BGR format)
+            
+        Returns:
+            True if the frame holds a hand
+        """
+        self.roi_tracker.reset()
+        results = self.hands.process(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+        return bool(results.multi_hand_landmarks)
+    
+    def draw_landmarks(self, frame, landmarks=None):
+        """
+        Draw hand skeletons with two cv2.polylines calls for all hands
+        
+        Args:
+            frame: Frame to draw on (modified in place)
+            landmarks: (N, 21, 3) normalized landmarks (default: last detection)
+            
+        Returns:
+            frame
+        """
+        if landmarks is None:
+            landmarks = self.get_landmarks()
+        return draw_hand_landmarks(frame, landmarks)
+    
+    def get_landmarks(self):
+        """
+        Get landmarks of all hands found by the last detect_hands call
+        
+        Returns:
+            Contiguous (num_hands, 21, 3) float32 view into landmarks_buffer,
+            overwritten by the next detect_hands call
+        """
+        return self.landmarks_buffer[:self.num_hands]
+    
+    def get_hand_info(self):
+        """
+        Get handedness and score of hands found by the last detect_hands call
+        
+        Returns:
+            List of (handedness, score) tuples
+        """
+        return [(self.handedness[i], float(self.hand_scores[i])) for i in range(self.num_hands)]
+    
     def get_hand_position(self, landmarks):
         """
         Get bounding box of hand
@@ -19,12 +19,17 @@ class MediaController:
     # Media key press duration (seconds)
     KEY_PRESS_DURATION = 0.1
     
+    # Re-read the system volume at most this often for get_cached_volume (seconds)
+    VOLUME_REFRESH_INTERVAL = 1.0
+    
     def __init__(self):
         """Initialize media controller"""
         self.volume_control = None
         self.current_volume = 0
+        self._volume_read_time = None
         self.last_action_time = 0
         self.action_cooldown = 0.3  # Cooldown between actions (seconds)
+        self.last_cooldown_remaining = 0.0  # Set by every cooldown check (seconds, 0 = allowed)
         
         self._init_volume_control()
     
@@ -71,6 +76,23 @@ class MediaController:
             print(f"Error getting volume: {e}")
             return 0.0
     
+    def get_cached_volume(self):
+        """
+        Get the volume without a COM call on every frame
+        
+        Returns the value from the last read or set_volume(); the system
+        volume is re-read every VOLUME_REFRESH_INTERVAL to pick up changes
+        made outside this controller.
+        
+        Returns:
+            Volume level (0.0 to 1.0)
+        """
+        now = time.time()
+        if self._volume_read_time is None or now - self._volume_read_time >= self.VOLUME_REFRESH_INTERVAL:
+            self.current_volume = self.get_volume()
+            self._volume_read_time = now
+        return self.current_volume
+    
     def set_volume(self, volume):
         """
         Set system volume
@@ -98,6 +120,8 @@ class MediaController:
             current = self.get_volume()
             self.set_volume(current + step)
             self.last_action_time = time.time()
+            return True
+        return False
     
     def decrease_volume(self, step=0.05):
         """
@@ -110,36 +134,48 @@ class MediaController:
             current = self.get_volume()
             self.set_volume(current - step)
             self.last_action_time = time.time()
+            return True
+        return False
     
     def play_pause(self):
         """Toggle play/pause"""
         if self._check_cooldown():
             pyautogui.press('playpause')
             self.last_action_time = time.time()
+            return True
+        return False
     
     def next_track(self):
         """Skip to next track"""
         if self._check_cooldown():
             pyautogui.press('nexttrack')
             self.last_action_time = time.time()
+            return True
+        return False
     
     def previous_track(self):
         """Go to previous track"""
         if self._check_cooldown():
             pyautogui.press('prevtrack')
             self.last_action_time = time.time()
+            return True
+        return False
     
     def mute(self):
         """Mute audio"""
         if self._check_cooldown():
             pyautogui.press('volumemute')
             self.last_action_time = time.time()
+            return True
+        return False
     
     def unmute(self):
         """Unmute audio"""
         if self._check_cooldown():
             pyautogui.press('volumemute')
             self.last_action_time = time.time()
+            return True
+        return False
     
     def _check_cooldown(self):
         """
@@ -150,28 +186,44 @@ class MediaController:
             True if action should be executed
         """
         current_time = time.time()
-        return (current_time - self.last_action_time) >= self.action_cooldown
+        self.last_cooldown_remaining = max(0.0, self.action_cooldown - (current_time - self.last_action_time))
+        return self.last_cooldown_remaining == 0.0
     
-    def execute_action(self, action):
+    def init_worker_thread(self):
+        """
+        Initialize COM on a worker thread (called by ActionDispatcher)
+        """
+        try:
+            import comtypes
+            comtypes.CoInitialize()
+        except Exception as e:
+            print(f"⚠ Error initializing COM on worker thread: {e}")
+    
+    def execute_action(self, action, steps=1):
         """
         Execute media control action
         
         Args:
             action: Action string (from ActionMapper)
+            steps: Number of volume steps for coalesced volume actions
+            
+        Returns:
+            True if executed, False if suppressed by the cooldown (or unknown)
         """
         from modules.action_mapper import ActionMapper
         
         if action == ActionMapper.VOLUME_UP:
-            self.increase_volume()
+            return self.increase_volume(0.05 * steps)
         elif action == ActionMapper.VOLUME_DOWN:
-            self.decrease_volume()
+            return self.decrease_volume(0.05 * steps)
         elif action == ActionMapper.PLAY_PAUSE:
-            self.play_pause()
+            return self.play_pause()
         elif action == ActionMapper.NEXT_TRACK:
-            self.next_track()
+            return self.next_track()
         elif action == ActionMapper.PREVIOUS_TRACK:
-            self.previous_track()
+            return self.previous_track()
         elif action == ActionMapper.MUTE:
-            self.mute()
+            return self.mute()
         elif action == ActionMapper.UNMUTE:
-            self.unmute()
+            return self.unmute()
+        return False
@@ -0,0 +1,285 @@
+"""
+MODULE 12: Pipeline Metrics
+Per-stage latency spans for the hot path, aggregated into rolling
+p50/p95/p99 and exposed on the overlay, in the log and over HTTP
+(Prometheus text format)
+"""
+
+import json
+import time
+import logging
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import numpy as np
+
+
+class PipelineMetrics:
+    """
+    Rolling per-stage latency statistics
+
+    Usage on the hot path:
+        start = metrics.now()
+        ... stage ...
+        metrics.record('detection', start)
+
+    When disabled, now() returns 0 and record() returns immediately, so
+    the instrumentation costs two attribute lookups per span.
+    """
+
+    STAGES = ('detection', 'features', 'classification', 'smoothing', 'motion', 'dispatch', 'rendering', 'frame')
+    QUANTILES = (50, 95, 99)
+
+    def __init__(self, enabled=True, window=300, stages=None):
+        """
+        Initialize metrics
+
+        Args:
+            enabled: Record spans (False makes now/record no-ops)
+            window: Number of recent samples per stage used for quantiles
+            stages: Stage names (default: STAGES)
+        """
+        self.enabled = enabled
+        self.window = window
+        self.stages = tuple(stages) if stages else self.STAGES
+
+        # Ring buffer of durations (ns) per stage
+        self._samples = {stage: np.zeros(window, dtype=np.int64) for stage in self.stages}
+        self._pos = dict.fromkeys(self.stages, 0)
+        self._counts = dict.fromkeys(self.stages, 0)
+        self._totals = dict.fromkeys(self.stages, 0)
+        self._lock = threading.Lock()
+
+        self._snapshot = None
+        self._snapshot_time = 0.0
+        self._last_log_time = None
+
+        # (group, callable returning a stats dict) exported as gauges; the
+        # providers read pipeline state, so they are only called through
+        # refresh_gauges() on the pipeline thread and the HTTP thread
+        # renders the copied values
+        self._gauges = []
+        self._gauge_values = []
+        self._gauge_time = None
+
+    def now(self):
+        """Span start timestamp (perf_counter_ns), 0 when disabled"""
+        return time.perf_counter_ns() if self.enabled else 0
+
+    def record(self, stage, start_ns):
+        """
+        Close a span started with now()
+
+        Args:
+            stage: Stage name
+            start_ns: Value returned by now()
+        """
+        if not self.enabled:
+            return
+        duration = time.perf_counter_ns() - start_ns
+        with self._lock:
+            pos = self._pos[stage]
+            self._samples[stage][pos] = duration
+            self._pos[stage] = (pos + 1) % self.window
+            self._counts[stage] += 1
+            self._totals[stage] += duration
+
+    def snapshot(self, max_age=0.0):
+        """
+        Per-stage statistics in milliseconds
+
+        Args:
+            max_age: Reuse the previous snapshot if it is younger than this (seconds)
+
+        Returns:
+            Dict of {stage: {'count', 'total_ms', 'p50_ms', 'p95_ms', 'p99_ms'}};
+            quantiles are over the last `window` spans
+        """
+        now = time.perf_counter()
+        if self._snapshot is not None and now - self._snapshot_time < max_age:
+            return self._snapshot
+
+        with self._lock:
+            copies = {
+                stage: (self._samples[stage][:min(self._counts[stage], self.window)].copy(),
+                        self._counts[stage], self._totals[stage])
+                for stage in self.stages
+            }
+
+        snapshot = {}
+        for stage, (samples, count, total) in copies.items():
+            stats = {'count': count, 'total_ms': total / 1e6}
+            if len(samples):
+                quantiles = np.percentile(samples, self.QUANTILES) / 1e6
+            else:
+                quantiles = [0.0] * len(self.QUANTILES)
+            for q, value in zip(self.QUANTILES, quantiles):
+                stats[f'p{q}_ms'] = float(value)
+            snapshot[stage] = stats
+
+        self._snapshot = snapshot
+        self._snapshot_time = now
+        return snapshot
+
+    def add_gauges(self, group, provider):
+        """
+        Export another component's statistics alongside the stage latencies
+
+        Args:
+            group: Name used in the metric names, e.g. 'frame'
+            provider: Callable returning a dict of numeric stats (e.g. FrameTimer.get_stats)
+        """
+        self._gauges.append((group, provider))
+
+    def refresh_gauges(self, max_age=0.0):
+        """
+        Copy the gauge providers' current values (call from the thread that owns their state)
+
+        Args:
+            max_age: Keep the previous copy if it is younger than this (seconds)
+
+        Returns:
+            True if the values were copied
+        """
+        now = time.perf_counter()
+        if self._gauge_time is not None and now - self._gauge_time < max_age:
+            return False
+        values = [(group, dict(provider())) for group, provider in self._gauges]
+        with self._lock:
+            self._gauge_values = values
+        self._gauge_time = now
+        return True
+
+    def to_prometheus(self, prefix='gesture_pipeline'):
+        """
+        Render the current statistics in Prometheus text exposition format
+
+        Returns:
+            Text with one summary metric (quantiles, sum, count) per stage,
+            plus one gauge per numeric value of each add_gauges provider,
+            as of the last refresh_gauges()
+        """
+        name = f"{prefix}_stage_latency_seconds"
+        lines = [
+            f"# HELP {name} Per-stage latency of the gesture pipeline",
+            f"# TYPE {name} summary",
+        ]
+        for stage, stats in self.snapshot().items():
+            for q in self.QUANTILES:
+                lines.append(f'{name}{{stage="{stage}",quantile="{q / 100}"}} {stats[f"p{q}_ms"] / 1000:.9f}')
+            lines.append(f'{name}_sum{{stage="{stage}"}} {stats["total_ms"] / 1000:.9f}')
+            lines.append(f'{name}_count{{stage="{stage}"}} {stats["count"]}')
+
+        with self._lock:
+            gauge_values = self._gauge_values
+        for group, values in gauge_values:
+            for key, value in values.items():
+                if isinstance(value, bool) or not isinstance(value, (int, float)):
+                    continue
+                gauge = f"{prefix}_{group}_{key}"
+                lines.append(f"# TYPE {gauge} gauge")
+                lines.append(f"{gauge} {value}")
+        return "\n".join(lines) + "\n"
+
+    def log_if_due(self, logger, interval, **extra):
+        """
+        Emit one structured (JSON) log line every `interval` seconds
+
+        Args:
+            logger: logging.Logger (or None to skip)
+            interval: Seconds between log lines
+            **extra: Additional fields for the log line (e.g. fps)
+
+        Returns:
+            True if a line was logged
+        """
+        if logger is None or not self.enabled:
+            return False
+        now = time.perf_counter()
+        if self._last_log_time is None:
+            self._last_log_time = now
+            return False
+        if now - self._last_log_time < interval:
+            return False
+        self._last_log_time = now
+
+        record = {'event': 'pipeline_metrics', **extra}
+        for stage, stats in self.snapshot().items():
+            record[stage] = {key: round(value, 3) for key, value in stats.items() if key.startswith('p')}
+        logger.info(json.dumps(record))
+        return True
+
+
+class MetricsServer:
+    """
+    Serve PipelineMetrics at http://host:port/metrics from a daemon thread
+    """
+
+    def __init__(self, metrics, host='127.0.0.1', port=9108):
+        """
+        Initialize metrics server
+
+        Args:
+            metrics: PipelineMetrics to expose
+            host: Bind address (localhost by default; use 0.0.0.0 to expose it)
+            port: TCP port (0 picks a free port)
+        """
+        self.metrics = metrics
+        self.host = host
+        self.port = port
+        self._server = None
+        self._thread = None
+
+    def start(self):
+        """Start serving; returns self"""
+        metrics = self.metrics
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?')[0] != '/metrics':
+                    self.send_error(404)
+                    return
+                body = metrics.to_prometheus().encode()
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop serving"""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+
+def setup_logging(log_config):
+    """
+    Configure the gesture_control logger from LOG_CONFIG
+
+    Args:
+        log_config: Dict with enable_logging, log_level, log_file
+
+    Returns:
+        logging.Logger, or None when logging is disabled
+    """
+    if not log_config.get('enable_logging', False):
+        return None
+
+    logger = logging.getLogger('gesture_control')
+    logger.setLevel(getattr(logging, log_config.get('log_level', 'INFO')))
+    if not logger.handlers:
+        handler = logging.FileHandler(log_config.get('log_file', 'gesture_control.log'), delay=True)
+        handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(name)s %(message)s'))
+        logger.addHandler(handler)
+    return logger
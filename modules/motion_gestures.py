@@ -0,0 +1,251 @@
+"""
+MODULE 16: Dynamic Gestures
+Streaming recognizer for hand motions (swipes, circles, push/pull) over a
+fixed-length ring buffer of landmark frames
+Path length, turning and displacement are updated incrementally, so each
+frame costs the same regardless of the window length
+"""
+
+import math
+import time
+import numpy as np
+
+
+class MotionGestureRecognizer:
+    """
+    Recognize motion gestures from a stream of hand landmarks
+
+    Per frame the hand is reduced to its palm centre (wrist and finger
+    bases) and its size (wrist to middle-finger base). Over the last
+    `window` frames the recognizer keeps:
+        displacement - palm centre newest minus oldest
+        path         - summed step lengths
+        turning      - summed signed heading change between steps
+        scale change - log ratio of newest to oldest hand size
+    Each step and turn is stored with the oldest frame it involves and
+    subtracted when that frame leaves the window.
+
+    Motions:
+        swipe_left/right/up/down - fast, straight palm movement
+        circle_cw/circle_ccw     - palm path turning through most of a full circle
+        push/pull                - hand growing/shrinking in the image (towards/away from the camera)
+
+    The buffer is cleared after each detection and frames are ignored for
+    `cooldown` seconds, so a long motion fires once.
+    """
+
+    SWIPE_LEFT = "swipe_left"
+    SWIPE_RIGHT = "swipe_right"
+    SWIPE_UP = "swipe_up"
+    SWIPE_DOWN = "swipe_down"
+    CIRCLE_CW = "circle_cw"
+    CIRCLE_CCW = "circle_ccw"
+    PUSH = "push"
+    PULL = "pull"
+
+    PALM_POINTS = [0, 5, 9, 13, 17]  # Wrist and finger bases
+
+    def __init__(self, enabled=True, window=30, min_frames=5, swipe_distance=0.25, swipe_speed=0.8, straightness=0.8,
+                 circle_turn=1.6 * math.pi, circle_path=0.3, push_scale=0.3, min_step=0.004, cooldown=0.5):
+        """
+        Initialize motion recognizer
+
+        Args:
+            enabled: False makes update() a no-op returning None
+            window: Frames kept in the ring buffer
+            min_frames: Frames needed before anything is recognized
+            swipe_distance: Minimum palm displacement for a swipe (normalized units)
+            swipe_speed: Minimum palm speed on the latest frame of a swipe (normalized units per second)
+            straightness: Minimum displacement / path length for a swipe
+            circle_turn: Minimum total turning for a circle (radians)
+            circle_path: Minimum palm path length for a circle
+            push_scale: Minimum |log(size change)| for push/pull
+            min_step: Steps shorter than this are ignored for turning (jitter)
+            cooldown: Seconds after a detection during which frames are ignored
+        """
+        self.enabled = enabled
+        self.window = window
+        self.min_frames = min_frames
+        self.swipe_distance = swipe_distance
+        self.swipe_speed = swipe_speed
+        self.straightness = straightness
+        self.circle_turn = circle_turn
+        self.circle_path = circle_path
+        self.push_scale = push_scale
+        self.min_step = min_step
+        self.cooldown = cooldown
+
+        # Ring buffer, indexed by frame number % window
+        self._x = np.zeros(window)
+        self._y = np.zeros(window)
+        self._scale = np.zeros(window)
+        self._time = np.zeros(window)
+        # Step length / turn owned by the oldest frame they involve
+        self._step = np.zeros(window)
+        self._turn = np.zeros(window)
+
+        self.motions_detected = 0
+        self._cooldown_until = None
+        self.reset()
+
+    def reset(self):
+        """Clear the buffer (e.g. when the hand is lost)"""
+        self._step[:] = 0.0
+        self._turn[:] = 0.0
+        self._n = 0          # Frames pushed since reset
+        self._path = 0.0
+        self._turning = 0.0
+        self._last_step = None
+        self._last_step_start = 0
+        self._speed = 0.0
+
+    def update(self, landmarks, timestamp=None):
+        """
+        Add one frame and check for a completed motion
+
+        Args:
+            landmarks: (21, 3) normalized landmarks, or None when no hand is visible
+            timestamp: Frame time in seconds (default: time.perf_counter())
+
+        Returns:
+            Motion name, or None
+        """
+        if not self.enabled:
+            return None
+        if landmarks is None:
+            if self._n:
+                self.reset()
+            return None
+        if timestamp is None:
+            timestamp = time.perf_counter()
+        if self._cooldown_until is not None:
+            if timestamp < self._cooldown_until:
+                return None
+            self._cooldown_until = None
+
+        landmarks = np.asarray(landmarks)
+        x, y = landmarks[self.PALM_POINTS, :2].mean(axis=0)
+        scale = math.hypot(landmarks[9, 0] - landmarks[0, 0], landmarks[9, 1] - landmarks[0, 1])
+
+        window = self.window
+        n = self._n
+        slot = n % window
+
+        # Evict the oldest frame and everything it owns
+        if n >= window:
+            self._path -= self._step[slot]
+            self._turning -= self._turn[slot]
+            self._step[slot] = 0.0
+            self._turn[slot] = 0.0
+
+        if n >= 1:
+            prev = (n - 1) % window
+            dx, dy = x - self._x[prev], y - self._y[prev]
+            length = math.hypot(dx, dy)
+            self._step[prev] = length
+            self._path += length
+            dt = timestamp - self._time[prev]
+            self._speed = length / dt if dt > 0 else 0.0
+
+            # Turning from the last real step to this one, owned by the frame that step started at
+            if length >= self.min_step:
+                if self._last_step is not None and n - self._last_step_start < window:
+                    px, py = self._last_step
+                    turn = math.atan2(px * dy - py * dx, px * dx + py * dy)
+                    owner = self._last_step_start % window
+                    self._turn[owner] += turn
+                    self._turning += turn
+                self._last_step = (dx, dy)
+                self._last_step_start = n - 1
+
+        self._x[slot] = x
+        self._y[slot] = y
+        self._scale[slot] = scale
+        self._time[slot] = timestamp
+        self._n = n + 1
+
+        # Cancel floating-point drift in the running sums now and then
+        if self._n % (window * 100) == 0:
+            self._path = float(self._step.sum())
+            self._turning = float(self._turn.sum())
+
+        motion = self._classify()
+        if motion is not None:
+            self.motions_detected += 1
+            self.reset()
+            self._cooldown_until = timestamp + self.cooldown
+        return motion
+
+    def _classify(self):
+        """Match the current window statistics against the motion rules"""
+        count = min(self._n, self.window)
+        if count < self.min_frames:
+            return None
+
+        newest = (self._n - 1) % self.window
+        oldest = (self._n - count) % self.window
+        dx = self._x[newest] - self._x[oldest]
+        dy = self._y[newest] - self._y[oldest]
+        distance = math.hypot(dx, dy)
+
+        # Circle: the path turned through most of a revolution (image y points down)
+        if abs(self._turning) >= self.circle_turn and self._path >= self.circle_path:
+            return self.CIRCLE_CW if self._turning > 0 else self.CIRCLE_CCW
+
+        # Swipe: far and straight, and still moving fast
+        if (distance >= self.swipe_distance and distance >= self.straightness * self._path
+                and self._speed >= self.swipe_speed):
+            if abs(dx) >= 2 * abs(dy):
+                return self.SWIPE_RIGHT if dx > 0 else self.SWIPE_LEFT
+            if abs(dy) >= 2 * abs(dx):
+                return self.SWIPE_DOWN if dy > 0 else self.SWIPE_UP
+
+        # Push/pull: hand size changed while the palm stayed roughly in place
+        if self._scale[oldest] > 0 and self._scale[newest] > 0 and distance < self.swipe_distance / 2:
+            scale_change = math.log(self._scale[newest] / self._scale[oldest])
+            if scale_change >= self.push_scale:
+                return self.PUSH
+            if scale_change <= -self.push_scale:
+                return self.PULL
+
+        return None
+
+    def get_stats(self):
+        """Current window statistics"""
+        count = min(self._n, self.window)
+        stats = {'frames': count, 'path': self._path, 'turning': self._turning,
+                 'motions_detected': self.motions_detected}
+        if count:
+            newest = (self._n - 1) % self.window
+            oldest = (self._n - count) % self.window
+            stats['displacement'] = (float(self._x[newest] - self._x[oldest]),
+                                     float(self._y[newest] - self._y[oldest]))
+        return stats
+
+
+def recognize_sequence(landmarks, timestamps, num_hands=None, recognizer=None):
+    """
+    Run the recognizer over a recorded landmark sequence
+
+    Args:
+        landmarks: (N, 21, 3) or (N, max_hands, 21, 3) landmarks (first hand used)
+        timestamps: (N,) frame times in seconds
+        num_hands: Optional (N,) hands per frame; frames with 0 count as no hand
+        recognizer: MotionGestureRecognizer (default: new one with default settings)
+
+    Returns:
+        List of (frame_index, motion) tuples
+    """
+    if recognizer is None:
+        recognizer = MotionGestureRecognizer()
+    landmarks = np.asarray(landmarks)
+    if landmarks.ndim == 4:
+        landmarks = landmarks[:, 0]
+
+    motions = []
+    for i, (frame_landmarks, timestamp) in enumerate(zip(landmarks, timestamps)):
+        present = num_hands is None or num_hands[i] > 0
+        motion = recognizer.update(frame_landmarks if present else None, float(timestamp))
+        if motion is not None:
+            motions.append((i, motion))
+    return motions
@@ -0,0 +1,122 @@
+"""
+MODULE 15: Overlay Rendering
+Cheap on-frame UI: translucent panels are blended only inside their
+rectangle (no full-frame copy), with their static text pre-rendered
+into the panel sprite and re-rendered only when the text changes
+"""
+
+import cv2
+import numpy as np
+
+
+class PanelSprite:
+    """
+    Pre-rendered translucent panel with text
+
+    The panel colour, its opacity and the text are folded into two images:
+        out = roi * scale / 255 + offset
+    so drawing the panel and all of its text costs one multiply and one
+    add over the panel rectangle, the same as blending an empty panel.
+    """
+
+    def __init__(self, size, alpha, color=(0, 0, 0), lines=()):
+        """
+        Render the panel
+
+        Args:
+            size: (width, height) of the panel
+            alpha: Opacity of the panel colour
+            color: BGR panel colour
+            lines: Text as (text, org, font, scale, color, thickness) tuples,
+                   org relative to the panel's top-left corner (as cv2.putText)
+        """
+        width, height = size
+        offset = np.empty((height, width, 3), dtype=np.float32)
+        offset[:] = np.array(color, dtype=np.float32) * alpha
+        scale = np.full((height, width, 1), 1.0 - alpha, dtype=np.float32)
+
+        # Text is opaque on top of the blended panel: out = under * (1 - c) + text_color * c
+        coverage = np.zeros((height, width), dtype=np.uint8)
+        for text, org, font, font_scale, text_color, thickness in lines:
+            coverage[:] = 0
+            cv2.putText(coverage, text, org, font, font_scale, 255, thickness)
+            c = (coverage.astype(np.float32) / 255.0)[..., None]
+            offset = offset * (1.0 - c) + np.array(text_color, dtype=np.float32) * c
+            scale = scale * (1.0 - c)
+
+        self.size = size
+        self.scale = np.round(np.repeat(scale, 3, axis=2) * 255.0).astype(np.uint8)
+        self.offset = np.round(offset).astype(np.uint8)
+
+    def draw(self, frame, top_left):
+        """
+        Blend the panel into frame in place
+
+        Args:
+            frame: BGR frame
+            top_left: (x, y) position of the panel
+        """
+        x, y = top_left
+        width, height = self.size
+        frame_h, frame_w = frame.shape[:2]
+
+        x1, y1 = max(x, 0), max(y, 0)
+        x2, y2 = min(x + width, frame_w), min(y + height, frame_h)
+        if x1 >= x2 or y1 >= y2:
+            return
+
+        sprite = (slice(y1 - y, y2 - y), slice(x1 - x, x2 - x))
+        roi = frame[y1:y2, x1:x2]
+        frame[y1:y2, x1:x2] = cv2.add(
+            cv2.multiply(roi, self.scale[sprite], scale=1 / 255.0),
+            self.offset[sprite]
+        )
+
+
+class OverlayRenderer:
+    """
+    Named translucent panels, each cached as a PanelSprite
+
+    A panel is re-rendered only when its size, colour or text changes;
+    on every other frame drawing it is a blend over its rectangle.
+    Text that changes every frame (FPS, confidence) should be drawn
+    with cv2.putText after the panel.
+    """
+
+    def __init__(self):
+        """Initialize renderer"""
+        self._panels = {}
+        self.sprites_rendered = 0
+
+    def panel(self, frame, name, top_left, bottom_right, alpha, color=(0, 0, 0), lines=()):
+        """
+        Draw a translucent panel with text
+
+        Same look as cv2.rectangle on a copy of the frame, then
+        cv2.addWeighted(copy, alpha, frame, 1 - alpha) and cv2.putText
+        for each line, but only the panel rectangle is touched.
+
+        Args:
+            frame: BGR frame
+            name: Cache slot for this panel
+            top_left: (x, y) corner
+            bottom_right: (x, y) opposite corner (inclusive, as cv2.rectangle)
+            alpha: Opacity of the panel colour
+            color: BGR panel colour
+            lines: Text as (text, org, font, scale, color, thickness) tuples
+                   in frame coordinates
+        """
+        x, y = top_left
+        size = (bottom_right[0] - x + 1, bottom_right[1] - y + 1)
+        lines = tuple(
+            (text, (org[0] - x, org[1] - y), font, scale, tuple(text_color), thickness)
+            for text, org, font, scale, text_color, thickness in lines
+        )
+        content = (size, alpha, tuple(color), lines)
+
+        cached = self._panels.get(name)
+        if cached is None or cached[0] != content:
+            cached = (content, PanelSprite(size, alpha, color, lines))
+            self._panels[name] = cached
+            self.sprites_rendered += 1
+        cached[1].draw(frame, top_left)
@@ -0,0 +1,236 @@
+"""
+MODULE 13: Reaction Latency Tracing
+Breaks down the delay from a hand pose appearing in front of the camera
+to the media action taking effect, for every dispatched action
+
+All timestamps are time.perf_counter() seconds (the clock ThreadedCapture
+uses for frame capture times).
+"""
+
+import os
+import json
+import threading
+import numpy as np
+
+
+class ReactionTracer:
+    """
+    Per-action reaction latency breakdown
+
+    Phases of one action (all in milliseconds):
+        pose_recognition - hand first seen -> first frame classified as the pose
+        smoothing_wait   - first frame of the pose -> frame where the vote flipped
+        capture_lag      - capture of that frame -> start of its processing
+        inference        - processing start -> action dispatched
+        queue_wait       - dispatched -> backend starts executing
+        backend          - backend execution (key press, COM, HTTP)
+        total            - hand first seen (or pose onset) -> backend finished
+
+    Every trace has a status: 'executed', 'suppressed' (the backend's
+    cooldown rejected it; the cooldown time left is recorded), 'failed'
+    (the backend raised; the error is recorded), or 'dropped' / 'coalesced'
+    (the dispatcher discarded it, so it has no queue or backend phases).
+    Only executed actions count towards the phase statistics.
+
+    Hooks:
+        observe() on every processed frame, begin() when dispatching,
+        complete() and discard() as ActionDispatcher's on_complete and
+        on_discard callbacks
+    """
+
+    STATUSES = ('executed', 'suppressed', 'failed', 'dropped', 'coalesced')
+
+    PHASES = ('pose_recognition', 'smoothing_wait', 'capture_lag', 'inference', 'queue_wait', 'backend', 'total')
+
+    def __init__(self, trace_path=None, backend=None):
+        """
+        Initialize reaction tracer
+
+        Args:
+            trace_path: Optional JSON-lines file, one record per action
+            backend: Action backend; its last_cooldown_remaining is recorded if present
+        """
+        self.trace_path = trace_path
+        self.backend = backend
+        self.traces = []
+        self._lock = threading.Lock()
+        self._file = open(trace_path, 'w') if trace_path else None
+
+        # Current hand presence and raw-prediction runs
+        self._hand_onset = None
+        self._run_gesture = None
+        self._run_start = None
+        self._run_frames = 0
+
+    def observe(self, capture_time, hand_present, raw_gesture):
+        """
+        Track hand presence and the current run of identical raw predictions
+
+        Args:
+            capture_time: Frame capture time
+            hand_present: A hand was detected in the frame
+            raw_gesture: Unsmoothed prediction (None if no hand or low confidence)
+        """
+        # Plain Python value, so comparing with a chord tuple in begin() is a scalar test
+        if isinstance(raw_gesture, np.generic):
+            raw_gesture = raw_gesture.item()
+        if not hand_present:
+            self._hand_onset = None
+        elif self._hand_onset is None:
+            self._hand_onset = capture_time
+
+        if raw_gesture != self._run_gesture or raw_gesture is None:
+            self._run_gesture = raw_gesture
+            self._run_start = capture_time
+            self._run_frames = 0
+        self._run_frames += 1
+
+    def begin(self, action, gesture, capture_time, process_start, dispatch_time):
+        """
+        Start a trace for an action about to be dispatched
+
+        Args:
+            action: Action string
+            gesture: Smoothed gesture (or two-hand chord tuple) that triggered it
+            capture_time: Capture time of the triggering frame
+            process_start: Time processing of that frame started
+            dispatch_time: Time the action is handed to the dispatcher
+
+        Returns:
+            Trace dict (pass to ActionDispatcher.dispatch)
+        """
+        if self._run_gesture == gesture and self._run_start is not None:
+            pose_onset = self._run_start
+            smoothing_frames = self._run_frames
+        else:
+            pose_onset = capture_time
+            smoothing_frames = 1
+
+        hand_onset = self._hand_onset if self._hand_onset is not None else pose_onset
+        return {
+            'action': action,
+            'gesture': gesture,
+            'hand_onset': hand_onset,
+            'pose_onset': pose_onset,
+            'smoothing_frames': smoothing_frames,
+            'capture_time': capture_time,
+            'process_start': process_start,
+            'dispatch_time': dispatch_time,
+        }
+
+    def complete(self, trace, start, end, result, error=None):
+        """
+        Finish a trace (ActionDispatcher on_complete callback, worker thread)
+
+        Args:
+            trace: Dict returned by begin()
+            start: Backend execution start
+            end: Backend execution end
+            result: Backend return value (False = suppressed by cooldown)
+            error: Exception the backend raised, or None
+        """
+        if error is not None:
+            status = 'failed'
+        elif result is False:
+            status = 'suppressed'
+        else:
+            status = 'executed'
+
+        ms = lambda a, b: round((b - a) * 1000.0, 3)
+        record = self._record(trace, status)
+        record.update({
+            'queue_wait': ms(trace['dispatch_time'], start),
+            'backend': ms(start, end),
+            'total': ms(trace['hand_onset'], end),
+        })
+        if error is not None:
+            record['error'] = repr(error)
+        cooldown = getattr(self.backend, 'last_cooldown_remaining', None)
+        if cooldown is not None and status == 'suppressed':
+            record['cooldown_remaining'] = round(cooldown * 1000.0, 3)
+        self._append(record)
+
+    def discard(self, trace, reason):
+        """
+        Record an action the dispatcher never ran (on_discard callback)
+
+        Args:
+            trace: Dict returned by begin()
+            reason: 'dropped' or 'coalesced'
+        """
+        self._append(self._record(trace, reason))
+
+    def _record(self, trace, status):
+        """Trace fields known before the backend runs"""
+        ms = lambda a, b: round((b - a) * 1000.0, 3)
+        gesture = trace['gesture']
+        return {
+            'action': trace['action'],
+            'gesture': gesture.item() if isinstance(gesture, np.generic) else gesture,
+            'status': status,
+            'executed': status == 'executed',
+            'smoothing_frames': trace['smoothing_frames'],
+            'pose_recognition': ms(trace['hand_onset'], trace['pose_onset']),
+            'smoothing_wait': ms(trace['pose_onset'], trace['capture_time']),
+            'capture_lag': ms(trace['capture_time'], trace['process_start']),
+            'inference': ms(trace['process_start'], trace['dispatch_time']),
+        }
+
+    def _append(self, record):
+        """Keep a finished record and log it"""
+        with self._lock:
+            self.traces.append(record)
+            if self._file is not None:
+                self._file.write(json.dumps(record) + "\n")
+                self._file.flush()
+
+    def summary(self):
+        """
+        Aggregate all traces
+
+        Returns:
+            Dict with the number of actions, a count per status and
+            per-phase {'p50', 'p95', 'max'} in ms (over executed actions only)
+        """
+        with self._lock:
+            traces = list(self.traces)
+
+        executed = [t for t in traces if t['executed']]
+        report = {'actions': len(traces)}
+        for status in self.STATUSES:
+            report[status] = sum(1 for t in traces if t['status'] == status)
+        report['phases'] = {}
+        for phase in self.PHASES:
+            values = np.array([t[phase] for t in executed], dtype=np.float64)
+            if len(values):
+                p50, p95 = np.percentile(values, [50, 95])
+                report['phases'][phase] = {'p50': float(p50), 'p95': float(p95), 'max': float(values.max())}
+        return report
+
+    def print_summary(self):
+        """Print the summary report"""
+        report = self.summary()
+        print(f"\n{'='*60}")
+        print("⏱️  GESTURE-TO-ACTION REACTION LATENCY")
+        print(f"{'='*60}")
+        print(f"Actions: {report['actions']} (executed {report['executed']}, "
+              f"suppressed by cooldown {report['suppressed']}, failed {report['failed']}, "
+              f"dropped {report['dropped']}, coalesced {report['coalesced']})")
+        if report['phases']:
+            print(f"{'Phase':<20}{'p50 (ms)':>12}{'p95 (ms)':>12}{'max (ms)':>12}")
+            for phase, stats in report['phases'].items():
+                print(f"{phase:<20}{stats['p50']:>12.1f}{stats['p95']:>12.1f}{stats['max']:>12.1f}")
+        print(f"{'='*60}\n")
+        return report
+
+    def close(self):
+        """Close the trace log and write the summary next to it"""
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.close()
+            self._file = None
+
+        summary_path = os.path.splitext(self.trace_path)[0] + ".summary.json"
+        with open(summary_path, 'w') as f:
+            json.dump(self.summary(), f, indent=2)
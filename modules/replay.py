@@ -0,0 +1,323 @@
+"""
+MODULE 11: Session Replay
+Feed recorded video or landmark streams through GestureControlPipeline
+without a camera, window or real media keys
+
+Landmark sessions (.npz):
+    timestamps - (N,) float64 seconds from the start of the recording
+    landmarks  - (N, max_hands, 21, 3) float32
+    num_hands  - (N,) int32 hands present per frame
+"""
+
+import time
+import cv2
+import numpy as np
+from modules.frame_capture import open_capture
+from modules.hand_detection import draw_hand_landmarks
+
+
+class RecordingController:
+    """
+    Fake MediaController that records actions instead of executing them
+    """
+
+    def __init__(self, volume=0.5, volume_step=0.05):
+        """
+        Initialize recording controller
+
+        Args:
+            volume: Starting simulated volume (0.0 - 1.0)
+            volume_step: Simulated volume change per step
+        """
+        self.volume = volume
+        self.volume_step = volume_step
+        self.actions = []
+
+        # Set by the replay loop so actions can be tied to a frame
+        self.frame_index = None
+        self.timestamp = None
+
+    def execute_action(self, action, steps=1):
+        """Record an action (same contract as MediaController.execute_action)"""
+        self.actions.append({
+            'frame': self.frame_index,
+            'timestamp': self.timestamp,
+            'action': action,
+            'steps': steps,
+        })
+        if action == "volume_up":
+            self.volume = min(1.0, self.volume + self.volume_step * steps)
+        elif action == "volume_down":
+            self.volume = max(0.0, self.volume - self.volume_step * steps)
+        return True
+
+    def set_volume(self, volume):
+        """Record an absolute volume change (same contract as MediaController.set_volume)"""
+        self.volume = max(0.0, min(1.0, volume))
+        self.actions.append({
+            'frame': self.frame_index,
+            'timestamp': self.timestamp,
+            'action': "set_volume",
+            'level': self.volume,
+        })
+
+    def get_volume(self):
+        """Simulated volume (0.0 - 1.0)"""
+        return self.volume
+
+    def get_cached_volume(self):
+        """Simulated volume (nothing to cache)"""
+        return self.volume
+
+
+class LandmarkStreamDetector:
+    """
+    HandDetector stand-in that returns recorded landmarks instead of running MediaPipe
+    Call set_landmarks() before each process_frame()
+    """
+
+    def __init__(self, max_hands=1):
+        """
+        Initialize landmark stream detector
+
+        Args:
+            max_hands: Maximum number of hands per frame
+        """
+        self.max_hands = max_hands
+        self.landmarks_buffer = np.zeros((max_hands, 21, 3), dtype=np.float32)
+        self.num_hands = 0
+        self.handedness = [None] * max_hands  # Not recorded; tracking falls back to position
+
+    def set_landmarks(self, landmarks, num_hands=None):
+        """
+        Load the next frame's landmarks
+
+        Args:
+            landmarks: (K, 21, 3) landmarks
+            num_hands: Number of valid hands in landmarks (default: K)
+        """
+        landmarks = np.asarray(landmarks, dtype=np.float32).reshape(-1, 21, 3)
+        if num_hands is None:
+            num_hands = len(landmarks)
+        self.num_hands = min(num_hands, self.max_hands)
+        self.landmarks_buffer[:self.num_hands] = landmarks[:self.num_hands]
+
+    def detect_hands(self, frame, draw=None):
+        """Same return value as HandDetector.detect_hands"""
+        return frame, list(self.landmarks_buffer[:self.num_hands])
+
+    def has_hand(self, frame):
+        """Same as HandDetector.has_hand: True if the current frame holds a hand"""
+        return self.num_hands > 0
+
+    def get_landmarks(self):
+        """Landmarks of the current frame (num_hands, 21, 3)"""
+        return self.landmarks_buffer[:self.num_hands]
+
+    def draw_landmarks(self, frame, landmarks=None):
+        """Same as HandDetector.draw_landmarks"""
+        if landmarks is None:
+            landmarks = self.get_landmarks()
+        return draw_hand_landmarks(frame, landmarks)
+
+
+class LandmarkRecorder:
+    """
+    Collect per-frame landmarks from a live run and save them as a session
+    """
+
+    def __init__(self, max_hands=1):
+        """
+        Initialize landmark recorder
+
+        Args:
+            max_hands: Maximum number of hands stored per frame
+        """
+        self.max_hands = max_hands
+        self.timestamps = []
+        self.landmarks = []
+        self.num_hands = []
+        self._start = None
+
+    def add(self, timestamp, landmarks):
+        """
+        Record one frame
+
+        Args:
+            timestamp: Frame time (any monotonic clock, in seconds)
+            landmarks: (K, 21, 3) landmarks of the hands in the frame
+        """
+        if self._start is None:
+            self._start = timestamp
+        landmarks = np.asarray(landmarks, dtype=np.float32).reshape(-1, 21, 3)
+        n = min(len(landmarks), self.max_hands)
+        frame_landmarks = np.zeros((self.max_hands, 21, 3), dtype=np.float32)
+        frame_landmarks[:n] = landmarks[:n]
+
+        self.timestamps.append(timestamp - self._start)
+        self.landmarks.append(frame_landmarks)
+        self.num_hands.append(n)
+
+    def __len__(self):
+        """Number of recorded frames"""
+        return len(self.timestamps)
+
+    def save(self, path):
+        """Save the recorded session to an .npz file"""
+        save_landmark_session(path, self.timestamps, self.landmarks, self.num_hands)
+
+
+def save_landmark_session(path, timestamps, landmarks, num_hands):
+    """
+    Save a landmark session
+
+    Args:
+        path: Output .npz path
+        timestamps: (N,) seconds from the start of the recording
+        landmarks: (N, max_hands, 21, 3) landmarks
+        num_hands: (N,) hands present per frame
+    """
+    np.savez(
+        path,
+        timestamps=np.asarray(timestamps, dtype=np.float64),
+        landmarks=np.asarray(landmarks, dtype=np.float32).reshape(len(timestamps), -1, 21, 3),
+        num_hands=np.asarray(num_hands, dtype=np.int32),
+    )
+
+
+def load_landmark_session(path):
+    """
+    Load a landmark session
+
+    Returns:
+        timestamps: (N,) float64
+        landmarks: (N, max_hands, 21, 3) float32
+        num_hands: (N,) int32
+    """
+    with np.load(path, allow_pickle=False) as data:
+        return data['timestamps'], data['landmarks'], data['num_hands']
+
+
+def _replay(pipeline, frames, realtime):
+    """
+    Run (timestamp, frame, prepare) items through pipeline.process_frame
+
+    prepare is called before each frame (used to load recorded landmarks).
+    Actions are tied to frames by waiting for the dispatcher after any
+    frame that dispatched one.
+    """
+    controller = pipeline.media_controller
+    dispatcher = pipeline.action_dispatcher
+    gestures = []
+    confidences = []
+
+    start = time.perf_counter()
+    first_timestamp = None
+
+    for frame_index, (timestamp, frame, prepare) in enumerate(frames):
+        if first_timestamp is None:
+            first_timestamp = timestamp
+        if realtime:
+            delay = (timestamp - first_timestamp) - (time.perf_counter() - start)
+            if delay > 0:
+                time.sleep(delay)
+
+        if prepare is not None:
+            prepare()
+        if isinstance(controller, RecordingController):
+            controller.frame_index = frame_index
+            controller.timestamp = timestamp
+
+        dispatched = dispatcher.dispatched
+        _, gesture, confidence = pipeline.process_frame(frame, timestamp=timestamp)
+        if dispatcher.dispatched != dispatched:
+            dispatcher.wait_idle()
+
+        gestures.append(gesture)
+        confidences.append(float(confidence))
+
+    elapsed = time.perf_counter() - start
+    dispatcher.wait_idle()
+
+    return {
+        'frames': len(gestures),
+        'elapsed': elapsed,
+        'fps': len(gestures) / elapsed if elapsed > 0 else 0.0,
+        'gestures': gestures,
+        'confidences': confidences,
+        'actions': list(controller.actions) if isinstance(controller, RecordingController) else [],
+        'scheduler': pipeline.frame_scheduler.get_stats(),
+        'dispatcher': dispatcher.get_stats(),
+    }
+
+
+def replay_video(pipeline, source, realtime=False, fps=None, flip=True):
+    """
+    Replay a video file or image directory through the pipeline
+
+    Args:
+        pipeline: GestureControlPipeline (headless, usually with a RecordingController)
+        source: Video file path or image directory
+        realtime: Pace frames at their timestamps instead of as fast as possible
+        fps: Frame rate used for timestamps (default: from the file, else 30)
+        flip: Mirror frames like the live loop does
+
+    Returns:
+        Dict with per-frame gestures, recorded actions and throughput
+    """
+    cap = open_capture(source)
+    if not cap.isOpened():
+        raise FileNotFoundError(f"Cannot open replay source: {source}")
+
+    if fps is None:
+        fps = cap.get(cv2.CAP_PROP_FPS) or 30.0
+
+    def frames():
+        index = 0
+        while True:
+            ret, frame = cap.read()
+            if not ret:
+                return
+            if flip:
+                frame = cv2.flip(frame, 1)
+            yield index / fps, frame, None
+            index += 1
+
+    try:
+        return _replay(pipeline, frames(), realtime)
+    finally:
+        cap.release()
+
+
+def replay_landmarks(pipeline, path, realtime=False, frame_size=(640, 480)):
+    """
+    Replay a recorded landmark session through the pipeline (no MediaPipe)
+
+    Args:
+        pipeline: GestureControlPipeline built with a LandmarkStreamDetector
+        path: Session .npz written by LandmarkRecorder
+        realtime: Pace frames at their recorded timestamps
+        frame_size: (width, height) of the blank frames passed to process_frame
+
+    Returns:
+        Dict with per-frame gestures, recorded actions and throughput
+    """
+    detector = pipeline.hand_detector
+    if not isinstance(detector, LandmarkStreamDetector):
+        raise ValueError("Landmark replay needs a pipeline built with hand_detector=LandmarkStreamDetector()")
+
+    timestamps, landmarks, num_hands = load_landmark_session(path)
+    width, height = frame_size
+
+    # Sessions hold only frames that were inferred live, and the blank
+    # frames carry no motion, so the scheduler must not skip any of them
+    pipeline.frame_scheduler.enabled = False
+    blank = np.zeros((height, width, 3), dtype=np.uint8)
+
+    def frames():
+        for i in range(len(timestamps)):
+            prepare = lambda i=i: detector.set_landmarks(landmarks[i], num_hands[i])
+            frame = blank if pipeline.headless else blank.copy()
+            yield float(timestamps[i]), frame, prepare
+
+    return _replay(pipeline, frames(), realtime)
@@ -10,10 +10,14 @@ Usage:
 
 import os
 import json
+import time
 import logging
+import threading
 from typing import Optional
 
+import requests
 import spotipy
+from spotipy.exceptions import SpotifyException
 from spotipy.oauth2 import SpotifyOAuth
 
 _log = logging.getLogger(__name__)
@@ -21,15 +25,63 @@ _log = logging.getLogger(__name__)
 DEFAULT_SCOPE = "user-modify-playback-state user-read-playback-state user-read-currently-playing user-read-private user-library-modify"
 TOKEN_FILE = "spotify_token.json"
 
+
+class PlaybackState:
+    """Short-lived cache of playback state, updated optimistically after commands."""
+
+    def __init__(self, ttl: float=2.0):
+        self.ttl = ttl
+        self.is_playing: Optional[bool] = None
+        self.volume: Optional[int] = None
+        self.device_id: Optional[str] = None
+        self.updated_at = 0.0
+
+    def is_fresh(self) -> bool:
+        return self.updated_at > 0 and time.monotonic() - self.updated_at < self.ttl
+
+    def update_from_playback(self, playback: Optional[dict]):
+        """Replace the cached state with a `current_playback()` response."""
+        device = (playback or {}).get("device") or {}
+        self.set(is_playing=bool(playback and playback.get("is_playing")),
+                 volume=device.get("volume_percent"),
+                 device_id=device.get("id"))
+
+    def set(self, **values):
+        for key, value in values.items():
+            setattr(self, key, value)
+        self.updated_at = time.monotonic()
+
+    def invalidate(self):
+        self.updated_at = 0.0
+
+    def as_dict(self) -> dict:
+        return {"is_playing": self.is_playing, "volume": self.volume, "device_id": self.device_id}
+
+
 class SpotifyAPI:
-    def __init__(self, client_id: Optional[str]=None, client_secret: Optional[str]=None, redirect_uri: str="http://localhost:8888/callback", scope: str=DEFAULT_SCOPE):
+    def __init__(self, client_id: Optional[str]=None, client_secret: Optional[str]=None, redirect_uri: str="http://localhost:8888/callback", scope: str=DEFAULT_SCOPE,
+                 state_ttl: float=2.0, token_refresh_margin: float=60.0, auto_refresh: bool=True, api_prefix: Optional[str]=None):
         self.client_id = client_id or os.environ.get("SPOTIFY_CLIENT_ID")
         self.client_secret = client_secret or os.environ.get("SPOTIFY_CLIENT_SECRET")
         self.redirect_uri = redirect_uri
         self.scope = scope
         self.sp: Optional[spotipy.Spotify] = None
+        # Separate client without urllib3 status retries for volume (see set_volume_percent)
+        self.volume_sp: Optional[spotipy.Spotify] = None
         self.oauth: Optional[SpotifyOAuth] = None
 
+        # Token kept in memory after the first load; refreshed before expiry
+        self.token_info: Optional[dict] = None
+        self.token_refresh_margin = token_refresh_margin
+        self.auto_refresh = auto_refresh
+        self._token_lock = threading.Lock()
+        self._refresh_stop = threading.Event()
+        self._refresh_thread: Optional[threading.Thread] = None
+
+        # Base URL override, e.g. a local stub server in tests
+        self.api_prefix = api_prefix
+        self.playback_state = PlaybackState(state_ttl)
+
         if not self.client_id or not self.client_secret:
             _log.debug("Spotify client credentials not provided; please set SPOTIFY_CLIENT_ID and SPOTIFY_CLIENT_SECRET env vars or pass them to SpotifyAPI.")
 
@@ -52,9 +104,70 @@ class SpotifyAPI:
         with open(TOKEN_FILE, "w") as f:
             json.dump(token_info, f)
         _log.info("Saved token to %s", TOKEN_FILE)
-        self.sp = spotipy.Spotify(auth=token_info["access_token"]) 
+        self.set_token(token_info)
         return token_info
 
+    def set_token(self, token_info: dict):
+        """Use `token_info` for all requests, reusing the existing client (and its HTTP session)."""
+        with self._token_lock:
+            self.token_info = token_info
+            if self.sp is None:
+                self.sp = spotipy.Spotify(auth=token_info["access_token"])
+                # A plain Session has no status retries, so a 429 surfaces at once with its headers
+                self.volume_sp = spotipy.Spotify(auth=token_info["access_token"], requests_session=requests.Session())
+                if self.api_prefix:
+                    self.sp.prefix = self.api_prefix
+                    self.volume_sp.prefix = self.api_prefix
+            else:
+                self.sp.set_auth(token_info["access_token"])
+                self.volume_sp.set_auth(token_info["access_token"])
+
+        if self.auto_refresh and token_info.get("refresh_token"):
+            self.start_token_refresher()
+
+    def refresh_token(self):
+        """Refresh the access token now and persist it."""
+        oauth = self._get_oauth()
+        token_info = oauth.refresh_access_token(self.token_info.get("refresh_token"))
+        with open(TOKEN_FILE, "w") as f:
+            json.dump(token_info, f)
+        self.set_token(token_info)
+        _log.info("Refreshed Spotify access token")
+        return token_info
+
+    def _seconds_until_refresh(self) -> float:
+        expires_at = (self.token_info or {}).get("expires_at")
+        if not expires_at:
+            return float("inf")
+        return expires_at - self.token_refresh_margin - time.time()
+
+    def start_token_refresher(self):
+        """Refresh the token on a background thread `token_refresh_margin` seconds before it expires."""
+        if self._refresh_thread is not None and self._refresh_thread.is_alive():
+            return
+        self._refresh_stop.clear()
+        self._refresh_thread = threading.Thread(target=self._refresh_loop, daemon=True)
+        self._refresh_thread.start()
+
+    def stop_token_refresher(self):
+        self._refresh_stop.set()
+        if self._refresh_thread is not None:
+            self._refresh_thread.join(timeout=1.0)
+            self._refresh_thread = None
+
+    def _refresh_loop(self):
+        while not self._refresh_stop.is_set():
+            wait = self._seconds_until_refresh()
+            if wait > 0:
+                # Wake up at least once a minute in case the token was replaced
+                self._refresh_stop.wait(min(wait, 60.0))
+                continue
+            try:
+                self.refresh_token()
+            except Exception as e:
+                _log.warning("Background token refresh failed: %s", e)
+                self._refresh_stop.wait(30.0)
+
     def load_token(self):
         oauth = self._get_oauth()
         token_info = None
@@ -68,7 +181,7 @@ class SpotifyAPI:
                 json.dump(token_info, f)
 
         if token_info:
-            self.sp = spotipy.Spotify(auth=token_info.get("access_token"))
+            self.set_token(token_info)
             return True
         return False
 
@@ -80,43 +193,227 @@ class SpotifyAPI:
                 return None
         return self.sp
 
+    def _refresh_playback_state(self, sp: spotipy.Spotify):
+        playback = sp.current_playback()
+        self.playback_state.update_from_playback(playback)
+        return playback
+
+    def _command(self, func, *args, **state):
+        """Run a playback command; on success apply `state` to the cache, on failure drop the cache."""
+        try:
+            func(*args)
+        except Exception:
+            self.playback_state.invalidate()
+            raise
+        if state:
+            self.playback_state.set(**state)
+        return True
+
     # Playback controls
     def play_pause(self):
         sp = self.get_spotify()
         if not sp:
             return False
-        current = sp.current_playback()
-        if not current or not current.get("is_playing"):
-            sp.start_playback()
-            return True
+        # One request when the cached state is fresh, two otherwise
+        if not self.playback_state.is_fresh():
+            self._refresh_playback_state(sp)
+        if not self.playback_state.is_playing:
+            return self._command(sp.start_playback, is_playing=True)
         else:
-            sp.pause_playback()
-            return True
+            return self._command(sp.pause_playback, is_playing=False)
 
     def next_track(self):
         sp = self.get_spotify()
         if not sp:
             return False
-        sp.next_track()
-        return True
+        return self._command(sp.next_track)
 
     def previous_track(self):
         sp = self.get_spotify()
         if not sp:
             return False
-        sp.previous_track()
-        return True
+        return self._command(sp.previous_track)
 
     def set_volume_percent(self, percent: int):
-        sp = self.get_spotify()
-        if not sp:
+        """Set the volume; a 429 raises SpotifyException (with Retry-After) instead of being retried.
+
+        spotipy's default session retries 429 internally, blocking for
+        several seconds and then raising without the response headers, so
+        volume requests go through `volume_sp`, which does not retry.
+        """
+        if not self.get_spotify():
             return False
         percent = max(0, min(100, int(percent)))
-        sp.volume(percent)
-        return True
+        return self._command(self.volume_sp.volume, percent, volume=percent)
 
     def get_current_playback(self):
         sp = self.get_spotify()
         if not sp:
             return None
-        return sp.current_playback()
+        return self._refresh_playback_state(sp)
+
+    def get_playback_state(self) -> Optional[dict]:
+        """Cached playback state (is_playing, volume, device_id); fetched only when stale."""
+        if not self.playback_state.is_fresh():
+            sp = self.get_spotify()
+            if not sp:
+                return None
+            self._refresh_playback_state(sp)
+        return self.playback_state.as_dict()
+
+
+class SpotifyVolumeController:
+    """Coalesce gesture-driven volume changes into at most one request per `min_interval`.
+
+    `nudge()` and `set_target()` only update the desired level and return
+    immediately; a worker thread sends the latest level (last writer wins).
+    A 429 response pauses sending for the server's Retry-After.
+    """
+
+    def __init__(self, api: SpotifyAPI, min_interval: float=0.3, step: int=5, default_level: int=50):
+        self.api = api
+        self.min_interval = min_interval
+        self.step = step
+        self.default_level = default_level
+
+        self.level: Optional[int] = None   # desired level, None until the current volume is known
+        self.pending_delta = 0             # nudges received before the level was known
+        self.sent_level: Optional[int] = None
+        self.next_send_time = 0.0
+
+        self.updates = 0
+        self.requests_sent = 0
+        self.rate_limited = 0
+        self.dropped = 0
+
+        self._cond = threading.Condition()
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+
+    @staticmethod
+    def _clamp(percent) -> int:
+        return max(0, min(100, int(round(percent))))
+
+    def nudge(self, steps: int=1):
+        """Move the target by `steps` * `step` percent (negative to lower)."""
+        with self._cond:
+            if self.level is None:
+                self.pending_delta += steps * self.step
+            else:
+                self.level = self._clamp(self.level + steps * self.step)
+            self.updates += 1
+            self._cond.notify()
+        self._ensure_running()
+
+    def set_volume(self, volume: float):
+        """Set an absolute target from a 0.0 - 1.0 level (same contract as MediaController.set_volume)."""
+        self.set_target(volume * 100)
+
+    def set_target(self, percent):
+        """Set an absolute target level, replacing any pending nudges."""
+        with self._cond:
+            self.level = self._clamp(percent)
+            self.pending_delta = 0
+            self.updates += 1
+            self._cond.notify()
+        self._ensure_running()
+
+    def _ensure_running(self):
+        if not self._running:
+            self._running = True
+            self._thread = threading.Thread(target=self._worker, daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: float=1.0):
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _is_dirty(self) -> bool:
+        return self.pending_delta != 0 or (self.level is not None and self.level != self.sent_level)
+
+    def _base_level(self) -> int:
+        try:
+            state = self.api.get_playback_state()
+        except Exception as e:
+            _log.warning("Could not read current volume: %s", e)
+            state = None
+        if state and state.get("volume") is not None:
+            return state["volume"]
+        return self.sent_level if self.sent_level is not None else self.default_level
+
+    def _worker(self):
+        while True:
+            with self._cond:
+                while self._running and not self._is_dirty():
+                    self._cond.wait()
+                if not self._running:
+                    return
+                wait = self.next_send_time - time.monotonic()
+                if wait > 0:
+                    self._cond.wait(wait)
+                    continue
+                need_base = self.level is None
+
+            # Resolve the starting level off the lock (may be an HTTP request)
+            if need_base:
+                base = self._base_level()
+                with self._cond:
+                    if self.level is None:
+                        self.level = self._clamp(base + self.pending_delta)
+                        self.pending_delta = 0
+
+            with self._cond:
+                level = self.level
+                if level == self.sent_level:
+                    continue
+
+            now = time.monotonic()
+            try:
+                if self.api.set_volume_percent(level):
+                    self.requests_sent += 1
+                else:
+                    _log.warning("No Spotify client; dropping volume %d", level)
+                    self.dropped += 1
+                self.sent_level = level
+                self.next_send_time = now + self.min_interval
+            except SpotifyException as e:
+                if e.http_status != 429:
+                    _log.warning("Volume request failed: %s", e)
+                    self.sent_level = level  # do not retry a rejected level
+                    continue
+                self.rate_limited += 1
+                retry_after = (e.headers or {}).get("Retry-After")
+                try:
+                    retry_after = float(retry_after)
+                except (TypeError, ValueError):
+                    retry_after = 1.0
+                _log.info("Spotify rate limit hit; retrying volume in %.1fs", retry_after)
+                self.next_send_time = now + max(retry_after, self.min_interval)
+            except Exception as e:
+                _log.warning("Volume request failed: %s", e)
+                self.sent_level = level
+                self.next_send_time = now + self.min_interval
+
+    def wait_idle(self, timeout: float=2.0) -> bool:
+        """Wait until the latest target has been sent (useful in tests)."""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            with self._cond:
+                if not self._is_dirty():
+                    return True
+            time.sleep(0.005)
+        return False
+
+    def get_stats(self) -> dict:
+        return {
+            "level": self.level,
+            "sent_level": self.sent_level,
+            "updates": self.updates,
+            "requests_sent": self.requests_sent,
+            "rate_limited": self.rate_limited,
+            "dropped": self.dropped,
+        }
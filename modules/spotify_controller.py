@@ -6,20 +6,147 @@ Control Spotify specifically using hand gestures
 import pyautogui
 import time
 import subprocess
+import threading
 import psutil
 
+class ProcessPresenceCache:
+    """
+    Remember a process PID instead of scanning the process table each time
+    
+    A cached process is validated with Process.is_running(), which
+    compares its create time with a fresh lookup of the PID (guards
+    against PID reuse). The full psutil.process_iter scan only runs
+    on a miss, at most once per miss_ttl while the process is absent, or
+    periodically on a background thread when refresh_interval is set.
+    """
+    
+    def __init__(self, name="spotify", miss_ttl=1.0, refresh_interval=None):
+        """
+        Initialize process cache
+        
+        Args:
+            name: Case-insensitive substring of the process name
+            miss_ttl: Seconds to trust a negative scan result
+            refresh_interval: Seconds between background rescans (None = off)
+        """
+        self.name = name.lower()
+        self.miss_ttl = miss_ttl
+        self.refresh_interval = refresh_interval
+        
+        self.process = None
+        self.last_scan_time = 0.0
+        self.scan_count = 0
+        
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread = None
+        
+        if refresh_interval:
+            self.start_background_refresh()
+    
+    def _scan(self):
+        """Walk the process table and cache the first match"""
+        found = None
+        for proc in psutil.process_iter(['name']):
+            name = proc.info['name']
+            if name and self.name in name.lower():
+                found = proc
+                break
+        
+        with self._lock:
+            self.process = found
+            self.last_scan_time = time.monotonic()
+            self.scan_count += 1
+        return found
+    
+    def _is_valid(self, process):
+        """
+        Cheap check that the cached process is still the same live process
+        
+        is_running() compares against a fresh Process(pid), so a reused
+        PID is detected (process.create_time() is cached on the object and
+        would always match). Works when create_time was access-denied too.
+        """
+        try:
+            return process.is_running()
+        except psutil.Error:
+            return False
+    
+    def get_process(self):
+        """
+        Get the cached process, rescanning only when needed
+        
+        Returns:
+            psutil.Process or None
+        """
+        with self._lock:
+            process = self.process
+            last_scan_time = self.last_scan_time
+        
+        if process is not None:
+            if self._is_valid(process):
+                return process
+            return self._scan()
+        
+        if self.scan_count and time.monotonic() - last_scan_time < self.miss_ttl:
+            return None
+        return self._scan()
+    
+    def invalidate(self):
+        """Force a rescan on the next lookup"""
+        with self._lock:
+            self.process = None
+            self.last_scan_time = 0.0
+            self.scan_count = 0
+    
+    def start_background_refresh(self, interval=None):
+        """
+        Rescan periodically on a daemon thread
+        
+        Args:
+            interval: Seconds between rescans (defaults to refresh_interval)
+        """
+        if interval:
+            self.refresh_interval = interval
+        if self._thread is not None or not self.refresh_interval:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._refresh_loop, daemon=True)
+        self._thread.start()
+    
+    def _refresh_loop(self):
+        while not self._stop_event.wait(self.refresh_interval):
+            try:
+                self._scan()
+            except Exception as e:
+                print(f"Error refreshing process cache: {e}")
+    
+    def stop(self):
+        """Stop the background refresh thread"""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
 class SpotifyController:
     """
     Control Spotify app using hand gestures
     Detects if Spotify is running and focuses the window
     """
     
-    def __init__(self):
-        """Initialize Spotify controller"""
+    def __init__(self, process_refresh_interval=None):
+        """
+        Initialize Spotify controller
+        
+        Args:
+            process_refresh_interval: Seconds between background process
+                                      rescans (None = rescan only on a miss)
+        """
         self.spotify_process = None
         self.last_action_time = 0
         self.action_cooldown = 0.5  # Cooldown between actions
         self.is_spotify_open = False
+        self.process_cache = ProcessPresenceCache("spotify", refresh_interval=process_refresh_interval)
         
         print("🎵 Spotify Controller initialized")
     
@@ -31,13 +158,9 @@ class SpotifyController:
             True if Spotify is running, False otherwise
         """
         try:
-            for proc in psutil.process_iter(['pid', 'name']):
-                if 'spotify' in proc.info['name'].lower():
-                    self.spotify_process = proc
-                    self.is_spotify_open = True
-                    return True
-            self.is_spotify_open = False
-            return False
+            self.spotify_process = self.process_cache.get_process()
+            self.is_spotify_open = self.spotify_process is not None
+            return self.is_spotify_open
         except Exception as e:
             print(f"Error checking Spotify: {e}")
             return False
@@ -58,6 +181,7 @@ class SpotifyController:
             try:
                 subprocess.Popen(spotify_path)
                 time.sleep(3)  # Wait for Spotify to launch
+                self.process_cache.invalidate()
                 print("✓ Spotify launched successfully")
                 return True
             except FileNotFoundError:
@@ -67,6 +191,7 @@ class SpotifyController:
                 # Alternative: use Windows search
                 os.startfile("spotify.exe")
                 time.sleep(3)
+                self.process_cache.invalidate()
                 print("✓ Spotify launched")
                 return True
                 
@@ -146,12 +271,12 @@ class SpotifyController:
                 print(f"Error: {e}")
                 return False
     
-    def volume_up(self, step=0.05):
+    def volume_up(self, step=0.05, presses=1):
         """Increase Spotify volume"""
         if self._check_cooldown():
             try:
                 # Use Windows volume control via media keys
-                pyautogui.press('volumeup')
+                pyautogui.press('volumeup', presses=presses)
                 self.last_action_time = time.time()
                 print("📈 Volume up triggered")
                 return True
@@ -159,12 +284,12 @@ class SpotifyController:
                 print(f"Error: {e}")
                 return False
     
-    def volume_down(self, step=0.05):
+    def volume_down(self, step=0.05, presses=1):
         """Decrease Spotify volume"""
         if self._check_cooldown():
             try:
                 # Use Windows volume control via media keys
-                pyautogui.press('volumedown')
+                pyautogui.press('volumedown', presses=presses)
                 self.last_action_time = time.time()
                 print("📉 Volume down triggered")
                 return True
@@ -198,12 +323,13 @@ class SpotifyController:
                 print(f"Error: {e}")
                 return False
     
-    def execute_action(self, action):
+    def execute_action(self, action, steps=1):
         """
         Execute Spotify action
         
         Args:
             action: Action string (from ActionMapper)
+            steps: Number of key presses for coalesced volume actions
         """
         if not self.is_spotify_running():
             print("⚠️  Spotify is not running!")
@@ -224,6 +350,8 @@ class SpotifyController:
         }
         
         action_func = actions.get(action)
+        if action in ('volume_up', 'volume_down'):
+            return action_func(presses=steps)
         if action_func:
             return action_func()
         else:
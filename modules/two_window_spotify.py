@@ -11,8 +11,25 @@ import time
 import subprocess
 import psutil
 import os
+import sys
 import threading
 
+try:
+    from modules.hand_detection import HandRoiTracker
+    from modules.frame_scheduler import IdlePowerSaver
+    from modules.frame_timing import FrameTimer
+except ImportError:
+    from hand_detection import HandRoiTracker
+    from frame_scheduler import IdlePowerSaver
+    from frame_timing import FrameTimer
+
+try:
+    from config import HAND_DETECTION_CONFIG, POWER_SAVER_CONFIG
+except ImportError:
+    # Run from inside modules/: config.py lives one level up
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from config import HAND_DETECTION_CONFIG, POWER_SAVER_CONFIG
+
 print("🎵 Starting Two-Window Spotify Gesture Control...")
 
 # ================================
@@ -74,7 +91,7 @@ def is_spotify_running():
 # ================================
 
 class SimpleGestureDetector:
-    def __init__(self):
+    def __init__(self, roi_tracking=False):
         self.mp_hands = mp.solutions.hands
         self.hands = self.mp_hands.Hands(
             static_image_mode=False,
@@ -83,6 +100,7 @@ class SimpleGestureDetector:
             min_tracking_confidence=0.5
         )
         self.mp_draw = mp.solutions.drawing_utils
+        self.roi_tracker = HandRoiTracker(enabled=roi_tracking)
         
     def count_fingers(self, landmarks):
         """Count extended fingers using simple rules"""
@@ -119,10 +137,20 @@ class SimpleGestureDetector:
         else:
             return f"fingers_{finger_count}", f"#{finger_count}"
     
+    def has_hand(self, frame):
+        """
+        Presence check only (no drawing or gesture detection), used in power saving mode
+        
+        The frame is the power saver's downscaled copy, so the ROI crop (in
+        full-size pixels) is dropped and the whole frame is checked.
+        """
+        self.roi_tracker.reset()
+        results = self.hands.process(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+        return bool(results.multi_hand_landmarks)
+    
     def process_frame(self, frame):
         """Process frame and return gesture info"""
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        results = self.hands.process(rgb_frame)
+        results = self.roi_tracker.process(self.hands, frame, cv2.COLOR_BGR2RGB)
         
         gesture = "waiting..."
         emoji = "👋"
@@ -233,9 +261,17 @@ def main():
         print("❌ Cannot open camera!")
         return
     
-    gesture_detector = SimpleGestureDetector()
+    gesture_detector = SimpleGestureDetector(roi_tracking=HAND_DETECTION_CONFIG['roi_tracking'])
     gesture_controller = GestureController()
     
+    # Low-power state when nobody is in front of the camera
+    power_saver = IdlePowerSaver(capture=cap, **POWER_SAVER_CONFIG)
+    
+    # Rolling FPS / frame-time statistics with stall warnings
+    frame_timer = FrameTimer(
+        on_stall=lambda frame_time, frame: print(f"⚠️  Frame {frame} stalled: {frame_time * 1000:.0f} ms")
+    )
+    
     print("📋 Step 3: Starting gesture control...")
     print("\n🎮 GESTURE CONTROLS:")
     print("🖐️  OPEN PALM (5 fingers) → Play/Pause")
@@ -265,8 +301,19 @@ def main():
             # Mirror effect
             frame = cv2.flip(frame, 1)
             
+            if power_saver.skip_frame(frame, gesture_detector.has_hand):
+                cv2.putText(frame, "Power saving - show a hand to wake", (10, 30),
+                           cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 165, 255), 2)
+                cv2.imshow('🎵 Gesture Control - Show Your Hand!', frame)
+                if cv2.waitKey(1) & 0xFF == ord('q'):
+                    break
+                continue
+            
             # Detect gestures
             processed_frame, gesture, emoji, hand_detected = gesture_detector.process_frame(frame)
+            if power_saver.update(hand_detected):
+                print("💤 No hand detected, entering power saving mode")
+                frame_timer.reset()
             
             # Execute gesture action
             if hand_detected:
@@ -283,6 +330,10 @@ def main():
             cv2.putText(processed_frame, "Press 'Q' to quit", (10, 90), 
                        cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
             
+            frame_timer.tick()
+            cv2.putText(processed_frame, f"FPS: {frame_timer.fps_ema:.1f} (jitter {frame_timer.jitter_ms:.1f} ms)",
+                       (10, 120), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 0), 1)
+            
             # Show camera window
             cv2.imshow('🎵 Gesture Control - Show Your Hand!', processed_frame)
             
@@ -296,6 +347,9 @@ def main():
     finally:
         cap.release()
         cv2.destroyAllWindows()
+        timing = frame_timer.get_stats()
+        print(f"📊 {timing['fps_window']:.1f} FPS, frame time p95 {timing['frame_time_p95_ms']:.1f} ms, "
+              f"{timing['stalls']} stalls, {timing['dropped']} dropped")
         print("🎵 Gesture control stopped")
         print("✅ Spotify remains open - you can continue listening!")
 
@@ -0,0 +1,230 @@
+"""
+MODULE 17: Continuous Volume Control
+Volume knob: while a designated pose is held, moving the hand (or the
+thumb-index distance) changes the volume relative to where it was when
+the pose was made, smoothed by a One-Euro filter and written only when
+it moves past a dead-band
+"""
+
+import math
+import time
+from modules.feature_extraction import FeatureExtractor
+
+
+class OneEuroFilter:
+    """
+    One-Euro low-pass filter (Casiez et al., CHI 2012)
+
+    The cutoff frequency rises with the signal's speed:
+        cutoff = min_cutoff + beta * |derivative|
+    so a held value is smoothed heavily (no jitter) while a fast change
+    is followed with little lag.
+    """
+
+    def __init__(self, min_cutoff=1.0, beta=1.0, d_cutoff=1.0):
+        """
+        Initialize filter
+
+        Args:
+            min_cutoff: Cutoff frequency (Hz) for a still signal; lower = smoother
+            beta: Cutoff increase per unit/second of speed; higher = less lag
+            d_cutoff: Cutoff frequency (Hz) used to smooth the derivative
+        """
+        self.min_cutoff = min_cutoff
+        self.beta = beta
+        self.d_cutoff = d_cutoff
+        self.reset()
+
+    @staticmethod
+    def _alpha(cutoff, dt):
+        """Smoothing factor of a first-order low-pass at `cutoff` Hz"""
+        tau = 1.0 / (2 * math.pi * cutoff)
+        return 1.0 / (1.0 + tau / dt)
+
+    def reset(self):
+        """Forget the previous value"""
+        self.value = None
+        self._derivative = 0.0
+        self._last_time = None
+
+    def __call__(self, x, timestamp):
+        """
+        Filter one sample
+
+        Args:
+            x: New value
+            timestamp: Sample time in seconds
+
+        Returns:
+            Filtered value
+        """
+        if self.value is None:
+            self.value = x
+            self._last_time = timestamp
+            return x
+
+        dt = timestamp - self._last_time
+        if dt <= 0:
+            return self.value
+        self._last_time = timestamp
+
+        derivative = (x - self.value) / dt
+        self._derivative += self._alpha(self.d_cutoff, dt) * (derivative - self._derivative)
+
+        cutoff = self.min_cutoff + self.beta * abs(self._derivative)
+        self.value += self._alpha(cutoff, dt) * (x - self.value)
+        return self.value
+
+
+class VolumeKnob:
+    """
+    Turn a held pose into a relative volume control
+
+    The knob engages when the (smoothed) gesture equals `gesture` and
+    stays engaged until `release_frames` consecutive frames show another
+    gesture or no hand. On engagement it remembers the current volume
+    and, after `warmup_frames` filtered samples, the control position;
+    from then on the volume moves with the control relative to that
+    anchor, so engaging never jumps the volume.
+
+    Controls:
+        'wrist' - vertical wrist position; up is louder, `travel` of the
+                  frame height spans the full range. The pose is held
+                  still, so the default PINCH stays PINCH while turning.
+        'pinch' - FeatureExtractor.pinch_ratio; opening is louder,
+                  `ratio_span` spans the full range. Use with a pose whose
+                  thumb and index start apart (a pinch is already at
+                  the bottom of the ratio range, so it could only go up).
+
+    The control value is smoothed by a One-Euro filter, and a level is
+    reported only when it differs from the last written level by more
+    than `dead_band`, so a steady hand costs no backend calls.
+    """
+
+    CONTROLS = ('wrist', 'pinch')
+
+    def __init__(self, enabled=True, gesture=2, control='wrist', travel=0.4, ratio_span=0.8, min_cutoff=1.0,
+                 beta=1.0, d_cutoff=1.0, dead_band=0.02, warmup_frames=3, release_frames=15):
+        """
+        Initialize volume knob
+
+        Args:
+            enabled: False makes update() a no-op returning None
+            gesture: Gesture class that engages the knob (default PINCH)
+            control: 'wrist' (vertical hand position) or 'pinch' (thumb-index distance)
+            travel: Wrist movement (fraction of the frame height) for the full volume range
+            ratio_span: Pinch ratio change for the full volume range
+            min_cutoff: One-Euro cutoff (Hz) for a still hand
+            beta: One-Euro speed coefficient (per unit/second of the control)
+            d_cutoff: One-Euro derivative cutoff (Hz)
+            dead_band: Minimum level change (0.0 - 1.0) that is written
+            warmup_frames: Filtered frames after engagement before the anchor is set
+            release_frames: Frames of another gesture (or no hand) that disengage the knob
+        """
+        if control not in self.CONTROLS:
+            raise ValueError(f"control must be one of {self.CONTROLS}, got {control!r}")
+        self.enabled = enabled
+        self.gesture = gesture
+        self.control = control
+        self.span = travel if control == 'wrist' else ratio_span
+        self.dead_band = dead_band
+        self.warmup_frames = warmup_frames
+        self.release_frames = release_frames
+        self.filter = OneEuroFilter(min_cutoff, beta, d_cutoff)
+
+        self.active = False
+        self.level = None           # Current level while engaged
+        self.written_level = None   # Last level written (the engagement volume at first)
+        self._anchor = None         # Filtered control value the engagement volume corresponds to
+        self._warmup = 0
+        self._released_for = 0
+
+        # Statistics
+        self.updates = 0
+        self.writes = 0
+
+    def reset(self):
+        """Disengage and forget the filter state"""
+        self.active = False
+        self.level = None
+        self.written_level = None
+        self._anchor = None
+        self._warmup = 0
+        self._released_for = 0
+        self.filter.reset()
+
+    def _control_value(self, landmarks):
+        """Control position, oriented so that larger means louder"""
+        if self.control == 'wrist':
+            return -float(landmarks[FeatureExtractor.WRIST][1])  # Image y points down
+        return FeatureExtractor.pinch_ratio(landmarks)
+
+    def update(self, landmarks, gesture, timestamp=None, volume=None):
+        """
+        Feed one frame
+
+        Args:
+            landmarks: (21, 3) landmarks of the controlling hand, or None
+            gesture: Its smoothed gesture class (None if not confident)
+            timestamp: Frame time in seconds (default: time.perf_counter())
+            volume: Current volume (0.0 - 1.0), used as the starting level on engagement
+
+        Returns:
+            New volume level (0.0 - 1.0) to write, or None
+        """
+        if not self.enabled:
+            return None
+
+        if gesture is not None and gesture == self.gesture and landmarks is not None:
+            if not self.active:
+                self.active = True
+                self.level = self.written_level = 0.5 if volume is None else float(volume)
+            self._released_for = 0
+        elif self.active:
+            self._released_for += 1
+            if self._released_for >= self.release_frames:
+                self.reset()
+                return None
+
+        if not self.active or landmarks is None:
+            return None
+        if timestamp is None:
+            timestamp = time.perf_counter()
+
+        value = self.filter(self._control_value(landmarks), timestamp)
+        self.updates += 1
+
+        # Let the filter settle before fixing the anchor; nothing is written meanwhile
+        if self._anchor is None:
+            self._warmup += 1
+            if self._warmup >= self.warmup_frames:
+                self._anchor = value
+            return None
+
+        level = self.written_level + (value - self._anchor) / self.span
+        if level < 0.0 or level > 1.0:
+            # Drag the anchor along past the ends, so reversing responds at once
+            level = max(0.0, min(1.0, level))
+            self._anchor = value - (level - self.written_level) * self.span
+        self.level = level
+
+        # The ends are always written so 0% and 100% are reachable through the dead-band
+        if level == self.written_level:
+            return None
+        if abs(level - self.written_level) <= self.dead_band and level not in (0.0, 1.0):
+            return None
+
+        # Later changes are measured from the written level
+        self._anchor += (level - self.written_level) * self.span
+        self.written_level = level
+        self.writes += 1
+        return level
+
+    def get_stats(self):
+        """Get knob statistics"""
+        return {
+            'active': self.active,
+            'level': self.level,
+            'updates': self.updates,
+            'writes': self.writes,
+        }
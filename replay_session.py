@@ -0,0 +1,92 @@
+"""
+SESSION REPLAY
+Run a recorded video or landmark session through the gesture pipeline
+with no camera, no window and a recording fake media controller
+"""
+
+import json
+import argparse
+from main_pipeline import GestureControlPipeline
+from config import HAND_DETECTION_CONFIG
+from modules.replay import RecordingController, LandmarkStreamDetector, replay_video, replay_landmarks
+
+
+def build_replay_pipeline(model_path, confidence_threshold=0.6, landmarks=False):
+    """
+    Build a headless pipeline that records actions instead of executing them
+
+    Args:
+        model_path: Path to trained gesture model (without extension)
+        confidence_threshold: Minimum confidence for gesture detection
+        landmarks: Use recorded landmarks instead of MediaPipe
+
+    Returns:
+        GestureControlPipeline
+    """
+    return GestureControlPipeline(
+        model_path=model_path,
+        confidence_threshold=confidence_threshold,
+        headless=True,
+        media_controller=RecordingController(),
+        hand_detector=LandmarkStreamDetector(max_hands=HAND_DETECTION_CONFIG['max_hands']) if landmarks else None,
+    )
+
+
+def replay_session(source, model_path="data/gesture_model_random_forest", realtime=False,
+                   confidence_threshold=0.6):
+    """
+    Replay a session file
+
+    Args:
+        source: Landmark session (.npz), video file or image directory
+        model_path: Path to trained gesture model
+        realtime: Pace frames at their timestamps instead of as fast as possible
+        confidence_threshold: Minimum confidence for gesture detection
+
+    Returns:
+        Replay result dict (see modules.replay)
+    """
+    landmarks = str(source).endswith('.npz')
+    pipeline = build_replay_pipeline(model_path, confidence_threshold, landmarks=landmarks)
+    try:
+        if landmarks:
+            return replay_landmarks(pipeline, source, realtime=realtime)
+        return replay_video(pipeline, source, realtime=realtime)
+    finally:
+        pipeline.action_dispatcher.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Replay a recorded session without a camera')
+    parser.add_argument('source', help='Landmark session (.npz from main_pipeline.py --record), video file or image directory')
+    parser.add_argument('--model', default='data/gesture_model_random_forest', help='Model path (without extension)')
+    parser.add_argument('--realtime', action='store_true', help='Replay at recorded speed instead of as fast as possible')
+    parser.add_argument('--output', default=None, help='Write gestures and actions to this JSON file')
+    args = parser.parse_args()
+
+    result = replay_session(args.source, model_path=args.model, realtime=args.realtime)
+
+    print(f"\n{'='*60}")
+    print("🔁 REPLAY RESULTS")
+    print(f"{'='*60}")
+    print(f"Frames:  {result['frames']} in {result['elapsed']:.2f}s ({result['fps']:.1f} FPS)")
+    print(f"Inference frames: {result['scheduler']['frames_processed']}")
+    print(f"Actions: {len(result['actions'])}")
+    for action in result['actions']:
+        if 'level' in action:
+            print(f"  frame {action['frame']:>5}  {action['action']} {action['level']:.0%}")
+        else:
+            print(f"  frame {action['frame']:>5}  {action['action']} x{action['steps']}")
+    print(f"{'='*60}\n")
+
+    if args.output:
+        output = {
+            'frames': result['frames'],
+            'elapsed': result['elapsed'],
+            'fps': result['fps'],
+            'gestures': [None if g is None else int(g) for g in result['gestures']],
+            'actions': result['actions'],
+        }
+        with open(args.output, 'w') as f:
+            json.dump(output, f, indent=2)
+        print(f"✓ Results saved to {args.output}")
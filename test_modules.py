@@ -130,6 +130,138 @@ def test_hand_detection():
         print(f"✗ Error during hand detection test: {e}")
         return False
 
+def test_landmark_buffer_aliasing():
+    """Check that detect_hands returns views that the next call overwrites"""
+    from types import SimpleNamespace
+    from modules.hand_detection import HandDetector
+    
+    print("\n" + "="*60)
+    print("🔁 Testing Landmark Buffer Reuse...")
+    print("="*60 + "\n")
+    
+    class FakeHands:
+        """MediaPipe Hands stand-in returning the queued hands in order"""
+        def __init__(self, frames):
+            self.frames = list(frames)
+        def process(self, image):
+            hands = self.frames.pop(0)
+            return SimpleNamespace(
+                multi_hand_landmarks=[
+                    SimpleNamespace(landmark=[SimpleNamespace(x=x, y=y, z=z) for x, y, z in hand])
+                    for hand in hands
+                ],
+                multi_handedness=[
+                    SimpleNamespace(classification=[SimpleNamespace(label="Right", score=0.9)])
+                    for _ in hands
+                ],
+            )
+    
+    rng = np.random.default_rng(0)
+    first_hands = rng.uniform(0, 1, (2, 21, 3)).astype(np.float32)
+    second_hands = rng.uniform(0, 1, (1, 21, 3)).astype(np.float32)
+    
+    detector = HandDetector(max_hands=2, draw=False)
+    detector.hands = FakeHands([first_hands, second_hands, second_hands, first_hands[:1]])
+    frame = np.zeros((48, 64, 3), dtype=np.uint8)
+    
+    _, first = detector.detect_hands(frame)
+    kept = [landmarks.copy() for landmarks in first]
+    _, second = detector.detect_hands(frame)
+    
+    # The power-saving presence check leaves the buffer alone and drops the crop
+    detector.roi_tracker.enabled = True
+    detector.detect_hands(frame)
+    roi_before = detector.roi_tracker.roi
+    present = detector.has_hand(np.zeros((12, 16, 3), dtype=np.uint8))
+    
+    print(f"First call: {len(first)} hands, second call: {len(second)} hand")
+    print(f"First result overwritten: {np.array_equal(first[0], second_hands[0])}, copy kept: "
+          f"{np.array_equal(kept[0], first_hands[0])}")
+    print(f"Presence check: {present}, crop {roi_before} -> {detector.roi_tracker.roi}")
+    
+    passed = (
+        all(np.shares_memory(landmarks, detector.landmarks_buffer) for landmarks in first + second)
+        and np.array_equal(first[0], second_hands[0])
+        and np.array_equal(second[0], second_hands[0])
+        and np.array_equal(kept[0], first_hands[0])
+        and np.array_equal(kept[1], first_hands[1])
+        and detector.get_landmarks().shape == (1, 21, 3)
+        and np.shares_memory(detector.get_landmarks(), detector.landmarks_buffer)
+        and present
+        and roi_before is not None
+        and detector.roi_tracker.roi is None
+        and np.array_equal(second[0], second_hands[0])
+        and detector.num_hands == 1
+    )
+    
+    if passed:
+        print("✓ Landmarks are views into the reused buffer; copies survive the next frame")
+    else:
+        print("✗ Unexpected landmark buffer behavior")
+    
+    assert passed
+    return passed
+
+def test_roi_tracker():
+    """Check crop-to-frame landmark remapping and periodic full-frame runs for extra hands"""
+    from types import SimpleNamespace
+    from modules.hand_detection import HandRoiTracker
+    
+    print("\n" + "="*60)
+    print("🔲 Testing Hand ROI Tracker...")
+    print("="*60 + "\n")
+    
+    def results_for(points):
+        """MediaPipe-style results with one hand per (21, 3) array"""
+        return SimpleNamespace(
+            multi_hand_landmarks=[
+                SimpleNamespace(landmark=[SimpleNamespace(x=float(x), y=float(y), z=float(z)) for x, y, z in hand])
+                for hand in points
+            ]
+        )
+    
+    # A crop at (160, 120) of size 320x240 in a 640x480 frame maps its corners to the frame's
+    points = np.array([[[0.0, 0.0, 0.1], [1.0, 1.0, 0.2], [0.5, 0.25, 0.0]] * 7])
+    results = results_for(points)
+    HandRoiTracker._remap(results, 160, 120, 320, 240, 640, 480)
+    remapped = np.array([[(l.x, l.y, l.z) for l in hand.landmark] for hand in results.multi_hand_landmarks])
+    expected = [[0.25, 0.25, 0.05], [0.75, 0.75, 0.1], [0.5, 0.375, 0.0]]
+    
+    class OneHand:
+        """Hands stand-in that always finds one hand in the middle of its input"""
+        def __init__(self):
+            self.shapes = []
+        def process(self, image):
+            self.shapes.append(image.shape[:2])
+            rng = np.random.default_rng(len(self.shapes))
+            return results_for(rng.uniform(0.45, 0.55, (1, 21, 3)))
+    
+    frame = np.zeros((480, 640, 3), dtype=np.uint8)
+    runs = {}
+    for max_hands in (1, 2):
+        hands = OneHand()
+        tracker = HandRoiTracker(max_hands=max_hands, full_frame_interval=4)
+        for _ in range(15):
+            tracker.process(hands, frame)
+        runs[max_hands] = [shape == (480, 640) for shape in hands.shapes]
+        print(f"max_hands={max_hands}: full-frame runs at {[i for i, full in enumerate(runs[max_hands]) if full]}, "
+              f"{tracker.get_stats()}")
+    print(f"Remapped corners: {remapped[0, :3].round(3).tolist()}")
+    
+    passed = (
+        np.allclose(remapped[0, :3], expected)
+        and runs[1] == [True] + [False] * 14
+        and runs[2] == [True, False, False, False, False] * 3
+    )
+    
+    if passed:
+        print("✓ Crop landmarks map to frame coordinates; extra hands are searched for at full size")
+    else:
+        print("✗ Unexpected ROI tracking")
+    
+    assert passed
+    return passed
+
 def test_feature_extraction():
     """Test feature extraction"""
     print("\n" + "="*60)
@@ -195,6 +327,1685 @@ def test_feature_extraction():
         print(f"✗ Error during feature extraction test: {e}")
         return False
 
+def test_feature_batch_parity():
+    """Check that batch feature extraction matches the per-hand path"""
+    print("\n" + "="*60)
+    print("🧮 Testing Batch Feature Extraction...")
+    print("="*60 + "\n")
+    
+    extractor = FeatureExtractor()
+    rng = np.random.default_rng(0)
+    landmarks = rng.random((500, 21, 3))
+    
+    # Degenerate hands (coincident points) exercise the zero-angle branch
+    landmarks[0, FeatureExtractor.THUMB_TIP] = landmarks[0, FeatureExtractor.THUMB_IP]
+    landmarks[1, FeatureExtractor.MIDDLE_TIP] = landmarks[1, FeatureExtractor.INDEX_TIP]
+    
+    # MediaPipe landmarks arrive as float32; both paths must agree for either dtype
+    passed = True
+    for dtype in (np.float64, np.float32):
+        hands = landmarks.astype(dtype)
+        scalar = np.array([extractor.extract_features(lm) for lm in hands])
+        batch = extractor.extract_features_batch(hands)
+        scalar_dist = np.array([extractor.extract_all_distances(lm) for lm in hands])
+        batch_dist = extractor.extract_all_distances_batch(hands)
+        passed = passed and np.array_equal(scalar, batch) and np.array_equal(scalar_dist, batch_dist)
+    
+    if passed:
+        print(f"✓ Batch features match per-hand features ({batch.shape}, {batch_dist.shape})")
+    else:
+        print("✗ Batch features differ from per-hand features")
+    
+    assert passed
+    return passed
+
+def test_compact_model_parity():
+    """Check the NumPy-only model matches scikit-learn for the random forest and the MLP"""
+    import os
+    import tempfile
+    from modules.gesture_classifier import GestureClassifier
+    from modules.compact_model import CompactGestureModel, compact_model_path
+    
+    print("\n" + "="*60)
+    print("📦 Testing Compact Model Parity...")
+    print("="*60 + "\n")
+    
+    # One cluster per gesture, plus off-cluster samples near the decision boundaries
+    rng = np.random.default_rng(0)
+    centers = rng.normal(0, 3, (5, 9))
+    X = (centers[:, None] + rng.normal(0, 1, (5, 60, 9))).reshape(-1, 9).astype(np.float32)
+    y = np.repeat(np.arange(5), 60)
+    X_test = rng.normal(0, 4, (500, 9)).astype(np.float32)
+    model_dir = tempfile.mkdtemp()
+    
+    passed = CompactGestureModel.GESTURES == GestureClassifier.GESTURES
+    for model_type in ('random_forest', 'neural_network'):
+        classifier = GestureClassifier(model_type=model_type)
+        classifier.train(X, y)
+        path = os.path.join(model_dir, model_type)
+        classifier.save_model(path, export_compact=True)
+        compact = CompactGestureModel(f"{path}_compact.npz")
+        
+        labels, confidences = classifier.predict_batch(X_test)
+        compact_labels, compact_confidences = compact.predict_batch(X_test)
+        single = [classifier.predict(x) for x in X_test[:50]]
+        compact_single = [compact.predict(x) for x in X_test[:50]]
+        
+        batch_error = np.abs(confidences - compact_confidences).max()
+        single_error = max(abs(a[1] - b[1]) for a, b in zip(single, compact_single))
+        print(f"{model_type}: batch label mismatches {int((labels != compact_labels).sum())}, "
+              f"max confidence error {max(batch_error, single_error):.1e}")
+        
+        passed = (
+            passed
+            and np.array_equal(labels, compact_labels)
+            and batch_error < 1e-6
+            and [int(a[0]) for a in single] == [int(b[0]) for b in compact_single]
+            and single_error < 1e-6
+        )
+    
+    # Retraining without an export leaves the old .npz behind; it must not be loaded
+    path = os.path.join(model_dir, 'random_forest')
+    current = compact_model_path(path)
+    os.utime(f"{path}_compact.npz", (0, 0))
+    stale = compact_model_path(path)
+    print(f"Current export: {current is not None}, stale export used: {stale is not None}")
+    passed = passed and current == f"{path}_compact.npz" and stale is None
+    
+    if passed:
+        print("✓ Compact model predictions match scikit-learn")
+    else:
+        print("✗ Compact model predictions differ from scikit-learn")
+    
+    assert passed
+    return passed
+
+def test_dataset_store():
+    """Check append, reopen, legacy conversion and recovery from an interrupted append"""
+    import os
+    import tempfile
+    from modules.dataset_store import GestureDatasetStore
+    
+    print("\n" + "="*60)
+    print("🗄️ Testing Dataset Store...")
+    print("="*60 + "\n")
+    
+    rng = np.random.default_rng(0)
+    data_dir = tempfile.mkdtemp()
+    gestures = {0: "PALM", 1: "FIST"}
+    
+    def sample(value):
+        return np.full(9, value, dtype=np.float32), np.full((21, 3), value, dtype=np.float32)
+    
+    # Append one by one and in a batch, then reopen from disk
+    store = GestureDatasetStore(data_dir, gestures)
+    for value in (1.0, 2.0):
+        store.append(0, *sample(value), session_id=0)
+    batch = rng.normal(size=(3, 21, 3)).astype(np.float32)
+    store.append_batch(1, np.arange(27, dtype=np.float32).reshape(3, 9), batch, session_id=1)
+    
+    reopened = GestureDatasetStore(data_dir, gestures)
+    features, landmarks, index = reopened.load_gesture(1)
+    X, y = reopened.load_dataset()
+    appended = (
+        reopened.count(0) == 2 and reopened.count(1) == 3
+        and np.array_equal(features[2], np.arange(18, 27))
+        and np.array_equal(landmarks, batch)
+        and list(y) == [0, 0, 1, 1, 1]
+        and reopened.new_session() == 2
+    )
+    
+    # Interrupted append: feature and landmark rows written, index not
+    features_path = os.path.join(data_dir, "0_PALM", GestureDatasetStore.FEATURES_FILE)
+    landmarks_path = os.path.join(data_dir, "0_PALM", GestureDatasetStore.LANDMARKS_FILE)
+    orphan_features, orphan_landmarks = sample(99.0)
+    with open(features_path, "ab") as f:
+        f.write(orphan_features.tobytes())
+    with open(landmarks_path, "ab") as f:
+        f.write(orphan_landmarks.tobytes()[:100])  # Partial row too
+    
+    reopened.append(0, *sample(3.0))
+    features, landmarks, index = reopened.load_gesture(0)
+    recovered = (
+        reopened.count(0) == 3
+        and list(features[:, 0]) == [1.0, 2.0, 3.0]
+        and list(landmarks[:, 0, 0]) == [1.0, 2.0, 3.0]
+        and os.path.getsize(features_path) == 3 * 9 * 4
+        and os.path.getsize(landmarks_path) == 3 * 63 * 4
+    )
+    
+    # Legacy per-sample files are detected and converted
+    legacy_features, legacy_landmarks = sample(7.0)
+    np.save(os.path.join(data_dir, "1_FIST", "features_0.npy"), legacy_features)
+    np.save(os.path.join(data_dir, "1_FIST", "landmarks_0.npy"), legacy_landmarks)
+    had_legacy = reopened.has_legacy_files()
+    converted = reopened.convert_legacy(remove=True)
+    legacy = (
+        had_legacy and converted == 1 and not reopened.has_legacy_files()
+        and reopened.count(1) == 4 and reopened.load_gesture(1)[0][3, 0] == 7.0
+    )
+    
+    # Files kept after a conversion are not counted twice in the training set
+    from collect_data import DataCollector
+    collector = DataCollector(tempfile.mkdtemp())
+    gesture_id = min(collector.GESTURES)
+    gesture_dir = os.path.join(collector.data_dir, f"{gesture_id}_{collector.GESTURES[gesture_id]}")
+    for sample_id in range(2):
+        legacy_features, legacy_landmarks = sample(float(sample_id))
+        np.save(os.path.join(gesture_dir, f"features_{sample_id}.npy"), legacy_features)
+        np.save(os.path.join(gesture_dir, f"landmarks_{sample_id}.npy"), legacy_landmarks)
+    X_before, _ = collector.create_training_dataset()
+    converted = collector.store.convert_legacy()
+    X_after, _ = collector.create_training_dataset()
+    kept = (
+        len(X_before) == 2 and converted == 2 and len(X_after) == 2
+        and os.path.exists(os.path.join(gesture_dir, "features_0.npy"))
+        and not collector.store.has_legacy_files()
+        and collector.store.convert_legacy() == 0
+    )
+    
+    print(f"  Counts: {reopened.count(0)}, {reopened.count(1)}")
+    passed = appended and recovered and legacy and kept
+    if passed:
+        print("✓ Samples survive reopen, interrupted appends stay aligned, legacy files convert once")
+    else:
+        print(f"✗ Dataset store: appended={appended}, recovered={recovered}, legacy={legacy}, kept={kept}")
+    
+    assert passed
+    return passed
+
+def test_gesture_smoother():
+    """Check majority, weighted and decay voting and the hysteresis thresholds"""
+    from modules.gesture_smoother import GestureSmoother
+    
+    print("\n" + "="*60)
+    print("🗳️  Testing Gesture Smoother...")
+    print("="*60 + "\n")
+    
+    def run(smoother, frames):
+        return [smoother.update(gesture, confidence) for gesture, confidence in frames]
+    
+    # Majority: a 5-frame window, old votes drop out, ties keep the current gesture
+    majority = GestureSmoother(history_size=5)
+    majority_out = run(majority, [(0, 1.0)] * 5 + [(1, 1.0)] * 3)
+    
+    # Weighted: one confident frame outvotes two unsure ones; majority would not
+    frames = [(0, 0.95), (1, 0.3), (1, 0.3)]
+    weighted_out = run(GestureSmoother(history_size=3, mode='weighted'), frames)
+    unweighted_out = run(GestureSmoother(history_size=3), frames)
+    
+    # Decay: older frames fade, so a new gesture takes over sooner than in a window
+    frames = [(0, 1.0)] * 4 + [(1, 1.0)]
+    decay = GestureSmoother(history_size=5, mode='decay', decay=0.5)
+    decay_out = run(decay, frames)
+    window_out = run(GestureSmoother(history_size=5), frames)
+    run(decay, [(2, 1.0)] * 20)  # Longer than history_size: there is no window to overrun
+    
+    # Hysteresis: 0 stays while its share >= exit_threshold and 1 is below enter_threshold
+    sticky = GestureSmoother(history_size=5, enter_threshold=0.8, exit_threshold=0.4)
+    sticky_out = run(sticky, [(0, 1.0)] * 5 + [(1, 1.0)] * 4)
+    undecided = GestureSmoother(history_size=5, enter_threshold=0.8, exit_threshold=0.4)
+    undecided_out = run(undecided, [(g, 1.0) for g in range(5)])
+    
+    print(f"Majority: {majority_out}")
+    print(f"Weighted: {weighted_out} (majority: {unweighted_out})")
+    print(f"Decay: {decay_out} (window: {window_out}), {len(decay)} frames, ring size {len(decay._ring_slots)}")
+    print(f"Hysteresis: {sticky_out}, no clear gesture: {undecided_out}")
+    
+    majority.reset()
+    passed = (
+        majority_out == [0, 0, 0, 0, 0, 0, 0, 1]
+        and weighted_out[-1] == 0
+        and unweighted_out[-1] == 1
+        and decay_out[-1] == 1
+        and window_out[-1] == 0
+        and decay.current == 2
+        and len(decay) == 25
+        and len(decay._ring_slots) == 0
+        and sticky_out == [0, 0, 0, 0, 0, 0, 0, 0, 1]
+        and undecided_out[-1] is None
+        and len(majority) == 0
+        and majority.current is None
+    )
+    
+    if passed:
+        print("✓ All voting modes and hysteresis behave as documented")
+    else:
+        print("✗ Unexpected smoothing results")
+    
+    assert passed
+    return passed
+
+def test_action_dispatcher():
+    """Check queued dispatch, volume coalescing and overflow with a fake backend"""
+    import time
+    from modules.action_dispatcher import ActionDispatcher
+    
+    print("\n" + "="*60)
+    print("📬 Testing Action Dispatcher...")
+    print("="*60 + "\n")
+    
+    class FakeBackend:
+        def __init__(self):
+            self.calls = []
+            self.release = False
+        
+        def execute_action(self, action, steps=1):
+            while not self.release:
+                time.sleep(0.001)
+            self.calls.append((action, steps))
+    
+    backend = FakeBackend()
+    dispatcher = ActionDispatcher(backend, max_queue=3).start()
+    
+    # First action blocks the worker; the rest queue up behind it
+    dispatcher.dispatch("play_pause")
+    time.sleep(0.05)
+    for _ in range(4):
+        dispatcher.dispatch("volume_up")
+    dispatcher.dispatch("next_track")
+    dispatcher.dispatch("previous_track")
+    dispatcher.dispatch("volume_down")
+    depth = dispatcher.queue_depth()
+    
+    backend.release = True
+    dispatcher.wait_idle()
+    dispatcher.stop()
+    stats = dispatcher.get_stats()
+    
+    # Dispatches after stop() are rejected and do not restart the worker
+    after_stop = (dispatcher.dispatch("play_pause"), dispatcher.set_volume(0.5))
+    restarted = dispatcher._running
+    
+    # Concurrent first dispatches start a single worker
+    import threading
+    
+    class CountingBackend:
+        def __init__(self):
+            self.workers = 0
+        
+        def init_worker_thread(self):
+            self.workers += 1
+        
+        def execute_action(self, action, steps=1):
+            pass
+    
+    counting = CountingBackend()
+    lazy = ActionDispatcher(counting)
+    barrier = threading.Barrier(8)
+    
+    def first_dispatch():
+        barrier.wait()
+        lazy.dispatch("play_pause")
+    
+    threads = [threading.Thread(target=first_dispatch) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    lazy.wait_idle()
+    lazy.stop()
+    
+    print(f"  Calls: {backend.calls}")
+    print(f"  Stats: {stats}")
+    print(f"  After stop: {after_stop}, workers from concurrent first dispatches: {counting.workers}")
+    
+    passed = (
+        depth == 3
+        and backend.calls == [("play_pause", 1), ("next_track", 1), ("previous_track", 1), ("volume_down", 1)]
+        and stats['coalesced'] == 3
+        and stats['dropped'] == 1
+        and stats['executed'] == 4
+        and after_stop == (False, False)
+        and not restarted
+        and counting.workers == 1
+    )
+    
+    if passed:
+        print("✓ Dispatcher queued, coalesced and dropped as expected")
+    else:
+        print("✗ Unexpected dispatcher behaviour")
+    
+    assert passed
+    return passed
+
+def start_spotify_stub_server(volume=50, rate_limit=0):
+    """
+    Start a local HTTP server standing in for the Spotify Web API
+    
+    Args:
+        volume: Initial device volume
+        rate_limit: Number of volume requests answered with 429 (Retry-After: 1)
+    
+    Returns:
+        server: Running server (call shutdown() when done)
+        requests_log: List of (method, path) received
+    """
+    import json
+    import threading
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+    
+    requests_log = []
+    state = {"is_playing": False, "volume": volume, "rate_limit": rate_limit}
+    
+    class Handler(BaseHTTPRequestHandler):
+        def _reply(self, code, body=None):
+            data = json.dumps(body).encode() if body is not None else b""
+            self.send_response(code)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+        
+        def _handle(self):
+            path = self.path.split("?")[0]
+            requests_log.append((self.command, path))
+            length = int(self.headers.get("Content-Length") or 0)
+            if length:
+                self.rfile.read(length)
+            
+            if self.command == "GET" and path == "/v1/me/player":
+                self._reply(200, {
+                    "is_playing": state["is_playing"],
+                    "device": {"id": "stub-device", "volume_percent": state["volume"]},
+                })
+            elif path == "/v1/me/player/play":
+                state["is_playing"] = True
+                self._reply(204)
+            elif path == "/v1/me/player/pause":
+                state["is_playing"] = False
+                self._reply(204)
+            elif path == "/v1/me/player/volume" and state["rate_limit"] > 0:
+                state["rate_limit"] -= 1
+                data = json.dumps({"error": {"status": 429, "message": "API rate limit exceeded"}}).encode()
+                self.send_response(429)
+                self.send_header("Retry-After", "1")
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+            else:
+                self._reply(204)
+        
+        do_GET = do_PUT = do_POST = _handle
+        
+        def log_message(self, *args):
+            pass
+    
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, requests_log
+
+def test_spotify_api_cache():
+    """Check play/pause and volume against a local Spotify API stub"""
+    import time
+    from modules.spotify_api import SpotifyAPI
+    
+    print("\n" + "="*60)
+    print("🎵 Testing Spotify API Client (stub server)...")
+    print("="*60 + "\n")
+    
+    server, requests_log = start_spotify_stub_server()
+    prefix = f"http://127.0.0.1:{server.server_address[1]}/v1/"
+    
+    api = SpotifyAPI(client_id="stub", client_secret="stub", api_prefix=prefix, auto_refresh=False)
+    api.set_token({"access_token": "stub-token", "expires_at": time.time() + 3600})
+    
+    api.play_pause()           # stale cache: GET state + PUT play
+    api.play_pause()           # fresh cache: PUT pause only
+    api.set_volume_percent(70)
+    state = api.get_playback_state()
+    server.shutdown()
+    
+    print(f"  Requests: {requests_log}")
+    print(f"  Cached state: {state}")
+    
+    passed = (
+        requests_log == [
+            ("GET", "/v1/me/player"),
+            ("PUT", "/v1/me/player/play"),
+            ("PUT", "/v1/me/player/pause"),
+            ("PUT", "/v1/me/player/volume"),
+        ]
+        and state == {"is_playing": False, "volume": 70, "device_id": "stub-device"}
+    )
+    
+    if passed:
+        print("✓ Play/pause uses one request once the playback state is cached")
+    else:
+        print("✗ Unexpected requests or cached state")
+    
+    assert passed
+    return passed
+
+def test_spotify_volume_coalescing():
+    """Check that a burst of volume gestures becomes few requests, and 429 is honoured"""
+    import time
+    from spotipy.exceptions import SpotifyException
+    from modules.spotify_api import SpotifyAPI, SpotifyVolumeController
+    
+    print("\n" + "="*60)
+    print("🔊 Testing Spotify Volume Coalescing...")
+    print("="*60 + "\n")
+    
+    server, requests_log = start_spotify_stub_server(volume=50)
+    prefix = f"http://127.0.0.1:{server.server_address[1]}/v1/"
+    
+    api = SpotifyAPI(client_id="stub", client_secret="stub", api_prefix=prefix, auto_refresh=False)
+    api.set_token({"access_token": "stub-token", "expires_at": time.time() + 3600})
+    
+    volume = SpotifyVolumeController(api, min_interval=0.2, step=5)
+    for _ in range(6):
+        volume.nudge(1)
+        time.sleep(0.01)
+    volume.wait_idle()
+    volume.stop()
+    server.shutdown()
+    
+    volume_requests = [r for r in requests_log if r[1] == "/v1/me/player/volume"]
+    print(f"  Requests: {requests_log}")
+    print(f"  Stats: {volume.get_stats()}")
+    coalesced = volume.sent_level == 80 and len(volume_requests) <= 2
+    
+    # Rate limit: first request gets 429 with Retry-After, the retry sends the latest level
+    class RateLimitedAPI:
+        def __init__(self):
+            self.calls = []
+        
+        def get_playback_state(self):
+            return {"volume": 50}
+        
+        def set_volume_percent(self, percent):
+            self.calls.append((time.monotonic(), percent))
+            if len(self.calls) == 1:
+                raise SpotifyException(429, -1, "rate limited", headers={"Retry-After": "0.3"})
+            return True
+    
+    limited_api = RateLimitedAPI()
+    limited = SpotifyVolumeController(limited_api, min_interval=0.05)
+    limited.set_target(30)
+    time.sleep(0.1)
+    limited.set_target(40)
+    limited.wait_idle()
+    limited.stop()
+    
+    calls = limited_api.calls
+    print(f"  Rate-limited calls: {[p for _, p in calls]}")
+    honoured = (
+        [p for _, p in calls] == [30, 40]
+        and calls[1][0] - calls[0][0] >= 0.3
+        and limited.rate_limited == 1
+    )
+    
+    # Real spotipy against a stub answering 429: no internal retries, Retry-After from the header
+    server, requests_log = start_spotify_stub_server(volume=50, rate_limit=2)
+    prefix = f"http://127.0.0.1:{server.server_address[1]}/v1/"
+    api = SpotifyAPI(client_id="stub", client_secret="stub", api_prefix=prefix, auto_refresh=False)
+    api.set_token({"access_token": "stub-token", "expires_at": time.time() + 3600})
+    
+    start = time.monotonic()
+    try:
+        api.set_volume_percent(30)
+        error = None
+    except SpotifyException as e:
+        error = e
+    failed_fast = time.monotonic() - start < 0.5
+    
+    # Second 429 goes to the controller: it waits Retry-After, then sends only the latest level
+    stubbed = SpotifyVolumeController(api, min_interval=0.05)
+    stubbed.sent_level = 50
+    start = time.monotonic()
+    stubbed.set_target(40)
+    time.sleep(0.1)
+    stubbed.set_target(45)
+    stubbed.wait_idle(timeout=3.0)
+    waited = time.monotonic() - start
+    stubbed.stop()
+    server.shutdown()
+    
+    volume_requests = [r for r in requests_log if r[1] == "/v1/me/player/volume"]
+    print(f"  Stub 429: {error and error.http_status}, Retry-After {error.headers.get('Retry-After') if error else None}")
+    print(f"  Stub volume requests: {len(volume_requests)} in {waited:.2f}s, stats: {stubbed.get_stats()}")
+    stub_honoured = (
+        error is not None
+        and error.http_status == 429
+        and error.headers.get("Retry-After") == "1"
+        and failed_fast
+        and len(volume_requests) == 3
+        and 0.9 <= waited < 2.0
+        and stubbed.sent_level == 45
+        and stubbed.rate_limited == 1
+        and stubbed.requests_sent == 1
+    )
+    
+    # No client (set_volume_percent returns False): dropped, not counted as sent
+    class NoClientAPI:
+        def get_playback_state(self):
+            return None
+        
+        def set_volume_percent(self, percent):
+            return False
+    
+    offline = SpotifyVolumeController(NoClientAPI())
+    offline.set_target(60)
+    offline.wait_idle()
+    offline.stop()
+    not_counted = offline.requests_sent == 0 and offline.dropped == 1
+    
+    passed = coalesced and honoured and stub_honoured and not_counted
+    if passed:
+        print("✓ Volume burst coalesced and Retry-After honoured")
+    else:
+        print("✗ Unexpected volume requests")
+    
+    assert passed
+    return passed
+
+def test_process_presence_cache():
+    """Check that an exited process is not mistaken for the cached one"""
+    import sys
+    import subprocess
+    import psutil
+    from modules.spotify_controller import ProcessPresenceCache
+    
+    print("\n" + "="*60)
+    print("🔎 Testing Process Presence Cache...")
+    print("="*60 + "\n")
+    
+    # A real child process: valid while it runs, rescanned once it has exited
+    child = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+    cache = ProcessPresenceCache(name="no-such-process-name")
+    cache.process, cache.scan_count = psutil.Process(child.pid), 1
+    running = [cache.get_process() for _ in range(5)]
+    running_scans = cache.scan_count
+    child.kill()
+    child.wait()
+    exited = cache.get_process()
+    exited_scans = cache.scan_count
+    
+    # The current process, looked up for real, stays valid without rescans
+    live = ProcessPresenceCache(name=psutil.Process().name())
+    first = live.get_process()
+    again = [live.get_process() for _ in range(5)]
+    
+    print(f"  Exited child -> {exited}, scans while running {running_scans}, after exit {exited_scans}")
+    passed = (
+        all(process is not None and process.pid == child.pid for process in running)
+        and running_scans == 1
+        and exited is None
+        and exited_scans == 2
+        and first is not None
+        and all(process is first for process in again)
+        and live.scan_count == 1
+    )
+    
+    if passed:
+        print("✓ Exited processes trigger a rescan; running processes are not rescanned")
+    else:
+        print("✗ Unexpected process cache behaviour")
+    
+    assert passed
+    return passed
+
+def test_threaded_capture():
+    """Check that a slow first frame is waited for and only a finished source ends the stream"""
+    import time
+    import modules.frame_capture as frame_capture
+    from modules.frame_capture import ThreadedCapture
+    
+    print("\n" + "="*60)
+    print("📼 Testing Threaded Capture...")
+    print("="*60 + "\n")
+    
+    class SlowStartSource:
+        """Fake camera: the first frame takes `delay` seconds, then `frames` frames, then the end"""
+        def __init__(self, delay=1.5, frames=5, fail=False):
+            self.delay = delay
+            self.frames = frames
+            self.fail = fail
+            self.reads = 0
+            self.released = False
+        def isOpened(self):
+            return True
+        def read(self):
+            if self.reads == 0:
+                time.sleep(self.delay)
+            if self.fail:
+                raise RuntimeError("camera unplugged")
+            self.reads += 1
+            if self.reads > self.frames:
+                return False, None
+            return True, np.full((48, 64, 3), self.reads, dtype=np.uint8)
+        def get(self, prop):
+            return 0.0
+        def set(self, prop, value):
+            return True
+        def release(self):
+            self.released = True
+    
+    open_capture = frame_capture.open_capture
+    try:
+        # A read timeout before the first frame is not the end of the stream
+        frame_capture.open_capture = lambda source: SlowStartSource()
+        capture = ThreadedCapture("slow")
+        first_ret, _ = capture.read(timeout=0.5)
+        waiting = not capture.finished
+        frames = []
+        while True:
+            ret, frame = capture.read(timeout=0.5)
+            if ret:
+                frames.append(int(frame[0, 0, 0]))
+            elif capture.finished:
+                break
+        capture.release()
+        
+        # A source that raises finishes the capture instead of hanging it
+        frame_capture.open_capture = lambda source: SlowStartSource(delay=0.0, fail=True)
+        failing = ThreadedCapture("fail").start()
+        failing_ret, _ = failing.read(timeout=1.0)
+        failing._thread.join(timeout=1.0)
+        failed = failing.finished
+        failing.release()
+        
+        # A producer still inside read() after the join timeout releases the source itself
+        blocked_source = SlowStartSource()
+        frame_capture.open_capture = lambda source: blocked_source
+        blocked = ThreadedCapture("blocked").start()
+        blocked.release()
+        released_early = blocked_source.released
+        blocked._thread.join(timeout=2.0)
+        released_late = blocked_source.released
+        
+        # The pipeline keeps reading through the slow start and processes every frame
+        source = SlowStartSource()
+        frame_capture.open_capture = lambda s: source
+        pipeline, detector, controller, templates = build_two_hand_pipeline()
+        pipeline.run(source="slow")
+    finally:
+        frame_capture.open_capture = open_capture
+    
+    print(f"First read before the first frame: {first_ret} (finished: {not waiting})")
+    print(f"Frames read: {frames}, failing source finished: {failed}")
+    print(f"Pipeline source reads: {source.reads}")
+    print(f"Blocked source released during its read: {released_early}, after it: {released_late}")
+    
+    passed = (
+        not first_ret
+        and waiting
+        and frames == [1, 2, 3, 4, 5]
+        and not failing_ret
+        and failed
+        and source.reads == 6
+        and not released_early
+        and released_late
+    )
+    
+    if passed:
+        print("✓ Slow sources are waited for; exhausted or failed sources end the stream")
+    else:
+        print("✗ Unexpected capture behavior")
+    
+    assert passed
+    return passed
+
+def test_frame_scheduler():
+    """Check that static frames back off to max_interval and motion restores full rate"""
+    from modules.frame_scheduler import AdaptiveFrameScheduler
+    
+    print("\n" + "="*60)
+    print("⏩ Testing Adaptive Frame Scheduler...")
+    print("="*60 + "\n")
+    
+    scheduler = AdaptiveFrameScheduler(max_interval=4, stable_frames=3, max_latency=10.0)
+    static = np.zeros((480, 640, 3), dtype=np.uint8)
+    moved = np.full((480, 640, 3), 255, dtype=np.uint8)
+    
+    # Static scene with a stable gesture: 60 frames at 30 FPS
+    processed = []
+    for i in range(60):
+        if scheduler.should_process(static, now=i / 30):
+            processed.append(i)
+            scheduler.update(0)
+    idle_interval = scheduler.interval
+    
+    # Motion brings the next frame back to full rate
+    ran_on_motion = scheduler.should_process(moved, now=2.0)
+    
+    # max_latency bounds the gap (to within one frame) even with no motion at all
+    latency_scheduler = AdaptiveFrameScheduler(max_interval=100, stable_frames=1, max_latency=0.1)
+    gaps = []
+    last = None
+    for i in range(300):
+        now = i / 100
+        if latency_scheduler.should_process(static, now=now):
+            if last is not None:
+                gaps.append(now - last)
+            last = now
+            latency_scheduler.update(0)
+    
+    print(f"Processed {len(processed)}/60 static frames (interval {idle_interval})")
+    print(f"Motion frame processed: {ran_on_motion} (interval {scheduler.interval})")
+    print(f"Largest gap with max_latency=0.1: {max(gaps):.2f}s")
+    
+    passed = (
+        idle_interval == 4
+        and len(processed) < 25
+        and ran_on_motion
+        and scheduler.interval == 1
+        and max(gaps) <= 0.1 + 0.01 + 1e-9
+        and scheduler.max_gap(30) == 4 / 30
+        and latency_scheduler.max_gap(100) == 0.1 + 0.01
+    )
+    
+    if passed:
+        print("✓ Inference rate adapts to motion and stays within max_latency")
+    else:
+        print("✗ Unexpected scheduling")
+    
+    assert passed
+    return passed
+
+def test_idle_power_saver():
+    """Check sleep after the idle timeout, throttled presence checks and instant wake"""
+    from modules.frame_scheduler import IdlePowerSaver
+    
+    print("\n" + "="*60)
+    print("💤 Testing Idle Power Saver...")
+    print("="*60 + "\n")
+    
+    class FakeCapture:
+        def __init__(self):
+            self.props = {cv2.CAP_PROP_FRAME_WIDTH: 640, cv2.CAP_PROP_FRAME_HEIGHT: 480, cv2.CAP_PROP_FPS: 30}
+        
+        def get(self, prop):
+            return self.props[prop]
+        
+        def set(self, prop, value):
+            self.props[prop] = value
+            return True
+    
+    capture = FakeCapture()
+    saver = IdlePowerSaver(capture=capture, idle_timeout=1.0, check_interval=0.5)
+    empty = np.zeros((480, 640, 3), dtype=np.uint8)
+    hand = np.full((480, 640, 3), 200, dtype=np.uint8)
+    
+    checked_sizes = []
+    def has_hand(small):
+        checked_sizes.append(small.shape[:2])
+        return small.mean() > 100
+    
+    # 2 seconds of empty frames at 30 FPS
+    slept_at = None
+    skipped = 0
+    for i in range(60):
+        now = i / 30
+        if saver.skip_frame(empty, has_hand, now=now):
+            skipped += 1
+            continue
+        if saver.update(False, now=now):
+            slept_at = now
+    low_res = (capture.props[cv2.CAP_PROP_FRAME_WIDTH], capture.props[cv2.CAP_PROP_FRAME_HEIGHT])
+    checks_while_asleep = len(checked_sizes)
+    
+    # A hand appearing is processed on the very same frame
+    woke = not saver.skip_frame(hand, has_hand, now=2.0)
+    restored = (capture.props[cv2.CAP_PROP_FRAME_WIDTH], capture.props[cv2.CAP_PROP_FRAME_HEIGHT])
+    
+    print(f"Slept at {slept_at:.2f}s, skipped {skipped} frames with {checks_while_asleep} presence checks")
+    print(f"Resolution asleep {low_res}, after wake {restored}, check size {checked_sizes[-1]}")
+    
+    passed = (
+        slept_at is not None and abs(slept_at - 1.0) < 0.05
+        and skipped > 25
+        and checks_while_asleep <= 3
+        and low_res == (320, 240)
+        and woke
+        and restored == (640, 480)
+        and checked_sizes[-1] == (120, 160)
+    )
+    
+    if passed:
+        print("✓ Power saver sleeps, throttles checks and wakes on a hand")
+    else:
+        print("✗ Unexpected power saving behaviour")
+    
+    assert passed
+    return passed
+
+def test_landmark_replay():
+    """Replay a synthetic landmark session twice and check the results are identical"""
+    import os
+    import tempfile
+    from modules.gesture_classifier import GestureClassifier
+    from modules.replay import LandmarkRecorder
+    from replay_session import replay_session
+    
+    print("\n" + "="*60)
+    print("🔁 Testing Landmark Replay...")
+    print("="*60 + "\n")
+    
+    rng = np.random.default_rng(0)
+    extractor = FeatureExtractor()
+    
+    # One landmark template per gesture, with jitter for training samples
+    templates = rng.uniform(0.2, 0.8, (5, 21, 3)).astype(np.float32)
+    samples = templates[:, None] + rng.normal(0, 0.01, (5, 40, 21, 3)).astype(np.float32)
+    X = extractor.extract_features_batch(samples.reshape(-1, 21, 3))
+    y = np.repeat(np.arange(5), 40)
+    
+    tmp_dir = tempfile.mkdtemp()
+    model_path = os.path.join(tmp_dir, "gesture_model_random_forest")
+    classifier = GestureClassifier(model_type='random_forest')
+    classifier.train(X, y)
+    classifier.save_model(model_path, export_compact=True)
+    
+    # 1 s per gesture at 30 FPS, with half a second of no hand in between
+    recorder = LandmarkRecorder()
+    t = 0.0
+    for gesture_id in [3, 4, 0]:
+        for _ in range(30):
+            recorder.add(t, templates[gesture_id][None])
+            t += 1 / 30
+        for _ in range(15):
+            recorder.add(t, [])
+            t += 1 / 30
+    session_path = os.path.join(tmp_dir, "session.npz")
+    recorder.save(session_path)
+    
+    first = replay_session(session_path, model_path=model_path)
+    second = replay_session(session_path, model_path=model_path)
+    
+    # Landmark replay must not need MediaPipe (camera-free CI)
+    import sys
+    import subprocess
+    script = (
+        "import sys; sys.modules['mediapipe'] = None; "
+        "from replay_session import replay_session; "
+        f"print(len(replay_session({session_path!r}, model_path={model_path!r})['actions']))"
+    )
+    without_mediapipe = subprocess.run(
+        [sys.executable, "-c", script], cwd=os.path.dirname(os.path.abspath(__file__)),
+        capture_output=True, text=True
+    )
+    print(f"Without MediaPipe: {without_mediapipe.stdout.strip().splitlines()[-1:] or without_mediapipe.stderr[-200:]}")
+    
+    # Frames the scheduler skips live are flagged, so --record leaves them out
+    from replay_session import build_replay_pipeline
+    pipeline = build_replay_pipeline(model_path, landmarks=True)
+    pipeline.hand_detector.set_landmarks(templates[0][None])
+    blank = np.zeros((48, 64, 3), dtype=np.uint8)
+    inferred = []
+    for i in range(60):
+        pipeline.process_frame(blank, timestamp=i / 30)
+        inferred.append(pipeline.last_frame_inferred)
+    pipeline.action_dispatcher.stop()
+    
+    actions = [(a['frame'], a['action']) for a in first['actions']]
+    print(f"Replayed {first['frames']} frames at {first['fps']:.0f} FPS")
+    print(f"Actions: {actions}")
+    
+    passed = (
+        first['frames'] == len(recorder)
+        and first['scheduler']['frames_processed'] == first['frames']
+        and first['gestures'] == second['gestures']
+        and actions == [(a['frame'], a['action']) for a in second['actions']]
+        and [action for _, action in actions] == ["next_track", "previous_track", "volume_up"]
+        and without_mediapipe.returncode == 0
+        and without_mediapipe.stdout.strip().splitlines()[-1] == "3"
+        and sum(inferred) == pipeline.frame_scheduler.get_stats()['frames_processed'] < 60
+        and pipeline.inference_timer.stalls == 0
+        and pipeline.inference_timer.dropped == 0
+    )
+    
+    if passed:
+        print("✓ Replay is deterministic and records actions per frame")
+    else:
+        print("✗ Unexpected replay results")
+    
+    assert passed
+    return passed
+
+def test_pipeline_benchmark():
+    """Run the stage benchmark headless on a few synthetic frames"""
+    import json
+    import os
+    import tempfile
+    from benchmark_pipeline import run_benchmark, print_results
+    from modules.replay import LandmarkRecorder
+    
+    print("\n" + "="*60)
+    print("⏱️  Testing Pipeline Benchmark...")
+    print("="*60 + "\n")
+    
+    # A short recorded session, so the landmark stages run on replayed hands
+    recorder = LandmarkRecorder()
+    hands = np.random.default_rng(0).uniform(0.3, 0.7, (20, 21, 3)).astype(np.float32)
+    for i, hand in enumerate(hands):
+        recorder.add(i / 30, hand[None])
+    session_path = os.path.join(tempfile.mkdtemp(), "session.npz")
+    recorder.save(session_path)
+    
+    results = run_benchmark(session=session_path, repeats=1, n_frames=3)
+    print_results(results, baseline=json.loads(json.dumps(results)))
+    stages = results['stages']
+    
+    expected = {
+        'color_conversion', 'mediapipe_inference', 'overlay_copy_blend', 'overlay_panel_sprite',
+        'feature_extraction', 'predict_random_forest', 'predict_random_forest_compact',
+        'smoothing', 'dispatch_call', 'dispatch_to_execute',
+    }
+    measured = all('skipped' in stats or stats['n'] > 0 for stats in stages.values())
+    passed = (
+        expected <= set(stages)
+        and measured
+        and stages['color_conversion']['n'] == 3
+        and stages['feature_extraction']['n'] == 20
+        and results['meta']['landmark_source'] == session_path
+    )
+    
+    if passed:
+        print(f"✓ Benchmark measured {len(stages)} stages")
+    else:
+        print(f"✗ Benchmark stages missing or empty: {sorted(expected - set(stages))}")
+    
+    assert passed
+    return passed
+
+def test_pipeline_metrics():
+    """Check rolling quantiles, the disabled fast path and the Prometheus endpoint"""
+    import urllib.request
+    from modules.metrics import PipelineMetrics, MetricsServer
+    
+    print("\n" + "="*60)
+    print("📈 Testing Pipeline Metrics...")
+    print("="*60 + "\n")
+    
+    metrics = PipelineMetrics(window=100)
+    
+    # Spans of 1..200 µs; only the last 100 (101..200 µs) are in the window
+    for duration_us in range(1, 201):
+        metrics.record('detection', metrics.now() - duration_us * 1000)
+    stats = metrics.snapshot()['detection']
+    print(f"detection: {stats}")
+    
+    disabled = PipelineMetrics(enabled=False)
+    disabled.record('detection', disabled.now())
+    
+    server = MetricsServer(metrics, port=0).start()
+    with urllib.request.urlopen(f"http://127.0.0.1:{server.port}/metrics", timeout=5) as response:
+        body = response.read().decode()
+    server.stop()
+    print(body.splitlines()[2])
+    
+    # A configured port and a --metrics-port start one server, on the CLI port
+    import socket
+    import main_pipeline
+    
+    def listening(port):
+        with socket.socket() as probe:
+            return probe.connect_ex(("127.0.0.1", port)) == 0
+    
+    with socket.socket() as free:
+        free.bind(("127.0.0.1", 0))
+        config_port = free.getsockname()[1]
+    configured = main_pipeline.METRICS_CONFIG['http_port']
+    main_pipeline.METRICS_CONFIG['http_port'] = config_port
+    try:
+        pipeline = build_two_hand_pipeline(metrics_port=0)[0]
+    finally:
+        main_pipeline.METRICS_CONFIG['http_port'] = configured
+    cli_port = pipeline.metrics_server.port
+    cli_listening = listening(cli_port)
+    config_listening = listening(config_port)
+    
+    # Gauges are copied on the pipeline thread (at most once per gauge_interval);
+    # the endpoint serves the copy taken on the first frame
+    for i in range(3):
+        pipeline.hand_detector.set_landmarks([])
+        pipeline.process_frame(np.zeros((48, 64, 3), dtype=np.uint8), timestamp=i / 30)
+    served = urllib.request.urlopen(f"http://127.0.0.1:{cli_port}/metrics", timeout=5).read().decode()
+    pipeline.start_metrics_server(0)  # Restarting replaces the running server
+    replaced = not listening(cli_port) and listening(pipeline.metrics_server.port)
+    pipeline.metrics_server.stop()
+    pipeline.action_dispatcher.stop()
+    print(f"CLI port serving: {cli_listening}, config port serving: {config_listening}, restart replaces: {replaced}")
+    
+    passed = (
+        stats['count'] == 200
+        and 0.150 <= stats['p50_ms'] <= 0.160
+        and 0.195 <= stats['p99_ms'] <= 0.210
+        and disabled.snapshot()['detection']['count'] == 0
+        and '# TYPE gesture_pipeline_stage_latency_seconds summary' in body
+        and 'gesture_pipeline_stage_latency_seconds_count{stage="detection"} 200' in body
+        and cli_listening
+        and not config_listening
+        and "gesture_pipeline_frame_frames 1\n" in served
+        and replaced
+    )
+    
+    if passed:
+        print("✓ Metrics aggregate spans and serve Prometheus text")
+    else:
+        print("✗ Unexpected metrics")
+    
+    assert passed
+    return passed
+
+def test_reaction_tracer():
+    """Check the per-phase breakdown of a traced action through the dispatcher"""
+    import os
+    import json
+    import tempfile
+    from modules.reaction_tracer import ReactionTracer
+    from modules.action_dispatcher import ActionDispatcher
+    
+    print("\n" + "="*60)
+    print("⏱️  Testing Reaction Tracer...")
+    print("="*60 + "\n")
+    
+    class CooldownBackend:
+        def __init__(self):
+            self.last_cooldown_remaining = 0.0
+            self.calls = 0
+        
+        def execute_action(self, action, steps=1):
+            self.calls += 1
+            # Second action arrives inside the cooldown
+            self.last_cooldown_remaining = 0.0 if self.calls == 1 else 0.2
+            return self.calls == 1
+    
+    backend = CooldownBackend()
+    trace_path = os.path.join(tempfile.mkdtemp(), "trace.jsonl")
+    tracer = ReactionTracer(trace_path, backend=backend)
+    dispatcher = ActionDispatcher(backend, on_complete=tracer.complete)
+    
+    # Hand appears at t=0 (low confidence), pose classified from t=0.1, vote flips at t=0.2
+    tracer.observe(0.0, True, None)
+    tracer.observe(0.1, True, 3)
+    tracer.observe(0.15, True, 3)
+    tracer.observe(0.2, True, 3)
+    trace = tracer.begin("next_track", 3, capture_time=0.2, process_start=0.21, dispatch_time=0.23)
+    dispatcher.dispatch("next_track", trace=trace)
+    dispatcher.wait_idle()
+    dispatcher.dispatch("play_pause", trace=tracer.begin("play_pause", 0, 0.3, 0.3, 0.3))
+    dispatcher.wait_idle()
+    dispatcher.stop()
+    tracer.close()
+    
+    first = tracer.traces[0]
+    summary = tracer.summary()
+    with open(trace_path) as f:
+        logged = [json.loads(line) for line in f]
+    summary_exists = os.path.exists(os.path.splitext(trace_path)[0] + ".summary.json")
+    print(f"First trace: {first}")
+    print(f"Summary: {summary['actions']} actions, {summary['suppressed']} suppressed")
+    
+    # Failed, dropped and coalesced actions each get their own status
+    import time
+    import threading
+    
+    class BlockingBackend:
+        def __init__(self):
+            self.release = threading.Event()
+        
+        def execute_action(self, action, steps=1):
+            if action == "play_pause":
+                self.release.wait(1.0)
+            if action == "next_track":
+                raise RuntimeError("backend offline")
+            return True
+    
+    backend = BlockingBackend()
+    outcomes = ReactionTracer()
+    dispatcher = ActionDispatcher(backend, max_queue=2, on_complete=outcomes.complete, on_discard=outcomes.discard)
+    dispatcher.dispatch("play_pause", trace=outcomes.begin("play_pause", 0, 0.0, 0.0, 0.0))
+    while dispatcher.queue_depth():  # Worker holds play_pause
+        time.sleep(0.001)
+    for action in ("volume_up", "volume_up", "previous_track", "next_track"):
+        dispatcher.dispatch(action, trace=outcomes.begin(action, 0, 0.0, 0.0, 0.0))
+    backend.release.set()
+    dispatcher.wait_idle()
+    dispatcher.stop()
+    statuses = sorted((t['action'], t['status']) for t in outcomes.traces)
+    outcome_summary = outcomes.summary()
+    print(f"Statuses: {statuses}")
+    
+    passed = (
+        first['executed']
+        and first['smoothing_frames'] == 3
+        and abs(first['pose_recognition'] - 100.0) < 1e-6
+        and abs(first['smoothing_wait'] - 100.0) < 1e-6
+        and abs(first['capture_lag'] - 10.0) < 1e-6
+        and abs(first['inference'] - 20.0) < 1e-6
+        and not tracer.traces[1]['executed']
+        and tracer.traces[1]['cooldown_remaining'] == 200.0
+        and summary['executed'] == 1 and summary['suppressed'] == 1
+        and len(logged) == 2
+        and summary_exists
+        and statuses == [
+            ("next_track", "failed"), ("play_pause", "executed"), ("previous_track", "executed"),
+            ("volume_up", "coalesced"), ("volume_up", "dropped"),
+        ]
+        and outcome_summary['executed'] == 2 and outcome_summary['failed'] == 1
+        and outcome_summary['dropped'] == 1 and outcome_summary['coalesced'] == 1
+        and 'backend offline' in [t for t in outcomes.traces if t['status'] == 'failed'][0]['error']
+    )
+    
+    if passed:
+        print("✓ Reaction latency broken down per phase")
+    else:
+        print("✗ Unexpected trace")
+    
+    assert passed
+    return passed
+
+def test_frame_timer():
+    """Check rolling FPS, drop and stall detection, and gauge export"""
+    from modules.frame_timing import FrameTimer
+    from modules.metrics import PipelineMetrics
+    
+    print("\n" + "="*60)
+    print("⏱️  Testing Frame Timer...")
+    print("="*60 + "\n")
+    
+    stalls = []
+    timer = FrameTimer(window=30, expected_fps=30, stall_threshold=0.1,
+                       on_stall=lambda frame_time, frame: stalls.append((frame_time, frame)))
+    
+    # 60 frames at 30 FPS, a 4-frame gap (3 dropped, 133 ms stall), then 30 FPS again
+    now = 0.0
+    for _ in range(60):
+        timer.tick(now)
+        now += 1 / 30
+    now += 3 / 30
+    timer.tick(now)
+    for _ in range(40):
+        now += 1 / 30
+        timer.tick(now)
+    
+    metrics = PipelineMetrics()
+    metrics.add_gauges('frame', timer.get_stats)
+    unrefreshed = metrics.to_prometheus()
+    metrics.refresh_gauges()
+    text = metrics.to_prometheus()
+    stats = timer.get_stats()
+    print(f"Stats: {stats}")
+    
+    # A reset (power saving) clears the window but keeps the lifetime counters,
+    # and the 5 s pause before the next tick is neither a stall nor drops
+    timer.reset()
+    after_reset = timer.get_stats()
+    now += 5.0
+    timer.tick(now)
+    now += 1 / 30
+    timer.tick(now)
+    resumed = timer.get_stats()
+    print(f"After reset: {after_reset}")
+    
+    passed = (
+        stats['frames'] == 101
+        and abs(stats['fps_window'] - 30.0) < 0.01
+        and abs(stats['fps_ema'] - 30.0) < 1.0
+        and stats['dropped'] == 3
+        and stats['stalls'] == 1 and len(stalls) == 1 and stalls[0][1] == 61
+        and abs(stats['max_frame_time_ms'] - 133.3) < 0.1
+        and "gesture_pipeline_frame_fps_window 30." in text
+        and "gesture_pipeline_frame_stalls 1" in text
+        and "gesture_pipeline_frame_stalls" not in unrefreshed
+        and after_reset['fps_window'] == 0.0 and after_reset['frame_time_p95_ms'] == 0.0
+        and (after_reset['frames'], after_reset['dropped'], after_reset['stalls']) == (101, 3, 1)
+        and (resumed['frames'], resumed['dropped'], resumed['stalls']) == (103, 3, 1)
+    )
+    
+    if passed:
+        print("✓ Rolling FPS, drops and stalls detected and exported")
+    else:
+        print("✗ Unexpected frame timing")
+    
+    assert passed
+    return passed
+
+def test_overlay_renderer():
+    """Check the panel sprite matches copy-and-blend drawing and is cached"""
+    import cv2
+    import numpy as np
+    from modules.overlay import OverlayRenderer
+    
+    print("\n" + "="*60)
+    print("🖼️  Testing Overlay Renderer...")
+    print("="*60 + "\n")
+    
+    frame = np.random.default_rng(0).integers(0, 256, (480, 640, 3), dtype=np.uint8)
+    lines = [
+        ("Gesture: thumbs_up", (10, 35), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2),
+        ("Next track", (10, 115), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (255, 165, 0), 2),
+    ]
+    
+    # Reference: full-frame copy, blend, then text
+    expected = frame.copy()
+    overlay = expected.copy()
+    cv2.rectangle(overlay, (0, 0), (400, 150), (0, 0, 0), -1)
+    cv2.addWeighted(overlay, 0.3, expected, 0.7, 0, expected)
+    for line in lines:
+        cv2.putText(expected, *line)
+    
+    renderer = OverlayRenderer()
+    drawn = frame.copy()
+    renderer.panel(drawn, 'info', (0, 0), (400, 150), 0.3, lines=lines)
+    max_diff = int(np.abs(drawn.astype(np.int16) - expected).max())
+    
+    # Same content reuses the sprite; changed text re-renders it
+    renderer.panel(frame.copy(), 'info', (0, 0), (400, 150), 0.3, lines=lines)
+    cached = renderer.sprites_rendered
+    renderer.panel(frame.copy(), 'info', (0, 0), (400, 150), 0.3, lines=lines[:1])
+    
+    # Panels partly outside the frame are clipped
+    clipped = frame.copy()
+    renderer.panel(clipped, 'edge', (600, 450), (700, 520), 0.5)
+    
+    print(f"Max pixel difference: {max_diff}, sprites rendered: {renderer.sprites_rendered}")
+    passed = (
+        max_diff <= 1
+        and cached == 1
+        and renderer.sprites_rendered == 3
+        and (clipped[:450] == frame[:450]).all()
+        and (clipped[450:, 600:] != frame[450:, 600:]).any()
+    )
+    
+    if passed:
+        print("✓ Panel sprite matches copy-and-blend drawing")
+    else:
+        print("✗ Unexpected overlay")
+    
+    assert passed
+    return passed
+
+def build_two_hand_pipeline(**pipeline_kwargs):
+    """
+    Headless multi-hand pipeline fed from a LandmarkStreamDetector
+    
+    Args:
+        pipeline_kwargs: Extra GestureControlPipeline arguments
+    
+    Returns:
+        pipeline, detector, RecordingController, and one landmark template
+        per gesture class (odd classes in the right half of the frame)
+    """
+    import os
+    import tempfile
+    from modules.gesture_classifier import GestureClassifier
+    from modules.replay import RecordingController, LandmarkStreamDetector
+    from main_pipeline import GestureControlPipeline
+    
+    rng = np.random.default_rng(0)
+    extractor = FeatureExtractor()
+    templates = rng.uniform(0.0, 0.3, (5, 21, 3)).astype(np.float32)
+    templates[1::2, :, 0] += 0.6
+    samples = templates[:, None] + rng.normal(0, 0.01, (5, 40, 21, 3)).astype(np.float32)
+    classifier = GestureClassifier(model_type='random_forest')
+    classifier.train(extractor.extract_features_batch(samples.reshape(-1, 21, 3)), np.repeat(np.arange(5), 40))
+    model_path = os.path.join(tempfile.mkdtemp(), "gesture_model_random_forest")
+    classifier.save_model(model_path, export_compact=True)
+    
+    controller = RecordingController()
+    detector = LandmarkStreamDetector(max_hands=2)
+    pipeline = GestureControlPipeline(
+        model_path=model_path, headless=True, media_controller=controller,
+        hand_detector=detector, multi_hand=True, **pipeline_kwargs
+    )
+    return pipeline, detector, controller, templates
+
+def test_multi_hand_tracking():
+    """Check stable track IDs and one batched prediction per frame for two hands"""
+    from modules.hand_detection import HandTracker
+    
+    print("\n" + "="*60)
+    print("🙌 Testing Multi-Hand Tracking...")
+    print("="*60 + "\n")
+    
+    # Tracker: IDs follow position, not detection order; handedness must agree
+    tracker = HandTracker(max_missed=1)
+    left = np.full((21, 3), 0.3, dtype=np.float32)
+    right = np.full((21, 3), 0.7, dtype=np.float32)
+    first = tracker.update([left, right], ["Left", "Right"])
+    swapped = tracker.update([right + 0.02, left - 0.02], ["Right", "Left"])
+    mislabeled = tracker.update([left], ["Right"])
+    tracker.update([left], ["Right"])
+    tracker_ok = (
+        swapped == first[::-1]
+        and mislabeled[0] not in first
+        and sorted(tracker.ended) == sorted(first)
+    )
+    
+    # Pipeline: two gestures in different halves of the frame
+    pipeline, detector, controller, templates = build_two_hand_pipeline()
+    batch_calls = []
+    predict_batch = pipeline.gesture_classifier.predict_batch
+    pipeline.gesture_classifier.predict_batch = lambda X: batch_calls.append(len(X)) or predict_batch(X)
+    
+    frame = np.zeros((480, 640, 3), dtype=np.uint8)
+    track_history = []
+    for i in range(10):
+        hands = templates[[3, 4]] if i < 5 else templates[[4, 3]]
+        detector.set_landmarks(hands)
+        pipeline.process_frame(frame, timestamp=i / 30)
+        track_history.append({hand['track_id']: hand['gesture'] for hand in pipeline.hand_results})
+    pipeline.action_dispatcher.wait_idle()
+    pipeline.action_dispatcher.stop()
+    
+    print(f"Tracks per frame: {track_history[-1]}, predict_batch sizes: {set(batch_calls)}")
+    print(f"Actions: {[a['action'] for a in controller.actions]}")
+    
+    passed = (
+        tracker_ok
+        and all(history == {0: 3, 1: 4} for history in track_history)
+        and batch_calls == [2] * 10
+        and [a['action'] for a in controller.actions] == ["next_track"]
+    )
+    
+    if passed:
+        print("✓ Hands keep their track IDs and are classified in one batch")
+    else:
+        print("✗ Unexpected multi-hand results")
+    
+    assert passed
+    return passed
+
+def test_chord_gestures():
+    """Check two-hand chords map to extended actions without stray single-hand actions"""
+    from modules.action_mapper import ActionMapper
+    
+    print("\n" + "="*60)
+    print("🎹 Testing Chord Gestures...")
+    print("="*60 + "\n")
+    
+    pipeline, detector, controller, templates = build_two_hand_pipeline()
+    pipeline.action_mapper = ActionMapper(custom_chords={**ActionMapper.DEFAULT_CHORDS, **ActionMapper.SPOTIFY_CHORDS})
+    frame = np.zeros((480, 640, 3), dtype=np.uint8)
+    
+    # Left FIST + right POINT (listed right hand first), then the right hand alone
+    # still pointing (no action), then showing V_SIGN
+    for i in range(18):
+        if i < 6:
+            detector.set_landmarks(templates[[3, 1]])
+            detector.handedness = ["Right", "Left"]
+        elif i < 12:
+            detector.set_landmarks(templates[[3]])
+            detector.handedness = ["Right", None]
+        else:
+            detector.set_landmarks(templates[[4]] + (0.6, 0.0, 0.0))
+            detector.handedness = ["Right", None]
+        pipeline.process_frame(frame, timestamp=i / 30)
+    pipeline.action_dispatcher.wait_idle()
+    pipeline.action_dispatcher.stop()
+    handover = [a['action'] for a in controller.actions]
+    print(f"Chord, release, new pose: {handover}")
+    
+    # FIST + FIST where the right hand becomes confident two frames late:
+    # only the chord fires, not the left FIST's volume_down first
+    pipeline, detector, controller, templates = build_two_hand_pipeline()
+    unsure = (templates[0] + templates[1]) / 2
+    for i in range(10):
+        right = unsure if i < 2 else templates[1] + (0.05, 0.0, 0.0)
+        detector.set_landmarks(np.stack([templates[1], right]))
+        detector.handedness = ["Left", "Right"]
+        pipeline.process_frame(frame, timestamp=i / 30)
+    pipeline.action_dispatcher.wait_idle()
+    pipeline.action_dispatcher.stop()
+    onset = [a['action'] for a in controller.actions]
+    print(f"Staggered FIST + FIST: {onset}")
+    
+    mapper = ActionMapper()
+    passed = (
+        handover == ["like_track", "previous_track"]
+        and onset == ["mute"]
+        and mapper.get_chord_action((3, 1)) is None
+        and mapper.get_chord_action((1, 3)) is None  # SpotifyController-only actions are opt-in
+        and mapper.get_chord_action((0, 0)) == "unmute"
+        and mapper.get_motion_action("circle_cw") is None
+    )
+    
+    if passed:
+        print("✓ Chords dispatch once, without single-hand actions before or after")
+    else:
+        print("✗ Unexpected chord actions")
+    
+    assert passed
+    return passed
+
+def test_motion_gestures():
+    """Check swipes, circles and push/pull on recorded landmark sequences"""
+    import os
+    import math
+    import tempfile
+    from modules.motion_gestures import MotionGestureRecognizer, recognize_sequence
+    from modules.replay import LandmarkRecorder, load_landmark_session
+    
+    print("\n" + "="*60)
+    print("👋 Testing Motion Gestures...")
+    print("="*60 + "\n")
+    
+    rng = np.random.default_rng(0)
+    hand = rng.uniform(-0.05, 0.05, (21, 3))
+    hand[0] = (0.0, 0.08, 0.0)   # Wrist below the middle-finger base
+    hand[9] = (0.0, -0.04, 0.0)
+    
+    def pose(x, y, scale=1.0):
+        landmarks = hand * scale + (x, y, 0.0)
+        return landmarks + rng.normal(0, 0.002, (21, 3))
+    
+    # Record one session: hold, swipe right, no hand, circle, no hand, push, hold
+    # (gaps are longer than the recognizer's cooldown)
+    recorder = LandmarkRecorder()
+    frames = [pose(0.3, 0.5) for _ in range(20)]
+    frames += [pose(0.3 + 0.05 * i, 0.5) for i in range(10)]
+    frames += [None] * 20
+    frames += [pose(0.5 + 0.12 * math.cos(2 * math.pi * i / 30), 0.5 + 0.12 * math.sin(2 * math.pi * i / 30))
+               for i in range(31)]
+    frames += [None] * 20
+    frames += [pose(0.5, 0.5, 1 + 0.06 * i) for i in range(12)]
+    frames += [pose(0.5, 0.5, 1.66) for _ in range(30)]
+    for i, landmarks in enumerate(frames):
+        recorder.add(i / 30, [] if landmarks is None else landmarks[None])
+    session_path = os.path.join(tempfile.mkdtemp(), "motions.npz")
+    recorder.save(session_path)
+    
+    timestamps, landmarks, num_hands = load_landmark_session(session_path)
+    motions = [motion for _, motion in recognize_sequence(landmarks, timestamps, num_hands)]
+    print(f"Motions: {motions}")
+    
+    # Reverse directions
+    left = recognize_sequence([pose(0.7 - 0.05 * i, 0.5) for i in range(10)], np.arange(10) / 30)
+    ccw = recognize_sequence(
+        [pose(0.5 + 0.12 * math.cos(-2 * math.pi * i / 30), 0.5 + 0.12 * math.sin(-2 * math.pi * i / 30))
+         for i in range(31)], np.arange(31) / 30)
+    pull = recognize_sequence([pose(0.5, 0.5, 1.66 - 0.06 * i) for i in range(12)], np.arange(12) / 30)
+    
+    # Slow drift is not a swipe; a disabled recognizer does nothing
+    drift = recognize_sequence([pose(0.3 + 0.004 * i, 0.5) for i in range(90)], np.arange(90) / 30)
+    disabled = MotionGestureRecognizer(enabled=False)
+    
+    # In the pipeline: a long swipe dispatches its action once, static poses are below threshold
+    pipeline, detector, controller, templates = build_two_hand_pipeline()
+    pipeline.motion_recognizer.enabled = True
+    pipeline.confidence_threshold = 1.01
+    frame = np.zeros((48, 64, 3), dtype=np.uint8)
+    for i in range(16):
+        detector.set_landmarks(templates[[0]] - (0.05 * i, 0.0, 0.0))
+        detector.handedness = ["Right"]
+        pipeline.process_frame(frame, timestamp=i / 30)
+    pipeline.action_dispatcher.wait_idle()
+    pipeline.action_dispatcher.stop()
+    pipeline_actions = [a['action'] for a in controller.actions]
+    print(f"Pipeline actions: {pipeline_actions}, last motion {pipeline.last_motion}")
+    
+    passed = (
+        pipeline_actions == [pipeline.action_mapper.get_motion_action("swipe_left")]
+        and pipeline.last_motion == "swipe_left"
+        and pipeline.motion_recognizer.motions_detected == 1
+        and pipeline.last_gesture is None  # One-shot motions leave the held pose alone
+        and motions == ["swipe_right", "circle_cw", "push"]
+        and [m for _, m in left] == ["swipe_left"]
+        and [m for _, m in ccw] == ["circle_ccw"]
+        and [m for _, m in pull] == ["pull"]
+        and drift == []
+        and recognize_sequence(frames[20:30], np.arange(10) / 30, recognizer=disabled) == []
+    )
+    
+    if passed:
+        print("✓ Motions recognized once each, no false swipes")
+    else:
+        print("✗ Unexpected motions")
+    
+    assert passed
+    return passed
+
+def test_volume_knob():
+    """Check the volume knob: relative to engagement, filtered, dead-banded, replaces the pose action"""
+    import time
+    from modules.volume_knob import OneEuroFilter, VolumeKnob
+    from modules.action_dispatcher import ActionDispatcher
+    from modules.replay import RecordingController
+    
+    print("\n" + "="*60)
+    print("🎚️ Testing Volume Knob...")
+    print("="*60 + "\n")
+    
+    rng = np.random.default_rng(0)
+    
+    # One-Euro: jitter on a held value is smoothed, a step is followed
+    one_euro = OneEuroFilter(min_cutoff=1.0, beta=1.0)
+    held = [one_euro(0.5 + rng.normal(0, 0.01), i / 30) for i in range(60)]
+    stepped = [one_euro(0.9, (60 + i) / 30) for i in range(30)]
+    
+    # A pinching right hand (thumb tip on the index tip), palm length 0.12
+    pinch_hand = np.array([
+        (0.00, 0.00, 0.0), (0.03, -0.02, 0.0), (0.05, -0.05, 0.0), (0.06, -0.08, 0.0), (0.05, -0.11, 0.0),
+        (0.03, -0.11, 0.0), (0.04, -0.15, 0.0), (0.05, -0.14, 0.0), (0.05, -0.12, 0.0),
+        (0.00, -0.12, 0.0), (0.00, -0.17, 0.0), (0.00, -0.20, 0.0), (0.00, -0.22, 0.0),
+        (-0.03, -0.11, 0.0), (-0.03, -0.15, 0.0), (-0.03, -0.18, 0.0), (-0.03, -0.20, 0.0),
+        (-0.05, -0.09, 0.0), (-0.05, -0.12, 0.0), (-0.05, -0.14, 0.0), (-0.05, -0.16, 0.0),
+    ])
+    
+    def pinch(y, x=0.5):
+        return pinch_hand + (x, y, 0.0) + rng.normal(0, 0.001, (21, 3))
+    
+    pinch_ratio = FeatureExtractor.pinch_ratio(pinch_hand)
+    
+    # Engaging at 50%: nothing is written while the pinch is held still
+    knob = VolumeKnob(gesture=2, travel=0.4)
+    held_levels = [knob.update(pinch(0.6), 2, i / 30, volume=0.5) for i in range(30)]
+    
+    # Raise the hand by 0.1 (a quarter of the travel) over half a second and hold
+    ys = list(np.linspace(0.6, 0.5, 15)) + [0.5] * 30
+    levels = [knob.update(pinch(y), 2, (30 + i) / 30, volume=0.9) for i, y in enumerate(ys)]
+    writes = [level for level in levels if level is not None]
+    settled_writes = [level for level in levels[30:] if level is not None]
+    raised_level = knob.written_level
+    
+    # Lower it well past the bottom: the volume clamps at 0%, then turns up again at once
+    ys = list(np.linspace(0.5, 0.9, 20)) + list(np.linspace(0.9, 0.86, 5)) + [0.86] * 20
+    lowered = [knob.update(pinch(y), 2, (75 + i) / 30) for i, y in enumerate(ys)]
+    lowered_writes = [level for level in lowered if level is not None]
+    print(f"Knob: pinch ratio {pinch_ratio:.2f}, raised to {raised_level:.2f} in {len(writes)} writes, "
+          f"lowered writes {[round(level, 2) for level in lowered_writes]}")
+    
+    # Another pose releases the knob after release_frames
+    for i in range(knob.release_frames):
+        knob.update(pinch(0.86), 0, (120 + i) / 30)
+    
+    # Pinch control: relative to the thumb-index distance at engagement
+    spread = VolumeKnob(gesture=3, control='pinch', ratio_span=0.8)
+    
+    def spread_hand(ratio):
+        landmarks = pinch_hand + (0.5, 0.5, 0.0) + rng.normal(0, 0.0005, (21, 3))
+        landmarks[4] = landmarks[8] + (ratio * 0.12, 0.0, 0.0)
+        return landmarks
+    
+    ratios = [0.6] * 10 + list(np.linspace(0.6, 1.0, 10)) + [1.0] * 30
+    spread_levels = [spread.update(spread_hand(r), 3, i / 30, volume=0.3) for i, r in enumerate(ratios)]
+    spread_writes = [level for level in spread_levels if level is not None]
+    
+    # Dispatcher: while the backend is busy, a pending level is replaced by the newer one
+    class SlowController(RecordingController):
+        release = False
+        
+        def execute_action(self, action, steps=1):
+            while not self.release:
+                time.sleep(0.001)
+            return super().execute_action(action, steps)
+    
+    controller = SlowController()
+    dispatcher = ActionDispatcher(controller).start()
+    dispatcher.dispatch("play_pause")
+    time.sleep(0.05)
+    for level in (0.3, 0.35, 0.4):
+        dispatcher.set_volume(level)
+    queued = dispatcher.queue_depth()
+    controller.release = True
+    dispatcher.wait_idle()
+    dispatcher.stop()
+    
+    # In the pipeline: making the pose keeps the volume, raising the hand turns it up
+    pipeline, detector, pipeline_controller, templates = build_two_hand_pipeline()
+    pipeline.volume_knob.enabled = True
+    pipeline.volume_knob.gesture = 2
+    frame = np.zeros((48, 64, 3), dtype=np.uint8)
+    for i, dy in enumerate([0.0] * 10 + list(np.linspace(0.0, -0.1, 10)) + [-0.1] * 10):
+        detector.set_landmarks(templates[[2]] + (0.0, dy, 0.0) + rng.normal(0, 0.001, (21, 3)))
+        detector.handedness = ["Right"]
+        pipeline.process_frame(frame, timestamp=i / 30)
+    pipeline.action_dispatcher.wait_idle()
+    knob_engaged = pipeline.volume_knob.active
+    pipeline_levels = [a.get('level') for a in pipeline_controller.actions]
+    print(f"Pipeline actions: {[a['action'] for a in pipeline_controller.actions]}, final volume {pipeline_controller.volume:.2f}")
+    
+    # A pose held through the knob release fires once the knob lets go
+    knob_actions = len(pipeline_controller.actions)
+    knob_volume = pipeline_controller.volume
+    knob_written = pipeline.volume_knob.written_level
+    for i in range(2 * pipeline.volume_knob.release_frames):
+        detector.set_landmarks(templates[[3]] + rng.normal(0, 0.001, (21, 3)))
+        detector.handedness = ["Right"]
+        pipeline.process_frame(frame, timestamp=(30 + i) / 30)
+    pipeline.action_dispatcher.wait_idle()
+    released_actions = [a['action'] for a in pipeline_controller.actions[knob_actions:] if a['action'] != "set_volume"]
+    print(f"After knob release: {released_actions}")
+    pipeline.action_dispatcher.stop()
+    
+    passed = (
+        np.std(held[30:]) < 0.004
+        and abs(stepped[-1] - 0.9) < 0.01
+        and pinch_ratio < 0.2
+        and held_levels == [None] * 30
+        and 1 <= len(writes) <= 8
+        and all(level > 0.5 for level in writes)
+        and abs(raised_level - 0.75) <= 2 * knob.dead_band
+        and settled_writes == []
+        and 0.0 in lowered_writes
+        and lowered_writes[-1] > 0.0
+        and not knob.active
+        and spread_writes and min(spread_writes) > 0.3
+        and abs(spread_writes[-1] - 0.8) <= 2 * spread.dead_band
+        and queued == 1
+        and [a.get('level') for a in controller.actions] == [None, 0.4]
+        and knob_engaged
+        and knob_written == knob_volume
+        and {a['action'] for a in pipeline_controller.actions[:knob_actions]} == {"set_volume"}
+        and not pipeline.volume_knob.active
+        and released_actions == [pipeline.action_mapper.get_action(3)]
+        and min(pipeline_levels) > 0.5
+        and abs(knob_volume - 0.75) <= 2 * pipeline.volume_knob.dead_band
+    )
+    
+    if passed:
+        print("✓ Knob keeps the volume on engagement, follows the hand with few writes and replaces the pose action")
+    else:
+        print("✗ Volume knob misbehaved")
+    
+    assert passed
+    return passed
+
 def test_all_modules():
     """Run all tests"""
     print("\n\n")
@@ -207,7 +2018,30 @@ def test_all_modules():
     tests = [
         ("Camera", test_camera),
         ("Hand Detection", test_hand_detection),
+        ("Landmark Buffer Reuse", test_landmark_buffer_aliasing),
+        ("Hand ROI Tracker", test_roi_tracker),
         ("Feature Extraction", test_feature_extraction),
+        ("Batch Feature Extraction", test_feature_batch_parity),
+        ("Compact Model Parity", test_compact_model_parity),
+        ("Dataset Store", test_dataset_store),
+        ("Gesture Smoother", test_gesture_smoother),
+        ("Action Dispatcher", test_action_dispatcher),
+        ("Spotify API Client", test_spotify_api_cache),
+        ("Spotify Volume Coalescing", test_spotify_volume_coalescing),
+        ("Process Presence Cache", test_process_presence_cache),
+        ("Threaded Capture", test_threaded_capture),
+        ("Adaptive Frame Scheduler", test_frame_scheduler),
+        ("Idle Power Saver", test_idle_power_saver),
+        ("Landmark Replay", test_landmark_replay),
+        ("Pipeline Benchmark", test_pipeline_benchmark),
+        ("Pipeline Metrics", test_pipeline_metrics),
+        ("Reaction Tracer", test_reaction_tracer),
+        ("Frame Timer", test_frame_timer),
+        ("Overlay Renderer", test_overlay_renderer),
+        ("Multi-Hand Tracking", test_multi_hand_tracking),
+        ("Chord Gestures", test_chord_gestures),
+        ("Motion Gestures", test_motion_gestures),
+        ("Volume Knob", test_volume_knob),
     ]
     
     results = []
@@ -27,11 +27,7 @@ def train_gesture_model(model_type='random_forest', test_size=0.2, random_state=
     collector = DataCollector()
     
     # Check if data directory has any samples
-    data_samples = []
-    for root, dirs, files in os.walk(collector.data_dir):
-        data_samples.extend([f for f in files if f.startswith("features_")])
-    
-    if len(data_samples) == 0:
+    if collector.store.total_count() == 0 and not collector.store.has_legacy_files():
         print("⚠️  No training data found!")
         print("Please run collect_data.py first to collect hand gesture samples.")
         return
@@ -65,7 +61,7 @@ def train_gesture_model(model_type='random_forest', test_size=0.2, random_state=
     
     # Save model
     model_path = os.path.join(collector.data_dir, f"gesture_model_{model_type}")
-    classifier.save_model(model_path)
+    classifier.save_model(model_path, export_compact=(model_type != 'svm'))
     
     print(f"\n✓ Model saved successfully!")
     print(f"{'='*60}\n")